@@ -0,0 +1,59 @@
+"""Cold vs warm RADIUS dictionary load time.
+
+    cd cli && python benchmarks/dictcache_bench.py [path/to/dictionary] [-n 200]
+
+"parse" is pyrad's text parser on its own, "cold" is a cache miss (parse
+plus writing the compiled cache) and "warm" is a cache hit.
+"""
+
+import argparse
+import statistics
+import time
+from pathlib import Path
+
+from pyrad.dictionary import Dictionary
+
+from radcli.dictcache import clear_cache, load_dictionary
+
+
+def _time(fn, rounds: int) -> list[float]:
+    samples = []
+    for _ in range(rounds):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "dictionary",
+        nargs="?",
+        default=str(Path(__file__).resolve().parents[2] / "tests" / "dictionary"),
+    )
+    parser.add_argument("-n", "--rounds", type=int, default=200)
+    args = parser.parse_args()
+
+    def cold() -> None:
+        clear_cache(args.dictionary)
+        load_dictionary(args.dictionary)
+
+    results = {
+        "parse": _time(lambda: Dictionary(args.dictionary), args.rounds),
+        "cold": _time(cold, args.rounds),
+        "warm": _time(lambda: load_dictionary(args.dictionary), args.rounds),
+    }
+
+    print(f"{args.dictionary}  ({args.rounds} rounds)")
+    for name, samples in results.items():
+        print(
+            f"  {name:<6} median {statistics.median(samples) * 1000:7.3f} ms"
+            f"   min {min(samples) * 1000:7.3f} ms"
+        )
+    speedup = statistics.median(results["parse"]) / statistics.median(results["warm"])
+    print(f"  warm load is {speedup:.1f}x faster than parsing")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+"""Accounting session simulator — many concurrent sessions on a timer wheel.
+
+Each simulated session lives in one slot of an array-backed ``SessionTable``
+and has exactly one pending timer in a hierarchical ``TimerWheel``: the
+next Start, Interim-Update or Stop it is due to send. Memory is fixed by the
+number of slots, so 100k sessions cost a few megabytes no matter how long
+the run goes, and each simulated second only touches the sessions that are
+actually due.
+"""
+
+import asyncio
+import math
+import random
+import time
+from array import array
+from collections import Counter
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+import pyrad.packet
+from pyrad.client import Client
+
+from radcli.engine import EndpointClosed, RadiusEndpoint
+from radcli.histogram import LatencyHistogram
+
+START, INTERIM, STOP = "Start", "Interim-Update", "Stop"
+
+_IDLE, _ACTIVE = 0, 1
+
+# Rough average packet sizes used to derive packet counters from octets.
+_IN_PACKET_BYTES = 600
+_OUT_PACKET_BYTES = 1200
+
+
+class TimerWheel:
+    """Hierarchical hashed timing wheel over integer ticks.
+
+    Level 0 has one slot per tick; each higher level has one slot per full
+    revolution of the level below. Timers land on the lowest level whose
+    horizon covers them and cascade down one level each time the wheel
+    beneath wraps, so scheduling and expiry are O(1) amortised regardless
+    of how many timers are pending. Items are plain ints (session slots).
+    """
+
+    def __init__(self, sizes: tuple[int, ...] = (256, 64, 64, 64)) -> None:
+        self.now = 0
+        self._sizes = sizes
+        self._spans = [math.prod(sizes[:level]) for level in range(len(sizes))]
+        self._horizon = math.prod(sizes)
+        self._levels: list[list[list]] = [[[] for _ in range(size)] for size in sizes]
+        self.pending = 0
+
+    def _place(self, item: int, at: int) -> None:
+        delay = at - self.now
+        for level, span in enumerate(self._spans):
+            if delay < span * self._sizes[level]:
+                slot = (at // span) % self._sizes[level]
+                self._levels[level][slot].append(item if level == 0 else (item, at))
+                return
+        raise AssertionError("unreachable: schedule() clamps to the horizon")
+
+    def schedule(self, item: int, at: int) -> None:
+        """Fire ``item`` at tick ``at`` (clamped to the next tick .. the horizon)."""
+        at = min(max(at, self.now + 1), self.now + self._horizon - 1)
+        self._place(item, at)
+        self.pending += 1
+
+    def tick(self) -> list[int]:
+        """Advance one tick and return the items that expire on it."""
+        self.now += 1
+        for level in range(1, len(self._sizes)):
+            span = self._spans[level]
+            if self.now % span:
+                break
+            slot = (self.now // span) % self._sizes[level]
+            entries, self._levels[level][slot] = self._levels[level][slot], []
+            for item, at in entries:
+                self._place(item, at)
+        slot = self.now % self._sizes[0]
+        due, self._levels[0][slot] = self._levels[0][slot], []
+        self.pending -= len(due)
+        return due
+
+
+class SessionTable:
+    """Column-per-field session store backed by ``array`` buffers.
+
+    Nothing per session is a Python object: the Acct-Session-Id is derived
+    from a run prefix and the slot's serial number when a packet is built.
+    """
+
+    def __init__(self, capacity: int) -> None:
+        self.capacity = capacity
+        zeros_q = bytes(8 * capacity)
+        self.state = array("B", bytes(capacity))
+        self.serial = array("Q", zeros_q)
+        self.user = array("L", bytes(array("L").itemsize * capacity))
+        self.started = array("q", zeros_q)
+        self.last_update = array("q", zeros_q)
+        self.ends_at = array("q", zeros_q)
+        self.in_rate = array("d", zeros_q)  # bytes/s
+        self.out_rate = array("d", zeros_q)
+        self.in_octets = array("Q", zeros_q)
+        self.out_octets = array("Q", zeros_q)
+        self.active = 0
+
+
+@dataclass
+class SimConfig:
+    sessions: int = 1000
+    interim: int = 300  # Acct-Interim-Interval, seconds
+    session_length: int = 3600  # mean session lifetime, seconds
+    user: str = "testrunner"  # str.format template, may use {n}
+    users: int = 1  # distinct {n} values
+    nas_id: str = "radcli-sim"
+    seed: int | None = None
+
+
+class AcctSimulator:
+    """Session lifecycle state machine: Start → Interim-Update* → Stop → restart."""
+
+    def __init__(self, cfg: SimConfig) -> None:
+        self.cfg = cfg
+        self.table = SessionTable(cfg.sessions)
+        self.wheel = TimerWheel()
+        self._rng = random.Random(cfg.seed)
+        self._prefix = self._rng.getrandbits(32)
+        self._next_serial = 0
+        # Stagger the first Starts over one interim interval so the run
+        # opens at a steady rate instead of a 100k-packet burst.
+        for slot in range(cfg.sessions):
+            self.wheel.schedule(slot, 1 + self._rng.randrange(max(1, cfg.interim)))
+
+    @property
+    def now(self) -> int:
+        return self.wheel.now
+
+    def session_id(self, slot: int) -> str:
+        return f"{self._prefix:08x}{self.table.serial[slot]:08x}"
+
+    def user_name(self, slot: int) -> str:
+        return self.cfg.user.format(n=self.table.user[slot])
+
+    def _begin(self, slot: int) -> None:
+        t, rng, now = self.table, self._rng, self.now
+        self._next_serial += 1
+        t.state[slot] = _ACTIVE
+        t.serial[slot] = self._next_serial
+        t.user[slot] = rng.randrange(self.cfg.users)
+        t.started[slot] = now
+        t.last_update[slot] = now
+        t.ends_at[slot] = now + max(60, int(rng.expovariate(1 / self.cfg.session_length)))
+        # Log-normal throughput: most sessions trickle, a few are heavy hitters.
+        t.out_rate[slot] = rng.lognormvariate(10.0, 1.5)
+        t.in_rate[slot] = t.out_rate[slot] * rng.uniform(0.05, 0.3)
+        t.in_octets[slot] = 0
+        t.out_octets[slot] = 0
+        t.active += 1
+
+    def _accrue(self, slot: int) -> None:
+        t = self.table
+        elapsed = self.now - t.last_update[slot]
+        jitter = self._rng.uniform(0.5, 1.5)
+        t.in_octets[slot] += int(t.in_rate[slot] * elapsed * jitter)
+        t.out_octets[slot] += int(t.out_rate[slot] * elapsed * jitter)
+        t.last_update[slot] = self.now
+
+    def tick(self) -> list[tuple[int, str]]:
+        """Advance one simulated second; return the (slot, status) events due."""
+        events = []
+        t = self.table
+        for slot in self.wheel.tick():
+            now = self.now
+            if t.state[slot] == _IDLE:
+                self._begin(slot)
+                events.append((slot, START))
+                self.wheel.schedule(slot, min(now + self.cfg.interim, t.ends_at[slot]))
+            elif now >= t.ends_at[slot]:
+                self._accrue(slot)
+                events.append((slot, STOP))
+                t.state[slot] = _IDLE
+                t.active -= 1
+                # A new subscriber takes the slot after a short idle gap.
+                self.wheel.schedule(slot, now + 1 + self._rng.randrange(30))
+            else:
+                self._accrue(slot)
+                events.append((slot, INTERIM))
+                self.wheel.schedule(slot, min(now + self.cfg.interim, t.ends_at[slot]))
+        return events
+
+    def drain(self) -> list[tuple[int, str]]:
+        """Stop every active session (end of run)."""
+        events = []
+        t = self.table
+        for slot in range(t.capacity):
+            if t.state[slot] == _ACTIVE:
+                self._accrue(slot)
+                events.append((slot, STOP))
+                t.state[slot] = _IDLE
+                t.active -= 1
+        return events
+
+    def build_packet(self, client: Client, slot: int, status: str) -> pyrad.packet.Packet:
+        t = self.table
+        req = client.CreateAcctPacket(code=pyrad.packet.AccountingRequest)
+        req["User-Name"] = self.user_name(slot)
+        req["Acct-Session-Id"] = self.session_id(slot)
+        req["Acct-Status-Type"] = status
+        req["NAS-Identifier"] = self.cfg.nas_id
+        req["NAS-IP-Address"] = "127.0.0.1"
+        if status != START:
+            in_octets, out_octets = t.in_octets[slot], t.out_octets[slot]
+            req["Acct-Session-Time"] = self.now - t.started[slot]
+            req["Acct-Input-Octets"] = in_octets & 0xFFFFFFFF
+            req["Acct-Output-Octets"] = out_octets & 0xFFFFFFFF
+            req["Acct-Input-Gigawords"] = in_octets >> 32
+            req["Acct-Output-Gigawords"] = out_octets >> 32
+            req["Acct-Input-Packets"] = (in_octets // _IN_PACKET_BYTES) & 0xFFFFFFFF
+            req["Acct-Output-Packets"] = (out_octets // _OUT_PACKET_BYTES) & 0xFFFFFFFF
+        if status == STOP:
+            req["Acct-Terminate-Cause"] = "User-Request"
+        return req
+
+
+@dataclass
+class SimResult:
+    """Per-status counters and latency from one simulation run."""
+
+    sent: Counter = field(default_factory=Counter)
+    answered: Counter = field(default_factory=Counter)
+    timeouts: Counter = field(default_factory=Counter)
+    errors: int = 0
+    max_lag: float = 0.0  # how far (seconds) the sender fell behind the simulated clock
+    elapsed: float = 0.0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def rate(self) -> float:
+        total = sum(self.answered.values())
+        return total / self.elapsed if self.elapsed else 0.0
+
+
+async def run_simulation(
+    client: Client,
+    port: int,
+    sim: AcctSimulator,
+    *,
+    duration: int,
+    speed: float = 1.0,
+    sockets: int = 1,
+    timeout: float = 5.0,
+    stop_at_exit: bool = True,
+    on_tick: Callable[[AcctSimulator, SimResult], None] | None = None,
+) -> SimResult:
+    """Run ``duration`` simulated seconds, ``speed`` simulated seconds per real second."""
+    endpoints = [await RadiusEndpoint.open(client.server, port, client.secret) for _ in range(sockets)]
+    result = SimResult()
+    tasks: set[asyncio.Task] = set()
+    sent_total = 0
+
+    async def send(slot: int, status: str, intended: float) -> None:
+        pkt = sim.build_packet(client, slot, status)
+        try:
+            outcome = await endpoints[slot % sockets].send(pkt, timeout, intended=intended)
+        except EndpointClosed:
+            result.errors += 1
+            return
+        if outcome.code is None:
+            result.timeouts[status] += 1
+        else:
+            result.answered[status] += 1
+            result.histogram.record(outcome.latency)
+
+    def dispatch(events: list[tuple[int, str]], intended: float) -> None:
+        nonlocal sent_total
+        for slot, status in events:
+            # Packets are built inside the task, which runs before the next
+            # tick mutates the slot — the counters sent are this tick's.
+            task = asyncio.create_task(send(slot, status, intended))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            result.sent[status] += 1
+            sent_total += 1
+
+    start = time.perf_counter()
+    try:
+        for step in range(1, duration + 1):
+            intended = start + step / speed
+            delay = intended - time.perf_counter()
+            result.max_lag = max(result.max_lag, -delay)
+            await asyncio.sleep(max(0.0, delay))
+            dispatch(sim.tick(), intended)
+            if on_tick:
+                on_tick(sim, result)
+        if stop_at_exit:
+            dispatch(sim.drain(), time.perf_counter())
+        if tasks:
+            await asyncio.gather(*tasks)
+    finally:
+        result.elapsed = time.perf_counter() - start
+        for endpoint in endpoints:
+            await endpoint.close()
+    return result
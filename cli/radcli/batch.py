@@ -0,0 +1,230 @@
+"""Streaming credential batches for ``radcli auth --from-file``.
+
+The input (CSV or JSONL) is read one line at a time through a generator,
+a fixed number of worker tasks pull credentials from it and send them
+over a shared Session, and each result is written as one NDJSON line as
+soon as it arrives. Nothing holds more than ``concurrency`` records, so
+memory stays flat however large the corpus is.
+
+Resuming works on byte offsets into the input. The checkpoint records the
+offset below which *every* record has a result written, so after a crash
+or Ctrl-C a ``--resume`` run seeks straight there. Records that were in
+flight at the time are sent again — results are at-least-once, keyed by
+``user``.
+
+A record that can't be sent (malformed JSON, a CSV row with one column,
+a username too long for its attribute) gets an ``error`` line carrying
+its line number in the file and the batch carries on, so a ``--resume``
+never stalls on it.
+"""
+
+import asyncio
+import csv
+import json
+import os
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import IO
+
+from radcli.histogram import LatencyHistogram
+from radcli.output import error_record
+from radcli.session import Session
+
+FORMATS = ("csv", "jsonl")
+
+_USER_KEYS = ("user", "username", "user-name", "user_name")
+_PASSWORD_KEYS = ("password", "pass", "user-password", "user_password")
+
+
+@dataclass
+class Credential:
+    user: str
+    password: str
+    end: int  # byte offset just past this record's line
+    line: int  # 1-based line number in the file
+
+
+@dataclass
+class BadRecord:
+    """A line that couldn't be read as a credential."""
+
+    error: str
+    end: int
+    line: int
+
+
+def detect_format(path: Path) -> str:
+    return "jsonl" if path.suffix.lower() in (".jsonl", ".ndjson", ".json") else "csv"
+
+
+def _pick(record: dict, keys: tuple[str, ...], what: str):
+    for key, value in record.items():
+        if key.strip().lower() in keys:
+            return value
+    raise ValueError(f"no {what} field")
+
+
+def _parse(line: str, fmt: str, header: list[str] | None) -> tuple[str, str]:
+    if fmt == "jsonl":
+        record = json.loads(line)
+        if not isinstance(record, dict):
+            raise ValueError("expected a JSON object")
+        return _pick(record, _USER_KEYS, "user"), _pick(record, _PASSWORD_KEYS, "password")
+    row = next(csv.reader([line]))
+    if header is not None:
+        record = dict(zip(header, row))
+        return _pick(record, _USER_KEYS, "user"), _pick(record, _PASSWORD_KEYS, "password")
+    if len(row) < 2:
+        raise ValueError("expected user,password")
+    return row[0], row[1]
+
+
+def _lines_before(f: IO[bytes], offset: int) -> int:
+    """Count the lines in the first ``offset`` bytes of ``f``."""
+    f.seek(0)
+    lines = 0
+    while offset > 0:
+        chunk = f.read(min(offset, 1 << 20))
+        if not chunk:
+            break
+        lines += chunk.count(b"\n")
+        offset -= len(chunk)
+    return lines
+
+
+def read_credentials(path: Path, fmt: str, start: int = 0) -> Iterator[Credential | BadRecord]:
+    """Yield credentials from ``path`` beginning at byte offset ``start``.
+
+    CSV files may have a header naming the user/password columns; without
+    one the first two columns are used. Quoted fields can't span lines.
+    Blank lines and lines starting with ``#`` are skipped. A line that
+    doesn't parse is yielded as a ``BadRecord``.
+    """
+    with open(path, "rb") as f:
+        header: list[str] | None = None
+        if fmt == "csv":
+            first = f.readline()
+            row = next(csv.reader([first.decode()]), [])
+            if any(c.strip().lower() in _USER_KEYS for c in row):
+                header = row
+            else:
+                f.seek(0)
+            start = max(start, f.tell())
+        lineno = _lines_before(f, start) if start else 0
+        f.seek(start)
+        offset = start
+        for raw in f:
+            lineno += 1
+            offset += len(raw)
+            try:
+                line = raw.decode().strip()
+                if not line or line.startswith("#"):
+                    continue
+                user, password = _parse(line, fmt, header)
+            except (ValueError, csv.Error) as exc:
+                yield BadRecord(str(exc), offset, lineno)
+                continue
+            yield Credential(str(user), str(password), offset, lineno)
+
+
+def read_checkpoint(path: Path) -> int:
+    """Byte offset saved by a previous run, or 0 if there isn't one."""
+    try:
+        return int(json.loads(path.read_text())["offset"])
+    except FileNotFoundError:
+        return 0
+
+
+def _write_checkpoint(path: Path, source: Path, offset: int, done: int) -> None:
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_text(json.dumps({"input": str(source), "offset": offset, "done": done}) + "\n")
+    os.replace(tmp, path)
+
+
+@dataclass
+class BatchResult:
+    sent: int = 0
+    results: dict[str, int] = field(default_factory=dict)  # label → count
+    elapsed: float = 0.0
+    offset: int = 0  # checkpointed input position when the run ended
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def rate(self) -> float:
+        return self.sent / self.elapsed if self.elapsed else 0.0
+
+
+class _Watermark:
+    """Track the input offset below which every record has completed."""
+
+    def __init__(self, start: int) -> None:
+        self.offset = start
+        self._next = 0  # sequence number of the oldest incomplete record
+        self._done: dict[int, int] = {}  # seq → end offset, completed out of order
+
+    def complete(self, seq: int, end: int) -> None:
+        self._done[seq] = end
+        while self._next in self._done:
+            self.offset = self._done.pop(self._next)
+            self._next += 1
+
+
+async def run_batch(
+    session: Session,
+    source: Path,
+    out: IO[str],
+    *,
+    fmt: str,
+    concurrency: int = 64,
+    start: int = 0,
+    checkpoint: Path | None = None,
+    checkpoint_every: float = 1.0,
+    on_result=None,
+) -> BatchResult:
+    """Authenticate every credential in ``source``, writing NDJSON to ``out``."""
+    records = enumerate(read_credentials(source, fmt, start))
+    mark = _Watermark(start)
+    result = BatchResult(offset=start)
+    last_save = time.monotonic()
+
+    def save() -> None:
+        out.flush()
+        if checkpoint is not None:
+            _write_checkpoint(checkpoint, source, mark.offset, result.sent)
+
+    async def worker() -> None:
+        nonlocal last_save
+        # A plain generator shared between tasks is safe: next() never awaits.
+        for seq, cred in records:
+            if isinstance(cred, BadRecord):
+                line = {"line": cred.line, **error_record("auth", cred.error)}
+            else:
+                try:
+                    op = await session.auth(cred.user, cred.password)
+                except ValueError as exc:  # e.g. a value too long for its attribute
+                    line = {"user": cred.user, "line": cred.line, **error_record("auth", exc)}
+                else:
+                    line = {"user": cred.user, **op.to_dict()}
+                    if op.code is not None:
+                        result.histogram.record(op.latency)
+            del line["op"]
+            out.write(json.dumps(line) + "\n")
+            result.sent += 1
+            result.results[line["result"]] = result.results.get(line["result"], 0) + 1
+            mark.complete(seq, cred.end)
+            if on_result is not None:
+                on_result(result)
+            if time.monotonic() - last_save >= checkpoint_every:
+                last_save = time.monotonic()
+                save()
+
+    begin = time.perf_counter()
+    try:
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+    finally:
+        result.elapsed = time.perf_counter() - begin
+        result.offset = mark.offset
+        save()
+    return result
@@ -0,0 +1,103 @@
+"""Capacity search: the highest open-loop rate a server sustains within an SLO.
+
+Every step runs a constant open-loop load for a fixed time and checks
+three things: p99 latency (measured from the intended send times, so
+queueing counts), the share of requests that timed out, and whether the
+replies kept up with the offered rate. Replies are counted over the
+offered window, not the run's wall-clock time: one request that times
+out would otherwise stretch the run by ``--timeout`` and sink the rate.
+
+The search doubles the rate until a step fails, then bisects between the
+last passing rate and the first failing one until the two are within
+``precision`` of each other. The passing rate is the knee to size a
+fleet on.
+"""
+
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from radcli.loadgen import BenchResult
+
+# A step whose replies fall this far behind the offered rate didn't sustain it.
+_MIN_ACHIEVED = 0.95
+
+
+@dataclass
+class CapacityStep:
+    rate: float  # offered requests/s
+    achieved: float  # replies/s
+    p99: float  # seconds
+    timeout_ratio: float
+    passed: bool
+    reason: str = ""
+
+
+@dataclass
+class CapacityResult:
+    capacity: float | None  # highest passing rate; None if even the lowest failed
+    steps: list[CapacityStep] = field(default_factory=list)
+
+
+def judge(
+    rate: float, result: BenchResult, *, duration: float, p99_limit: float, timeout_limit: float
+) -> CapacityStep:
+    """Score one step of ``duration`` seconds offered at ``rate`` against the limits."""
+    p99 = result.percentile(99)
+    timeout_ratio = result.timeouts / result.sent if result.sent else 1.0
+    achieved = result.completed / duration
+    reasons = []
+    if p99 > p99_limit:
+        reasons.append(f"p99 {p99 * 1000:.1f} ms > {p99_limit * 1000:g} ms")
+    if timeout_ratio > timeout_limit:
+        reasons.append(f"timeouts {timeout_ratio:.2%} > {timeout_limit:.2%}")
+    if achieved < rate * _MIN_ACHIEVED:
+        reasons.append(f"only {achieved:,.0f} req/s answered")
+    return CapacityStep(rate, achieved, p99, timeout_ratio, not reasons, "; ".join(reasons))
+
+
+def find_capacity(
+    run_at: Callable[[float], BenchResult],
+    *,
+    duration: float,
+    p99_limit: float,
+    timeout_limit: float,
+    low: float = 100.0,
+    high: float = 100_000.0,
+    precision: float = 0.05,
+    on_step: Callable[[CapacityStep], None] | None = None,
+) -> CapacityResult:
+    """Search ``[low, high]`` for the highest rate where ``run_at(rate)`` passes.
+
+    ``run_at`` offers ``rate`` for ``duration`` seconds.
+    """
+    outcome = CapacityResult(capacity=None)
+
+    def step(rate: float) -> bool:
+        result = judge(rate, run_at(rate), duration=duration, p99_limit=p99_limit, timeout_limit=timeout_limit)
+        outcome.steps.append(result)
+        if on_step:
+            on_step(result)
+        return result.passed
+
+    # Exponential probe for the first failing rate.
+    rate = low
+    while True:
+        if not step(rate):
+            failing = rate
+            break
+        outcome.capacity = rate
+        if rate >= high:
+            return outcome  # never failed: the server out-ran the search range
+        rate = min(rate * 2, high)
+
+    if outcome.capacity is None:
+        return outcome  # failed at the lowest rate
+
+    passing = outcome.capacity
+    while (failing - passing) / failing > precision:
+        middle = (passing + failing) / 2
+        if step(middle):
+            passing = outcome.capacity = middle
+        else:
+            failing = middle
+    return outcome
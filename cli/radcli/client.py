@@ -1,15 +1,21 @@
 """pyrad Client factory — mirrors the radius_client fixture from tests/conftest.py."""
 
+import asyncio
+import threading
 from pathlib import Path
 
+import pyrad.packet
 import typer
-from pyrad.client import Client
-from pyrad.dictionary import Dictionary
-from rich.console import Console
+from pyrad.client import Client, Timeout
 
 from radcli.config import RadiusConfig
+from radcli.dictcache import load_dictionary
+from radcli.engine import RadiusEndpoint, RetryPolicy
 
-_console = Console(stderr=True)
+
+# Total seconds one request may take, retransmissions included. This is
+# the same worst case as pyrad's old fixed 3 tries × 5 s.
+DEFAULT_DEADLINE = 15.0
 
 
 def _find_dictionary() -> str:
@@ -34,23 +40,106 @@ def _find_dictionary() -> str:
     return ""
 
 
-def make_client(config: RadiusConfig) -> Client:
-    """Create a pyrad Client from the given config."""
+class RadiusClient(Client):
+    """pyrad ``Client`` whose ``SendPacket`` retransmits adaptively.
+
+    pyrad retries on a fixed timer. Here the first timeout follows the
+    measured RTT for that port, later ones back off exponentially with
+    jitter, and ``timeout`` caps the whole exchange. Retransmissions reuse
+    the packet's identifier and authenticator, so the server sees
+    duplicates rather than new requests.
+
+    The client keeps one event loop (on a background thread, so
+    ``SendPacket`` also works from code already running a loop) and one
+    open ``RadiusEndpoint`` per port for its lifetime. Repeated requests
+    cost a round trip, not a new loop and socket, and ``last_latency`` is
+    the engine's measurement of the latest exchange, the same number a
+    ``Session`` reports. ``close`` releases the loop and sockets.
+    """
+
+    def __init__(self, *args, retry: RetryPolicy | None = None, deadline: float = DEFAULT_DEADLINE, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.retry = retry or RetryPolicy()
+        self.timeout = deadline
+        self.retries = self.retry.retransmits + 1
+        self.last_latency: float | None = None
+        self._endpoints: dict[int, RadiusEndpoint] = {}  # port → endpoint, kept across calls
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    @property
+    def retransmits(self) -> int:
+        return sum(endpoint.retransmits for endpoint in self._endpoints.values())
+
+    @property
+    def duplicate_replies(self) -> int:
+        return sum(endpoint.duplicate_replies for endpoint in self._endpoints.values())
+
+    @property
+    def late_replies(self) -> int:
+        return sum(endpoint.late_replies for endpoint in self._endpoints.values())
+
+    def _run(self, coro):
+        """Run ``coro`` on this client's event loop and wait for its result."""
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="radcli-client", daemon=True)
+            self._thread.start()
+        return asyncio.run_coroutine_threadsafe(coro, self._loop).result()
+
+    async def _send(self, pkt: pyrad.packet.Packet, port: int):
+        endpoint = self._endpoints.get(port)
+        if endpoint is None:
+            endpoint = await RadiusEndpoint.open(self.server, port, self.secret, retry=self.retry)
+            self._endpoints[port] = endpoint
+        return await endpoint.send(pkt, self.timeout)
+
+    def SendPacket(self, pkt: pyrad.packet.Packet) -> pyrad.packet.Packet:
+        port = self.acctport if isinstance(pkt, pyrad.packet.AcctPacket) else self.authport
+        outcome = self._run(self._send(pkt, port))
+        self.last_latency = outcome.latency
+        if outcome.raw is None:
+            raise Timeout(f"no reply from {self.server}:{port} in {self.timeout:g}s ({outcome.retransmits + 1} tries)")
+        return pkt.CreateReply(packet=outcome.raw)
+
+    def close(self) -> None:
+        """Close the endpoints and stop the event loop. Safe to call more than once."""
+        if self._loop is None:
+            return
+
+        async def close_endpoints() -> None:
+            for endpoint in self._endpoints.values():
+                await endpoint.close()
+
+        try:
+            self._run(close_endpoints())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = None
+
+
+def make_client(
+    config: RadiusConfig, *, retry: RetryPolicy | None = None, deadline: float = DEFAULT_DEADLINE
+) -> RadiusClient:
+    """Create a pyrad-compatible client from the given config."""
     dict_path = _find_dictionary()
     if not dict_path:
-        _console.print(
+        from rich.console import Console
+
+        Console(stderr=True).print(
             "[bold red]Error:[/] RADIUS dictionary not found.\n"
             "  Run radcli from the cli/ or repo root directory,\n"
             "  or ensure the dictionary symlink exists."
         )
         raise typer.Exit(code=1)
-    client = Client(
+    return RadiusClient(
         server=config.server,
         secret=config.secret.encode(),
-        dict=Dictionary(dict_path),
+        dict=load_dictionary(dict_path),
         authport=config.auth_port,
         acctport=config.acct_port,
+        retry=retry,
+        deadline=deadline,
     )
-    client.retries = 3
-    client.timeout = 5
-    return client
@@ -1,21 +1,24 @@
-"""acct — Send Accounting-Request (Start/Stop/Interim)."""
+"""acct — Send Accounting-Request (Start/Stop/Interim), or simulate many sessions."""
 
+import asyncio
 import uuid
-from typing import Annotated
+from typing import Annotated, Optional
 
 import pyrad.packet
 import typer
-from rich.console import Console
 
-from radcli.client import make_client
-from radcli.config import RadiusConfig
-from radcli.display import code_label, connection_panel
-
-console = Console()
+from radcli.acctsim import INTERIM, START, STOP, AcctSimulator, SimConfig, run_simulation
+from radcli.client import DEFAULT_DEADLINE, make_client
+from radcli.config import resolve_config
+from radcli.histogram import LatencyHistogram, format_latency
+from radcli.output import emitter, error_record, latency_summary, send_and_emit
 
 _STATUS_TYPES = {"start": "Start", "stop": "Stop", "interim": "Interim-Update"}
 
+acct_app = typer.Typer(invoke_without_command=True)
+
 
+@acct_app.callback()
 def acct(
     ctx: typer.Context,
     status_type: Annotated[
@@ -31,37 +34,246 @@ def acct(
         int | None,
         typer.Option("--session-time", help="Acct-Session-Time in seconds"),
     ] = None,
+    count: Annotated[
+        int,
+        typer.Option("--count", "-n", min=1, help="Send the request this many times"),
+    ] = 1,
+    all_profiles: Annotated[
+        bool,
+        typer.Option("--all-profiles", help="Probe every profile in profiles.toml concurrently"),
+    ] = False,
+    profiles: Annotated[
+        Optional[str],
+        typer.Option("--profiles", help="Probe these profiles concurrently (comma-separated)"),
+    ] = None,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", min=0.001, help="Per-server deadline in seconds (fleet mode)"),
+    ] = 5.0,
 ) -> None:
     """Send an Accounting-Request and display the result."""
-    config: RadiusConfig = ctx.obj["config"]
-    console.print(connection_panel(config.server, config.acct_port, config.secret))
+    if ctx.invoked_subcommand is not None:
+        return
 
+    out = emitter(ctx)
     resolved_type = _STATUS_TYPES.get(status_type.lower())
     if resolved_type is None:
-        console.print(f"[bold red]Invalid --type:[/] {status_type!r}  (use start, stop, or interim)")
+        if out is not None:
+            out.emit(error_record("acct", f"invalid --type {status_type!r} (use start, stop, or interim)"))
+        else:
+            from rich.console import Console
+
+            Console().print(f"[bold red]Invalid --type:[/] {status_type!r}  (use start, stop, or interim)")
         raise typer.Exit(code=2)
+    if all_profiles or profiles:
+        from radcli.fleet import fan_out
 
+        fan_out(
+            "acct", all_profiles, profiles, timeout, out=out, user=user, status_type=resolved_type, session_id=session_id
+        )
+
+    config = resolve_config(ctx)
     sid = session_id or uuid.uuid4().hex[:16]
+    if out is not None:
+        try:
+            results = send_and_emit(
+                out,
+                config,
+                count,
+                lambda s: s.acct(status_type, user, sid, session_time),
+                timeout=DEFAULT_DEADLINE,
+            )
+        except OSError as exc:
+            out.emit(error_record("acct", exc))
+            raise typer.Exit(code=2)
+        raise typer.Exit(code=2 if any(r.code is None for r in results) else 0)
+
+    from rich.console import Console
+
+    from radcli.display import code_label, connection_panel, latency_table
+
+    console = Console()
+    console.print(connection_panel(config.server, config.acct_port, config.secret))
     console.print(f"[dim]Session-Id: {sid}  Status-Type: {resolved_type}[/]")
 
     client = make_client(config)
-    req = client.CreateAcctPacket(code=pyrad.packet.AccountingRequest)
-    req["User-Name"] = user
-    req["Acct-Session-Id"] = sid
-    req["Acct-Status-Type"] = resolved_type
-    req["NAS-Identifier"] = "radcli"
-    req["NAS-IP-Address"] = "127.0.0.1"
+    hist = LatencyHistogram()
+
+    finished = False
+    try:
+        with console.status("Sending Accounting-Request..."):
+            for _ in range(count):
+                req = client.CreateAcctPacket(code=pyrad.packet.AccountingRequest)
+                req["User-Name"] = user
+                req["Acct-Session-Id"] = sid
+                req["Acct-Status-Type"] = resolved_type
+                req["NAS-Identifier"] = "radcli"
+                req["NAS-IP-Address"] = "127.0.0.1"
+
+                if session_time is not None:
+                    req["Acct-Session-Time"] = session_time
+
+                reply = client.SendPacket(req)
+                latency = client.last_latency
+                hist.record(latency)
+    except Exception as exc:
+        console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=2)
+    else:
+        finished = True
+    finally:
+        # Ctrl-C or an error partway through --count: report what was measured.
+        if not finished and hist.count:
+            console.print(f"{hist.count:,} of {count:,} requests answered before stopping")
+            console.print(latency_table(hist))
+
+    label, style = code_label(reply.code)
+    console.print(f"\nResult: [{style}]{label}[/]  ({format_latency(latency)})")
+    if hist.count > 1:
+        console.print(latency_table(hist))
+    raise typer.Exit(code=0)
 
-    if session_time is not None:
-        req["Acct-Session-Time"] = session_time
 
-    with console.status("Sending Accounting-Request..."):
+@acct_app.command(name="simulate")
+def simulate(
+    ctx: typer.Context,
+    sessions: Annotated[
+        int,
+        typer.Option("--sessions", "-n", min=1, help="Concurrent sessions to keep alive"),
+    ] = 1000,
+    interim: Annotated[
+        int,
+        typer.Option("--interim", min=1, help="Interim-Update interval (seconds)"),
+    ] = 300,
+    session_length: Annotated[
+        int,
+        typer.Option("--session-length", min=60, help="Mean session lifetime (seconds)"),
+    ] = 3600,
+    duration: Annotated[
+        int,
+        typer.Option("--duration", "-d", min=1, help="Simulated seconds to run"),
+    ] = 900,
+    speed: Annotated[
+        float,
+        typer.Option("--speed", min=0.001, help="Simulated seconds per real second"),
+    ] = 1.0,
+    user: Annotated[
+        str,
+        typer.Option("--user", "-u", help="Username; may contain {n} for the user index"),
+    ] = "testrunner",
+    users: Annotated[
+        int,
+        typer.Option("--users", min=1, help="Distinct {n} values to spread sessions over"),
+    ] = 1,
+    sockets: Annotated[
+        int,
+        typer.Option("--sockets", "-S", min=1, help="Source sockets (256 requests in flight each)"),
+    ] = 1,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", help="Seconds to wait for each reply"),
+    ] = 5.0,
+    seed: Annotated[
+        int | None,
+        typer.Option("--seed", help="Random seed for reproducible session timing"),
+    ] = None,
+    stop_at_exit: Annotated[
+        bool,
+        typer.Option("--stop-at-exit/--no-stop-at-exit", help="Send Stop for sessions still open at the end"),
+    ] = True,
+) -> None:
+    """Simulate many concurrent sessions: Start → periodic Interim-Update → Stop."""
+    config = resolve_config(ctx)
+    out = emitter(ctx)
+    client = make_client(config)
+    sim = AcctSimulator(
+        SimConfig(
+            sessions=sessions,
+            interim=interim,
+            session_length=session_length,
+            user=user,
+            users=users,
+            seed=seed,
+        )
+    )
+
+    def simulate(on_tick=None):
+        return asyncio.run(
+            run_simulation(
+                client,
+                config.acct_port,
+                sim,
+                duration=duration,
+                speed=speed,
+                sockets=sockets,
+                timeout=timeout,
+                stop_at_exit=stop_at_exit,
+                on_tick=on_tick,
+            )
+        )
+
+    if out is not None:
+        try:
+            result = simulate()
+        except OSError as exc:
+            out.emit(error_record("acct", exc))
+            raise typer.Exit(code=2)
+        summary = {
+            "op": "acct",
+            "elapsed_s": round(result.elapsed, 3),
+            "rate": round(result.rate, 1),
+            "max_lag_s": round(result.max_lag, 3),
+            "errors": result.errors,
+            "sent": {status: result.sent[status] for status in (START, INTERIM, STOP)},
+            "answered": {status: result.answered[status] for status in (START, INTERIM, STOP)},
+            "timeouts": {status: result.timeouts[status] for status in (START, INTERIM, STOP)},
+        }
+        if result.histogram.count:
+            summary["latency_ms"] = latency_summary(result.histogram)
+        out.emit({"summary": summary})
+        raise typer.Exit(code=1 if sum(result.timeouts.values()) or result.errors else 0)
+
+    from rich.console import Console
+    from rich.table import Table
+
+    from radcli.display import connection_panel, latency_table
+
+    console = Console()
+    console.print(connection_panel(config.server, config.acct_port, config.secret))
+    with console.status("Simulating sessions...") as spinner:
+
+        def progress(sim: AcctSimulator, result) -> None:
+            spinner.update(
+                f"t={sim.now}s  active={sim.table.active:,}  "
+                f"sent={sum(result.sent.values()):,}  "
+                f"timeouts={sum(result.timeouts.values()):,}  lag={result.max_lag:.2f}s"
+            )
+
         try:
-            reply = client.SendPacket(req)
-        except Exception as exc:
+            result = simulate(progress)
+        except OSError as exc:
             console.print(f"[bold red]Error:[/] {exc}")
             raise typer.Exit(code=2)
 
-    label, style = code_label(reply.code)
-    console.print(f"\nResult: [{style}]{label}[/]")
+    table = Table(title="Accounting Simulation", show_header=True, header_style="bold cyan")
+    table.add_column("Status-Type", style="bold")
+    table.add_column("Sent", justify="right")
+    table.add_column("Answered", justify="right")
+    table.add_column("Timeouts", justify="right")
+    for status in (START, INTERIM, STOP):
+        table.add_row(
+            status,
+            str(result.sent[status]),
+            str(result.answered[status]),
+            str(result.timeouts[status]),
+        )
+    console.print(table)
+    console.print(
+        f"Elapsed {result.elapsed:.1f} s  ·  {result.rate:,.0f} req/s  ·  "
+        f"max lag {result.max_lag:.2f} s"
+    )
+    console.print(latency_table(result.histogram))
+
+    if sum(result.timeouts.values()) or result.errors:
+        raise typer.Exit(code=1)
     raise typer.Exit(code=0)
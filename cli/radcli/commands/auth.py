@@ -1,44 +1,126 @@
 """auth — Send Access-Request, show Accept/Reject."""
 
-from typing import Annotated
+from pathlib import Path
+from typing import Annotated, Optional
 
 import pyrad.packet
 import typer
-from rich.console import Console
 
-from radcli.client import make_client
-from radcli.config import RadiusConfig
-from radcli.display import attribute_table, code_label, connection_panel
-
-console = Console()
+from radcli.client import DEFAULT_DEADLINE, make_client
+from radcli.config import resolve_config
+from radcli.histogram import LatencyHistogram, format_latency
+from radcli.output import emitter, error_record, latency_summary, send_and_emit
 
 
 def auth(
     ctx: typer.Context,
     user: Annotated[str, typer.Option("--user", "-u", help="Username")] = "testrunner",
     password: Annotated[str, typer.Option("--pass", "-p", help="Password")] = "run123",
+    count: Annotated[
+        int,
+        typer.Option("--count", "-n", min=1, help="Send the request this many times"),
+    ] = 1,
+    from_file: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--from-file",
+            "-f",
+            exists=True,
+            dir_okay=False,
+            help="Authenticate every user,password in this CSV/JSONL file",
+        ),
+    ] = None,
+    fmt: Annotated[
+        Optional[str],
+        typer.Option("--format", help="Input format: csv or jsonl (default: from extension)"),
+    ] = None,
+    output: Annotated[
+        Optional[Path],
+        typer.Option("--output", "-o", help="Write NDJSON results here instead of stdout"),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option("--concurrency", "-c", min=1, max=256, help="Requests in flight (--from-file)"),
+    ] = 64,
+    checkpoint: Annotated[
+        Optional[Path],
+        typer.Option("--checkpoint", help="Save progress here (default: OUTPUT.checkpoint when -o is set)"),
+    ] = None,
+    resume: Annotated[
+        bool,
+        typer.Option("--resume", help="Continue from the checkpoint, appending to OUTPUT"),
+    ] = False,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", help="Seconds to wait for each reply (--from-file, fleet mode)"),
+    ] = 5.0,
+    all_profiles: Annotated[
+        bool,
+        typer.Option("--all-profiles", help="Probe every profile in profiles.toml concurrently"),
+    ] = False,
+    profiles: Annotated[
+        Optional[str],
+        typer.Option("--profiles", help="Probe these profiles concurrently (comma-separated)"),
+    ] = None,
 ) -> None:
     """Send an Access-Request and display the result."""
-    config: RadiusConfig = ctx.obj["config"]
+    out = emitter(ctx)
+    if all_profiles or profiles:
+        from radcli.fleet import fan_out
+
+        fan_out("auth", all_profiles, profiles, timeout, out=out, user=user, password=password)
+    config = resolve_config(ctx)
+    if from_file is not None:
+        _auth_batch(config, from_file, fmt, output, concurrency, checkpoint, resume, timeout, out)
+        return
+    if out is not None:
+        try:
+            results = send_and_emit(out, config, count, lambda s: s.auth(user, password), timeout=DEFAULT_DEADLINE)
+        except OSError as exc:
+            out.emit(error_record("auth", exc))
+            raise typer.Exit(code=2)
+        if any(r.code is None for r in results):
+            raise typer.Exit(code=2)
+        raise typer.Exit(code=0 if results[-1].code == pyrad.packet.AccessAccept else 1)
+
+    from rich.console import Console
+
+    from radcli.display import attribute_table, code_label, connection_panel, latency_table
+
+    console = Console()
     console.print(connection_panel(config.server, config.auth_port, config.secret))
 
     client = make_client(config)
-    req = client.CreateAuthPacket(
-        code=pyrad.packet.AccessRequest,
-        User_Name=user,
-        NAS_Identifier="radcli",
-    )
-    req["User-Password"] = req.PwCrypt(password)
+    hist = LatencyHistogram()
 
-    with console.status("Sending Access-Request..."):
-        try:
-            reply = client.SendPacket(req)
-        except Exception as exc:
-            console.print(f"[bold red]Error:[/] {exc}")
-            raise typer.Exit(code=2)
+    finished = False
+    try:
+        with console.status("Sending Access-Request..."):
+            for _ in range(count):
+                req = client.CreateAuthPacket(
+                    code=pyrad.packet.AccessRequest,
+                    User_Name=user,
+                    NAS_Identifier="radcli",
+                )
+                req["User-Password"] = req.PwCrypt(password)
+                reply = client.SendPacket(req)
+                latency = client.last_latency
+                hist.record(latency)
+    except Exception as exc:
+        console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=2)
+    else:
+        finished = True
+    finally:
+        # Ctrl-C or an error partway through --count: report what was measured.
+        if not finished and hist.count:
+            console.print(f"{hist.count:,} of {count:,} requests answered before stopping")
+            console.print(latency_table(hist))
 
     label, style = code_label(reply.code)
-    console.print(f"\nResult: [{style}]{label}[/]")
+    console.print(f"\nResult: [{style}]{label}[/]  ({format_latency(latency)})")
+    if hist.count > 1:
+        console.print(latency_table(hist))
 
     table = attribute_table(reply)
     if table:
@@ -47,3 +129,100 @@ def auth(
     if reply.code == pyrad.packet.AccessAccept:
         raise typer.Exit(code=0)
     raise typer.Exit(code=1)
+
+
+def _auth_batch(config, source, fmt, output, concurrency, checkpoint, resume, timeout, emit=None) -> None:
+    """``--from-file``: stream NDJSON results; summary and progress go to stderr.
+
+    Under ``radcli --output`` there is no panel or spinner, and the summary
+    (or error) is emitted as a record after the results.
+    """
+    import asyncio
+    import contextlib
+    import sys
+
+    from rich.console import Console
+
+    from radcli.batch import FORMATS, detect_format, read_checkpoint, run_batch
+    from radcli.display import connection_panel, latency_table
+    from radcli.session import Session
+
+    err = Console(stderr=True)
+
+    def fail(message: str, code: int = 2):
+        if emit is not None:
+            emit.emit(error_record("auth", message))
+        else:
+            err.print(f"[bold red]Error:[/] {message}")
+        raise typer.Exit(code=code)
+
+    fmt = (fmt or detect_format(source)).lower()
+    if fmt not in FORMATS:
+        fail(f"unknown format {fmt!r} (use csv or jsonl)")
+    if emit is not None and not emit.streaming and output is None:
+        fail("--from-file streams NDJSON results; use --output ndjson or write them with -o FILE")
+    if checkpoint is None and output is not None:
+        checkpoint = output.with_name(output.name + ".checkpoint")
+    if resume and checkpoint is None:
+        fail("--resume needs --checkpoint or --output")
+    start = read_checkpoint(checkpoint) if resume else 0
+
+    if emit is None:
+        err.print(connection_panel(config.server, config.auth_port, config.secret))
+        if start:
+            err.print(f"Resuming {source} at byte {start:,}")
+
+    async def run(out):
+        session = Session(config, timeout=timeout)
+        try:
+            with err.status("Authenticating...") if emit is None else contextlib.nullcontext() as status:
+                return await run_batch(
+                    session,
+                    source,
+                    out,
+                    fmt=fmt,
+                    concurrency=concurrency,
+                    start=start,
+                    checkpoint=checkpoint,
+                    on_result=None if status is None else lambda r: status.update(f"Authenticating... {r.sent:,} done"),
+                )
+        finally:
+            await session.close()
+
+    out = open(output, "a" if resume else "w") if output is not None else sys.stdout
+    try:
+        result = asyncio.run(run(out))
+    except KeyboardInterrupt:
+        if emit is not None:
+            fail(f"interrupted; rerun with --resume to continue from {checkpoint or 'a checkpoint'}", code=130)
+        err.print(f"[yellow]Interrupted[/] — rerun with --resume to continue from {checkpoint or 'a checkpoint'}")
+        raise typer.Exit(code=130)
+    except (OSError, ValueError) as exc:
+        fail(str(exc))
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    if emit is not None:
+        summary = {
+            "op": "auth",
+            "sent": result.sent,
+            "elapsed_s": round(result.elapsed, 3),
+            "rate": round(result.rate, 1),
+            "results": dict(sorted(result.results.items())),
+        }
+        if result.histogram.count:
+            summary["latency_ms"] = latency_summary(result.histogram)
+        emit.emit({"summary": summary})
+        if any(label != "Access-Accept" for label in result.results):
+            raise typer.Exit(code=1)
+        return
+
+    err.print(
+        f"\n{result.sent:,} credentials in {result.elapsed:.2f}s ({result.rate:,.0f}/s): "
+        + ", ".join(f"{label} {n:,}" for label, n in sorted(result.results.items()))
+    )
+    if result.histogram.count:
+        err.print(latency_table(result.histogram))
+    if any(label != "Access-Accept" for label in result.results):
+        raise typer.Exit(code=1)
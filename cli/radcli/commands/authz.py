@@ -4,26 +4,10 @@ from typing import Annotated
 
 import pyrad.packet
 import typer
-from rich.console import Console
-from rich.table import Table
 
-from radcli.client import make_client
-from radcli.config import RadiusConfig
-from radcli.display import code_label, connection_panel
-
-console = Console()
-
-# Known attribute descriptions for richer output
-_ATTR_NOTES = {
-    "Session-Timeout": "Max session duration (seconds)",
-    "Reply-Message": "Server greeting / message to client",
-    "Framed-Protocol": "L2 framing for the session",
-    "Framed-IP-Address": "IP assigned to client",
-    "Framed-IP-Netmask": "Subnet mask for client",
-    "Idle-Timeout": "Max idle time before disconnect (seconds)",
-    "Service-Type": "Type of service authorized",
-    "Class": "Opaque value echoed in accounting",
-}
+from radcli.client import DEFAULT_DEADLINE, make_client
+from radcli.config import resolve_config
+from radcli.output import emitter, error_record, send_and_emit
 
 
 def authz(
@@ -32,7 +16,23 @@ def authz(
     password: Annotated[str, typer.Option("--pass", "-p", help="Password")] = "run123",
 ) -> None:
     """Authenticate and show detailed reply attributes with annotations."""
-    config: RadiusConfig = ctx.obj["config"]
+    config = resolve_config(ctx)
+    out = emitter(ctx)
+    if out is not None:
+        try:
+            (result,) = send_and_emit(out, config, 1, lambda s: s.auth(user, password), timeout=DEFAULT_DEADLINE)
+        except OSError as exc:
+            out.emit(error_record("auth", exc))
+            raise typer.Exit(code=2)
+        if result.code is None:
+            raise typer.Exit(code=2)
+        raise typer.Exit(code=0 if result.code == pyrad.packet.AccessAccept else 1)
+
+    from rich.console import Console
+
+    from radcli.display import ATTR_NOTES, attribute_table, code_label, connection_panel
+
+    console = Console()
     console.print(connection_panel(config.server, config.auth_port, config.secret))
 
     client = make_client(config)
@@ -53,23 +53,8 @@ def authz(
     label, style = code_label(reply.code)
     console.print(f"\nResult: [{style}]{label}[/]  (user={user})")
 
-    keys = list(reply.keys())
-    if keys:
-        table = Table(
-            title="Authorization Attributes",
-            show_header=True,
-            header_style="bold cyan",
-        )
-        table.add_column("Attribute", style="bold")
-        table.add_column("Value")
-        table.add_column("Note", style="dim")
-
-        for key in sorted(keys):
-            values = reply[key]
-            note = _ATTR_NOTES.get(str(key), "")
-            for val in values:
-                table.add_row(str(key), str(val), note)
-
+    table = attribute_table(reply, title="Authorization Attributes", notes=ATTR_NOTES)
+    if table:
         console.print(table)
     else:
         console.print("[dim]No reply attributes.[/]")
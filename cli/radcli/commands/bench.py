@@ -0,0 +1,359 @@
+"""bench — Access-Request load generator with many requests in flight."""
+
+import contextlib
+import random
+from pathlib import Path
+from typing import Annotated, NoReturn
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from radcli.config import resolve_config
+from radcli.corpus import Corpus, make_sampler
+from radcli.display import code_label, connection_panel, latency_table
+from radcli.engine import MAX_IDENTIFIERS, RetryPolicy
+from radcli.histogram import format_latency
+from radcli.loadprofile import constant, parse_profile
+from radcli.output import Emitter, emitter, error_record
+from radcli.shard import record_path, run_sharded
+
+console = Console()
+
+
+def bench(
+    ctx: typer.Context,
+    user: Annotated[str, typer.Option("--user", "-u", help="Username")] = "testrunner",
+    password: Annotated[str, typer.Option("--pass", "-p", help="Password")] = "run123",
+    corpus: Annotated[
+        Path | None,
+        typer.Option(
+            "--corpus",
+            exists=True,
+            dir_okay=False,
+            help="Sample credentials from this binary corpus (radcli users generate --corpus)",
+        ),
+    ] = None,
+    sample: Annotated[
+        str,
+        typer.Option("--sample", help="--corpus sampling: uniform, zipf[:S] or hot:K[:SHARE]"),
+    ] = "uniform",
+    bad_password: Annotated[
+        float,
+        typer.Option("--bad-password", min=0.0, max=1.0, help="--corpus: share of requests with a wrong password"),
+    ] = 0.0,
+    unknown_user: Annotated[
+        float,
+        typer.Option("--unknown-user", min=0.0, max=1.0, help="--corpus: share of requests for unknown users"),
+    ] = 0.0,
+    requests: Annotated[
+        int | None,
+        typer.Option("--requests", "-n", help="Total requests to send (default 10000 unless --duration)"),
+    ] = None,
+    duration: Annotated[
+        float | None,
+        typer.Option("--duration", "-d", help="Run for this many seconds instead of a fixed count"),
+    ] = None,
+    concurrency: Annotated[
+        int,
+        typer.Option(
+            "--concurrency", "-c",
+            min=1, max=MAX_IDENTIFIERS,
+            help="Requests kept in flight per socket (one RADIUS identifier each)",
+        ),
+    ] = 64,
+    sockets: Annotated[
+        int,
+        typer.Option("--sockets", "-S", min=1, help="Source sockets per worker process"),
+    ] = 1,
+    workers: Annotated[
+        int,
+        typer.Option("--workers", "-w", min=1, help="Worker processes to shard the load across"),
+    ] = 1,
+    pin: Annotated[
+        bool,
+        typer.Option("--pin/--no-pin", help="Pin each worker process to its own CPU"),
+    ] = True,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", help="Seconds to wait for each reply (the deadline with --retransmit)"),
+    ] = 5.0,
+    record: Annotated[
+        Path | None,
+        typer.Option("--record", dir_okay=False, help="Write every request's outcome here for `radcli report`"),
+    ] = None,
+    label: Annotated[
+        str,
+        typer.Option("--label", help="Name for this run in `radcli report` (default: the run mode)"),
+    ] = "",
+    retransmit: Annotated[
+        bool,
+        typer.Option("--retransmit", help="Retransmit unanswered requests with RTT-based backoff, like a NAS"),
+    ] = False,
+    rate: Annotated[
+        float | None,
+        typer.Option(
+            "--rate", "-r",
+            min=0.001,
+            help="Open-loop: send this many requests/s (latency measured from intended send time)",
+        ),
+    ] = None,
+    load: Annotated[
+        str | None,
+        typer.Option(
+            "--load",
+            "-L",
+            help="Open-loop profile: constant:R, poisson:R, step:R1,R2,..@SECS, ramp:FROM-TO@SECS (+ ':poisson')",
+        ),
+    ] = None,
+    seed: Annotated[
+        int | None,
+        typer.Option("--seed", help="Seed for Poisson arrivals (default: random)"),
+    ] = None,
+    find_capacity: Annotated[
+        bool,
+        typer.Option("--find-capacity", help="Search for the highest rate that stays within --p99/--max-timeouts"),
+    ] = False,
+    p99_limit: Annotated[
+        float,
+        typer.Option("--p99", min=0.001, help="--find-capacity: p99 latency limit in milliseconds"),
+    ] = 50.0,
+    timeout_limit: Annotated[
+        float,
+        typer.Option("--max-timeouts", min=0.0, max=1.0, help="--find-capacity: allowed timeout ratio"),
+    ] = 0.001,
+    step_duration: Annotated[
+        float,
+        typer.Option("--step-duration", min=0.1, help="--find-capacity: seconds per rate step"),
+    ] = 10.0,
+    min_rate: Annotated[
+        float,
+        typer.Option("--min-rate", min=0.001, help="--find-capacity: first rate tried (req/s)"),
+    ] = 100.0,
+    max_rate: Annotated[
+        float,
+        typer.Option("--max-rate", min=0.001, help="--find-capacity: stop searching above this rate (req/s)"),
+    ] = 100_000.0,
+    precision: Annotated[
+        float,
+        typer.Option("--precision", min=0.001, max=0.5, help="--find-capacity: stop when the bracket is this tight"),
+    ] = 0.05,
+) -> None:
+    """Flood the server with Access-Requests and report throughput and latency."""
+    if rate is not None and load is not None:
+        raise typer.BadParameter("--rate and --load both set the send rate; use one", param_hint="--rate")
+    if find_capacity and (rate is not None or load is not None):
+        raise typer.BadParameter("--find-capacity chooses the rates itself", param_hint="--rate/--load")
+    if find_capacity and record is not None:
+        raise typer.BadParameter("--find-capacity runs many short steps and does not record them", param_hint="--record")
+    config = resolve_config(ctx)
+    out = emitter(ctx)
+
+    def fail(message) -> NoReturn:
+        if out is not None:
+            out.emit(error_record("bench", message))
+        else:
+            console.print(f"[bold red]Error:[/] {message}")
+        raise typer.Exit(code=2)
+
+    if out is None:
+        console.print(connection_panel(config.server, config.auth_port, config.secret))
+    if corpus is not None:
+        try:
+            credentials = Corpus(corpus)
+            make_sampler(sample, len(credentials), random.random)  # validates the spec
+            credentials.close()
+            if bad_password + unknown_user > 1:
+                raise ValueError("--bad-password and --unknown-user add up to more than 1")
+        except ValueError as exc:
+            fail(exc)
+
+    shard_options = dict(
+        workers=workers,
+        pin=pin,
+        concurrency=concurrency,
+        sockets=sockets,
+        timeout=timeout,
+        seed=seed,
+        retry=RetryPolicy() if retransmit else None,
+        corpus=str(corpus) if corpus else None,
+        sampling=sample,
+        bad_password=bad_password,
+        unknown_user=unknown_user,
+    )
+    if find_capacity:
+        _find_capacity(
+            config,
+            user,
+            password,
+            shard_options,
+            p99_limit=p99_limit / 1000,
+            timeout_limit=timeout_limit,
+            step_duration=step_duration,
+            low=min_rate,
+            high=max_rate,
+            precision=precision,
+            out=out,
+        )
+
+    profile = None
+    if load is not None:
+        try:
+            profile = parse_profile(load, duration)
+        except ValueError as exc:
+            fail(exc)
+    elif requests is None and duration is None:
+        requests = 10000
+
+    in_flight = concurrency * sockets * workers
+    if profile is not None:
+        mode = f"{load} (~{profile.total:,.0f} requests over {profile.duration:g} s)"
+    elif rate:
+        mode = f"at {rate:,.0f} req/s"
+    else:
+        mode = f"with {in_flight} requests in flight"
+    status = f"Benchmarking {mode} ({workers} worker(s) × {sockets} socket(s) × {concurrency})..."
+    with console.status(status) if out is None else contextlib.nullcontext():
+        try:
+            result = run_sharded(
+                config,
+                user,
+                password,
+                requests=requests,
+                duration=duration,
+                rate=rate,
+                load=profile,
+                record=str(record) if record else None,
+                label=label or mode,
+                **shard_options,
+            )
+        except OSError as exc:
+            fail(exc)
+
+    if out is not None:
+        recorded = [record_path(str(record), i, workers) for i in range(workers)] if record is not None else []
+        out.emit({"op": "bench", "mode": mode, **result.to_dict(), "recorded": recorded})
+        raise typer.Exit(code=0 if result.completed else 1)
+
+    table = Table(title="Bench Results", show_header=True, header_style="bold cyan")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value", justify="right")
+    table.add_row("Requests sent", str(result.sent))
+    for code, count in sorted(result.codes.items()):
+        name, style = code_label(code)
+        table.add_row(f"[{style}]{name}[/]", str(count))
+    table.add_row("Timeouts", str(result.timeouts))
+    if result.retransmits:
+        table.add_row("Retransmits", str(result.retransmits))
+    if result.duplicates:
+        table.add_row("Duplicate replies", str(result.duplicates))
+    if result.late:
+        table.add_row("Late replies", str(result.late))
+    if result.stray:
+        table.add_row("Stray replies", str(result.stray))
+    table.add_row("Elapsed", f"{result.elapsed:.2f} s")
+    table.add_row("Throughput", f"{result.rate:,.0f} req/s")
+    console.print(table)
+    if result.failure_messages:
+        failures = Table(title="Failure Reply-Messages", show_header=True, header_style="bold cyan")
+        failures.add_column("Reply-Message", style="bold")
+        failures.add_column("Count", justify="right")
+        for message, count in result.failure_messages.most_common(10):
+            failures.add_row(message, str(count))
+        console.print(failures)
+    console.print(latency_table(result.histogram))
+    if record is not None:
+        files = " (one file per worker)" if workers > 1 else ""
+        console.print(f"[dim]Recorded every request to {record}{files}; see `radcli report`[/]")
+
+    if result.completed == 0:
+        raise typer.Exit(code=1)
+    raise typer.Exit(code=0)
+
+
+def _find_capacity(
+    config, user, password, shard_options, *, step_duration, out: Emitter | None = None, **search
+) -> None:
+    from radcli.capacity import find_capacity
+
+    if out is not None:
+        _find_capacity_records(config, user, password, shard_options, out, step_duration=step_duration, **search)
+
+    table = Table(title="Capacity Search", show_header=True, header_style="bold cyan")
+    for column in ("Offered", "Answered", "p99", "Timeouts", "Result"):
+        table.add_column(column, justify="right")
+
+    def run_at(rate: float):
+        with console.status(f"Offering {rate:,.0f} req/s for {step_duration:g} s..."):
+            return run_sharded(
+                config, user, password, load=constant(rate, step_duration), **shard_options
+            )
+
+    def on_step(step) -> None:
+        verdict = "[green]pass[/]" if step.passed else f"[red]fail[/] [dim]{step.reason}[/]"
+        table.add_row(
+            f"{step.rate:,.0f}/s",
+            f"{step.achieved:,.0f}/s",
+            format_latency(step.p99),
+            f"{step.timeout_ratio:.2%}",
+            verdict,
+        )
+        console.print(
+            f"{step.rate:>10,.0f} req/s → p99 {format_latency(step.p99)}, "
+            f"timeouts {step.timeout_ratio:.2%}: {'pass' if step.passed else 'fail — ' + step.reason}"
+        )
+
+    try:
+        result = find_capacity(run_at, duration=step_duration, on_step=on_step, **search)
+    except OSError as exc:
+        console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=2)
+    console.print(table)
+    if result.capacity is None:
+        console.print(f"\n[bold red]No passing rate[/] — even {search['low']:,.0f} req/s broke the limits")
+        raise typer.Exit(code=1)
+    ceiling = " (search ceiling; raise --max-rate)" if result.steps[-1].passed else ""
+    console.print(
+        f"\n[bold green]Capacity:[/] {result.capacity:,.0f} req/s{ceiling} with "
+        f"p99 ≤ {format_latency(search['p99_limit'])} and timeouts ≤ {search['timeout_limit']:.2%}"
+    )
+    raise typer.Exit(code=0)
+
+
+def _find_capacity_records(config, user, password, shard_options, out: Emitter, *, step_duration, **search) -> None:
+    """``--find-capacity`` under ``radcli --output``: one record per step, then the verdict."""
+    from radcli.capacity import find_capacity
+
+    def run_at(rate: float):
+        return run_sharded(config, user, password, load=constant(rate, step_duration), **shard_options)
+
+    def on_step(step) -> None:
+        out.emit(
+            {
+                "op": "capacity-step",
+                "rate": round(step.rate, 1),
+                "achieved": round(step.achieved, 1),
+                "p99_ms": round(step.p99 * 1000, 3),
+                "timeout_ratio": step.timeout_ratio,
+                "passed": step.passed,
+                "reason": step.reason,
+            }
+        )
+
+    try:
+        result = find_capacity(run_at, duration=step_duration, on_step=on_step, **search)
+    except OSError as exc:
+        out.emit(error_record("bench", exc))
+        raise typer.Exit(code=2)
+    out.emit(
+        {
+            "summary": {
+                "op": "capacity",
+                "capacity": result.capacity,
+                "at_ceiling": bool(result.steps) and result.steps[-1].passed,
+                "p99_limit_ms": round(search["p99_limit"] * 1000, 3),
+                "timeout_limit": search["timeout_limit"],
+            }
+        }
+    )
+    raise typer.Exit(code=1 if result.capacity is None else 0)
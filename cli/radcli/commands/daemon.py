@@ -0,0 +1,117 @@
+"""daemon — Long-running radcli with a local Unix-socket API."""
+
+import json
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+
+daemon_app = typer.Typer(help="Run radcli as a daemon and talk to it over a Unix socket.")
+
+SocketOption = Annotated[
+    Optional[Path],
+    typer.Option("--socket", help="Unix socket path (default: $XDG_RUNTIME_DIR/radcli.sock)"),
+]
+
+
+@daemon_app.command("serve")
+def serve(
+    ctx: typer.Context,
+    socket: SocketOption = None,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", help="Seconds to wait for each reply"),
+    ] = 5.0,
+) -> None:
+    """Keep sessions warm and answer NDJSON requests on a Unix socket."""
+    import asyncio
+
+    from rich.console import Console
+
+    from radcli import daemon
+    from radcli.config import resolve_config
+    from radcli.session import SessionPool
+
+    console = Console(stderr=True)
+    path = socket or daemon.default_socket_path()
+    pool = SessionPool(resolve_config(ctx), timeout=timeout)
+    console.print(f"[bold]radcli daemon[/] listening on [cyan]{path}[/]  (stop with `radcli daemon stop`)")
+    try:
+        asyncio.run(daemon.serve(pool, path))
+    except RuntimeError as exc:
+        console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=2)
+    except KeyboardInterrupt:
+        pass
+
+
+@daemon_app.command("call")
+def call(
+    ctx: typer.Context,
+    op: Annotated[str, typer.Argument(help="auth, acct, status or ping")],
+    user: Annotated[
+        Optional[str],
+        typer.Option("--user", "-u", help="Username"),
+    ] = None,
+    password: Annotated[
+        Optional[str],
+        typer.Option("--pass", "-p", help="Password (auth)"),
+    ] = None,
+    status_type: Annotated[
+        Optional[str],
+        typer.Option("--type", "-t", help="Acct-Status-Type: start, stop, or interim (acct)"),
+    ] = None,
+    session_id: Annotated[
+        Optional[str],
+        typer.Option("--session-id", help="Acct-Session-Id (acct)"),
+    ] = None,
+    session_time: Annotated[
+        Optional[int],
+        typer.Option("--session-time", help="Acct-Session-Time in seconds (acct)"),
+    ] = None,
+    socket: SocketOption = None,
+) -> None:
+    """Send one request to a running daemon and print its JSON reply.
+
+    Exits 0 on Access-Accept / Accounting-Response / a successful ping,
+    1 on any other result and 2 if the daemon can't be reached.
+    """
+    from radcli import daemon
+
+    request = {"op": op}
+    profile = ctx.obj["overrides"]["profile"]
+    for key, value in (
+        ("profile", profile),
+        ("user", user),
+        ("password", password),
+        ("type", status_type),
+        ("session_id", session_id),
+        ("session_time", session_time),
+    ):
+        if value is not None:
+            request[key] = value
+
+    try:
+        reply = daemon.call(request, socket)
+    except OSError as exc:
+        typer.echo(f"Error: can't reach radcli daemon: {exc}", err=True)
+        raise typer.Exit(code=2)
+
+    typer.echo(json.dumps(reply))
+    if not reply.get("ok"):
+        raise typer.Exit(code=1)
+    if op != "ping" and reply.get("result") not in ("Access-Accept", "Accounting-Response"):
+        raise typer.Exit(code=1)
+
+
+@daemon_app.command("stop")
+def stop(socket: SocketOption = None) -> None:
+    """Ask a running daemon to shut down."""
+    from radcli import daemon
+
+    try:
+        daemon.call({"op": "shutdown"}, socket)
+    except OSError as exc:
+        typer.echo(f"Error: can't reach radcli daemon: {exc}", err=True)
+        raise typer.Exit(code=2)
+    typer.echo("radcli daemon stopped")
@@ -1,88 +1,164 @@
 """health — Docker container health checks for freeradius-lab."""
 
-import subprocess
+import asyncio
+import time
+from dataclasses import dataclass
+from typing import Annotated
 
 import typer
-from rich.console import Console
-from rich.table import Table
 
-console = Console()
+from radcli.dockerapi import DockerClient, DockerError
+from radcli.histogram import format_latency
+from radcli.output import emitter
 
 CONTAINER = "freeradius-lab"
+PORTS = ("1812/udp", "1813/udp", "18121/udp")
 
 
-def _docker_exec(cmd: list[str]) -> subprocess.CompletedProcess[str]:
-    """Run a command inside the freeradius-lab container."""
-    return subprocess.run(
-        ["docker", "exec", CONTAINER, *cmd],
-        capture_output=True,
-        text=True,
-    )
+@dataclass
+class Check:
+    name: str
+    passed: bool
+    status: str  # plain word; green when passed, red when not
+    detail: str
+    elapsed: float  # seconds
 
+    def to_dict(self) -> dict:
+        return {
+            "check": self.name,
+            "passed": self.passed,
+            "status": self.status,
+            "detail": self.detail,
+            "elapsed_ms": round(self.elapsed * 1000, 3),
+        }
 
-def health(
-    ctx: typer.Context,
-) -> None:
-    """Run health checks against the freeradius-lab Docker container."""
-    table = Table(title="freeradius-lab health", show_header=True, header_style="bold cyan")
-    table.add_column("Check", style="bold")
-    table.add_column("Status")
-    table.add_column("Detail")
 
-    all_passed = True
+async def _timed(coro):
+    """Await ``coro`` and return ``(result or DockerError, seconds)``."""
+    start = time.perf_counter()
+    try:
+        result = await coro
+    except DockerError as exc:
+        result = exc
+    return result, time.perf_counter() - start
 
-    # 1. Container running?
-    result = subprocess.run(
-        ["docker", "inspect", "-f", "{{.State.Status}}", CONTAINER],
-        capture_output=True,
-        text=True,
-    )
-    running = result.returncode == 0 and result.stdout.strip() == "running"
-    table.add_row(
-        "Container",
-        "[green]running[/]" if running else "[red]not running[/]",
-        CONTAINER,
+
+async def _check_container(docker: DockerClient, container: str) -> list[Check]:
+    """Inspect and both radiusd execs, concurrently; the port rows come from the inspect."""
+    (info, t_info), (version, t_version), (config, t_config) = await asyncio.gather(
+        _timed(docker.inspect(container)),
+        _timed(docker.exec(container, ["radiusd", "-v"])),
+        _timed(docker.exec(container, ["radiusd", "-C"])),
     )
+
+    # 1. Container running?
+    if isinstance(info, DockerError):
+        status = "not found" if info.status == 404 else "error"
+        return [Check("Container", False, status, str(info)[:80], t_info)]
+    state = info["State"]["Status"]
+    running = state == "running"
+    checks = [Check("Container", running, state, container, t_info)]
     if not running:
-        all_passed = False
-        console.print(table)
-        console.print("\n[bold red]Container is not running.[/] Start with: docker compose up -d")
-        raise typer.Exit(code=1)
+        return checks
 
     # 2. radiusd -v (version)
-    result = _docker_exec(["radiusd", "-v"])
-    if result.returncode == 0:
-        version_line = result.stdout.strip().splitlines()[0] if result.stdout.strip() else "unknown"
-        table.add_row("Version", "[green]ok[/]", version_line)
+    if isinstance(version, DockerError) or version.exit_code:
+        detail = str(version) if isinstance(version, DockerError) else version.stderr.strip()
+        checks.append(Check("Version", False, "fail", detail[:80], t_version))
     else:
-        all_passed = False
-        table.add_row("Version", "[red]fail[/]", result.stderr.strip()[:80])
+        version_line = version.stdout.strip().splitlines()[0] if version.stdout.strip() else "unknown"
+        checks.append(Check("Version", True, "ok", version_line, t_version))
 
     # 3. radiusd -C (config syntax)
-    result = _docker_exec(["radiusd", "-C"])
-    if result.returncode == 0:
-        table.add_row("Config", "[green]valid[/]", "radiusd -C passed")
+    if isinstance(config, DockerError) or config.exit_code:
+        detail = str(config) if isinstance(config, DockerError) else (config.stderr.strip() or config.stdout.strip())
+        checks.append(Check("Config", False, "invalid", detail[:80], t_config))
     else:
-        all_passed = False
-        detail = (result.stderr.strip() or result.stdout.strip())[:80]
-        table.add_row("Config", "[red]invalid[/]", detail)
-
-    # 4. Port bindings (check from host via docker port)
-    for port in ["1812/udp", "1813/udp", "18121/udp"]:
-        result = subprocess.run(
-            ["docker", "port", CONTAINER, port],
-            capture_output=True,
-            text=True,
-        )
-        if result.returncode == 0 and result.stdout.strip():
-            binding = result.stdout.strip().splitlines()[0]
-            table.add_row(f"Port {port}", "[green]mapped[/]", binding)
+        checks.append(Check("Config", True, "valid", "radiusd -C passed", t_config))
+
+    # 4. Port bindings, from the same inspect
+    bindings = info.get("NetworkSettings", {}).get("Ports") or {}
+    for port in PORTS:
+        mapped = bindings.get(port)
+        if mapped:
+            binding = f"{mapped[0]['HostIp']}:{mapped[0]['HostPort']}"
+            checks.append(Check(f"Port {port}", True, "mapped", binding, t_info))
         else:
-            all_passed = False
-            table.add_row(f"Port {port}", "[red]not mapped[/]", "")
+            checks.append(Check(f"Port {port}", False, "not mapped", "", t_info))
+    return checks
 
-    console.print(table)
 
+async def _check_all(containers: list[str], timeout: float) -> list[list[Check]]:
+    docker = DockerClient(timeout=timeout)
+    return await asyncio.gather(*(_check_container(docker, name) for name in containers))
+
+
+def health(
+    ctx: typer.Context,
+    containers: Annotated[
+        list[str],
+        typer.Option(
+            "--container",
+            "-c",
+            envvar="RADCLI_CONTAINER",
+            help="Container to check (repeat for several)",
+        ),
+    ] = [CONTAINER],
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", min=0.1, help="Seconds before a Docker API call is abandoned"),
+    ] = 30.0,
+) -> None:
+    """Run health checks against the freeradius-lab Docker container."""
+    start = time.perf_counter()
+    results = asyncio.run(_check_all(containers, timeout))
+    elapsed = time.perf_counter() - start
+
+    out = emitter(ctx)
+    if out is not None:
+        for container, checks in zip(containers, results):
+            for check in checks:
+                out.emit({"container": container, **check.to_dict()})
+        passed = all(check.passed for checks in results for check in checks)
+        stopped = [container for container, checks in zip(containers, results) if not checks[0].passed]
+        out.emit(
+            {
+                "summary": {
+                    "containers": len(containers),
+                    "passed": passed,
+                    "not_running": stopped,
+                    "elapsed_ms": round(elapsed * 1000, 3),
+                }
+            }
+        )
+        raise typer.Exit(code=0 if passed else 1)
+
+    from rich.console import Console
+    from rich.table import Table
+
+    console = Console()
+    all_passed = True
+    stopped = []
+    for container, checks in zip(containers, results):
+        table = Table(title=f"{container} health", show_header=True, header_style="bold cyan")
+        table.add_column("Check", style="bold")
+        table.add_column("Status")
+        table.add_column("Detail")
+        table.add_column("Time", justify="right", style="dim")
+        for check in checks:
+            style = "green" if check.passed else "red"
+            table.add_row(check.name, f"[{style}]{check.status}[/]", check.detail, format_latency(check.elapsed))
+            all_passed &= check.passed
+        if not checks[0].passed:
+            stopped.append(container)
+        console.print(table)
+
+    console.print(f"[dim]{len(containers)} container(s) checked in {format_latency(elapsed)}[/]")
+    if stopped:
+        console.print(
+            f"\n[bold red]Not running:[/] {', '.join(stopped)}. Start with: docker compose up -d"
+        )
+        raise typer.Exit(code=1)
     if all_passed:
         console.print("\n[bold green]All checks passed.[/]")
     else:
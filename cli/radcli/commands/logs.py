@@ -0,0 +1,124 @@
+"""logs — Local analytics over the linelog JSON file."""
+
+import contextlib
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from radcli.output import Emitter, emitter, error_record
+
+console = Console()
+
+logs_app = typer.Typer()
+
+
+@logs_app.callback()
+def logs() -> None:
+    """Analyse linelog JSON files locally."""
+    # A callback keeps `logs` a group (`radcli logs stats`) with one subcommand.
+
+
+def _top_table(title: str, column: str, counts, total: int, top: int) -> Table:
+    table = Table(title=title, show_header=True, header_style="bold cyan")
+    table.add_column(column, style="bold")
+    table.add_column("Count", justify="right")
+    table.add_column("%", justify="right")
+    for key, n in counts.most_common(top):
+        table.add_row(str(key), f"{n:,}", f"{100 * n / total:.1f}" if total else "-")
+    return table
+
+
+@logs_app.command("stats")
+def stats(
+    ctx: typer.Context,
+    log: Annotated[Path, typer.Argument(exists=True, dir_okay=False, help="linelog JSON file")],
+    workers: Annotated[
+        Optional[int],
+        typer.Option("--workers", "-w", min=1, help="Parser processes (default: one per CPU)"),
+    ] = None,
+    top: Annotated[int, typer.Option("--top", "-n", min=1, help="Rows in each top-N table")] = 10,
+    checkpoint: Annotated[
+        Optional[Path],
+        typer.Option("--checkpoint", help="Checkpoint file (default: under ~/.cache/radcli)"),
+    ] = None,
+    incremental: Annotated[
+        bool,
+        typer.Option("--incremental/--full", help="Parse only lines appended since the last run, or start over"),
+    ] = True,
+    as_json: Annotated[bool, typer.Option("--json", help="Print the aggregate as one JSON object")] = False,
+) -> None:
+    """Accept/reject rates, top users and NASes, reject reasons and throughput."""
+    from radcli.logstats import analyze, checkpoint_path
+
+    checkpoint = checkpoint or checkpoint_path(log)
+    if not incremental:
+        checkpoint.unlink(missing_ok=True)
+
+    out = emitter(ctx) or (Emitter("ndjson") if as_json else None)
+    try:
+        with console.status(f"Parsing {log}...") if out is None else contextlib.nullcontext():
+            result = analyze(log, workers=workers, checkpoint=checkpoint)
+    except OSError as exc:
+        if out is not None:
+            out.emit(error_record("logs", exc))
+        else:
+            console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=2)
+    s = result.stats
+
+    if out is not None:
+        out.emit(
+            {
+                "file": str(log),
+                "offset": result.end,
+                "new_bytes": result.end - result.start,
+                "lines": s.lines,
+                "malformed": s.malformed,
+                "events": dict(s.events),
+                "accept_rate": s.accepts / s.auths if s.auths else None,
+                "reject_rate": s.rejects / s.auths if s.auths else None,
+                "top_users": s.users.most_common(top),
+                "top_nas": s.nas.most_common(top),
+                "reject_reasons": s.reject_reasons.most_common(top),
+                "throughput": s.throughput(),
+            }
+        )
+        return
+
+    resumed = f"resumed at byte {result.start:,}, " if result.start else ""
+    console.print(
+        f"[bold]{log}[/]  {s.lines:,} lines ({resumed}{result.end - result.start:,} new bytes, "
+        f"{result.ranges} range{'s' if result.ranges != 1 else ''})"
+        + (f"  ·  [yellow]{s.malformed:,} malformed[/]" if s.malformed else "")
+    )
+
+    events = Table(title="Events", show_header=True, header_style="bold cyan")
+    events.add_column("Event", style="bold")
+    events.add_column("Count", justify="right")
+    events.add_column("%", justify="right")
+    for key, n in sorted(s.events.items()):
+        events.add_row(key, f"{n:,}", f"{100 * n / s.lines:.1f}" if s.lines else "-")
+    console.print(events)
+    if s.auths:
+        console.print(
+            f"Auth: [green]{100 * s.accepts / s.auths:.2f}% accept[/]  ·  "
+            f"[red]{100 * s.rejects / s.auths:.2f}% reject[/]  of {s.auths:,}"
+        )
+
+    if s.users:
+        console.print(_top_table(f"Top {top} Users", "User", s.users, s.lines, top))
+    if s.nas:
+        console.print(_top_table(f"Top {top} NAS", "NAS", s.nas, s.lines, top))
+    if s.reject_reasons:
+        console.print(_top_table("Reject Reasons", "module_fail_msg", s.reject_reasons, s.rejects, top))
+
+    tp = s.throughput()
+    if tp:
+        console.print(
+            f"Throughput over {tp['seconds']:,} active s ({tp['first']} → {tp['last']}): "
+            f"mean {tp['mean']:,.1f}/s  ·  p50 {tp['p50']:,}/s  ·  p99 {tp['p99']:,}/s  ·  "
+            f"peak {tp['peak']:,}/s at {tp['peak_at']}"
+        )
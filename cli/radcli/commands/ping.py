@@ -0,0 +1,152 @@
+"""ping — Continuous Status-Server latency probe with ping-style statistics."""
+
+import asyncio
+import time
+from typing import Annotated
+
+import typer
+from rich.console import Console
+from rich.live import Live
+from rich.table import Table
+
+from radcli.client import make_client
+from radcli.config import resolve_config
+from radcli.display import code_label, connection_panel
+from radcli.histogram import format_latency
+from radcli.output import Emitter, emitter, error_record
+from radcli.ping import PingStats, Probe, run_ping
+from radcli.template import STATUS_SERVER_CODE, PacketTemplate
+
+console = Console()
+
+# The live view redraws at most this often, however fast probes arrive.
+_REFRESH_HZ = 4
+
+
+def _stats_table(stats: PingStats, last: Probe | None) -> Table:
+    table = Table(show_header=True, header_style="bold cyan", box=None)
+    for column in ("sent", "recv", "loss", "last", "min", "avg", "max", "mdev", "p99"):
+        table.add_column(column, justify="right")
+    if last is None:
+        last_cell = "-"
+    elif last.code is None:
+        last_cell = "[bold red]lost[/]"
+    else:
+        last_cell = format_latency(last.rtt)
+    timings = (
+        [format_latency(v) for v in (stats.min, stats.avg, stats.max, stats.mdev, stats.histogram.percentile(99))]
+        if stats.received
+        else ["-"] * 5
+    )
+    loss_style = "red" if stats.lost else "green"
+    table.add_row(
+        str(stats.sent),
+        str(stats.received),
+        f"[{loss_style}]{100 * stats.loss:.1f}%[/]",
+        last_cell,
+        *timings,
+    )
+    return table
+
+
+def ping(
+    ctx: typer.Context,
+    interval: Annotated[
+        float,
+        typer.Option("--interval", "-i", min=0.001, help="Seconds between probes (sub-second allowed)"),
+    ] = 1.0,
+    count: Annotated[
+        int,
+        typer.Option("--count", "-c", min=0, help="Stop after this many probes (0 = until Ctrl-C)"),
+    ] = 0,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", "-W", min=0.001, help="Seconds before a probe counts as lost"),
+    ] = 1.0,
+    ndjson: Annotated[
+        bool,
+        typer.Option(
+            "--ndjson",
+            help="One JSON line per probe and a summary line instead of the live view (same as radcli --output ndjson)",
+        ),
+    ] = False,
+) -> None:
+    """Probe the server with Status-Server continuously and report ping-style RTT stats."""
+    config = resolve_config(ctx)
+    template = PacketTemplate(make_client(config), STATUS_SERVER_CODE, NAS_Identifier="radcli")
+    stats = PingStats()
+    target = f"{config.server}:{config.auth_port}"
+    out = emitter(ctx) or (Emitter("ndjson") if ndjson else None)
+
+    if out is not None:
+
+        def on_probe(probe: Probe, stats: PingStats) -> None:
+            out.emit(
+                {
+                    "seq": probe.seq,
+                    "code": probe.code,
+                    "result": "Timeout" if probe.code is None else code_label(probe.code)[0],
+                    "rtt_ms": round(probe.rtt * 1000, 3) if probe.code is not None else None,
+                }
+            )
+
+        live = None
+    else:
+        console.print(connection_panel(config.server, config.auth_port, config.secret))
+        console.print(f"[dim]Status-Server every {format_latency(interval)} — Ctrl-C to stop[/]")
+        live = Live(_stats_table(stats, None), console=console, refresh_per_second=_REFRESH_HZ)
+        last_draw = 0.0
+
+        def on_probe(probe: Probe, stats: PingStats) -> None:
+            nonlocal last_draw
+            now = time.monotonic()
+            if now - last_draw >= 1 / _REFRESH_HZ or probe.code is None:
+                last_draw = now
+                live.update(_stats_table(stats, probe))
+
+    start = time.monotonic()
+    try:
+        if live is not None:
+            live.start()
+        asyncio.run(
+            run_ping(
+                template,
+                config.server,
+                config.auth_port,
+                interval=interval,
+                count=count or None,
+                timeout=timeout,
+                stats=stats,
+                on_probe=on_probe,
+            )
+        )
+    except KeyboardInterrupt:
+        pass
+    except OSError as exc:
+        if out is not None:
+            out.emit(error_record("ping", exc))
+        else:
+            console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=2)
+    finally:
+        if live is not None:
+            live.update(_stats_table(stats, None))
+            live.stop()
+    elapsed = time.monotonic() - start
+
+    if out is not None:
+        out.emit({"summary": {"target": target, "elapsed_s": round(elapsed, 3), **stats.to_dict()}})
+    else:
+        console.print(f"\n--- {target} radcli ping statistics ---")
+        console.print(
+            f"{stats.sent} probes sent, {stats.received} received, "
+            f"{100 * stats.loss:.1f}% loss, time {elapsed:.1f}s"
+        )
+        if stats.received:
+            console.print(
+                "rtt min/avg/max/mdev = "
+                + "/".join(f"{v * 1000:.3f}" for v in (stats.min, stats.avg, stats.max, stats.mdev))
+                + f" ms, p99 {stats.histogram.percentile(99) * 1000:.3f} ms"
+            )
+
+    raise typer.Exit(code=0 if stats.received else 1)
@@ -6,10 +6,12 @@ from pathlib import Path
 from typing import Annotated, Optional
 
 import typer
+from rich.console import Console
 from rich.table import Table
 
 from radcli.config import load_profiles, get_profile, save_profile
-from radcli.display import console
+
+console = Console()
 
 profile_app = typer.Typer(help="Manage named server profiles (profiles.toml).")
 
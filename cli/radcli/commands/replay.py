@@ -0,0 +1,145 @@
+"""replay — Re-send linelog JSON traffic at its original or a scaled pace."""
+
+import asyncio
+import contextlib
+from collections import Counter
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from radcli.client import make_client
+from radcli.config import resolve_config
+from radcli.display import connection_panel, latency_table
+from radcli.output import emitter, error_record, latency_summary
+from radcli.replay import ReplayResult, load_passwords, read_events, run_replay
+
+console = Console()
+
+
+def replay(
+    ctx: typer.Context,
+    log: Annotated[str, typer.Argument(help="linelog JSON file (.gz ok, - for stdin)")],
+    passwords: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--passwords", "-p",
+            exists=True, dir_okay=False,
+            help="CSV/JSONL user,password mapping for Access-Requests",
+        ),
+    ] = None,
+    default_password: Annotated[
+        Optional[str],
+        typer.Option("--default-pass", help="Password for users missing from --passwords (else skip them)"),
+    ] = None,
+    speed: Annotated[
+        float,
+        typer.Option("--speed", min=0.0, help="Multiple of the logged pace (2 = twice as fast, 0 = as fast as possible)"),
+    ] = 1.0,
+    sockets: Annotated[
+        int,
+        typer.Option("--sockets", "-S", min=1, help="Source sockets per port (256 requests in flight each)"),
+    ] = 1,
+    max_pending: Annotated[
+        int,
+        typer.Option("--max-pending", min=1, help="Cap on outstanding requests; beyond it the replay lags"),
+    ] = 4096,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", help="Seconds to wait for each reply"),
+    ] = 5.0,
+) -> None:
+    """Replay auth/acct traffic from a linelog JSON file."""
+    config = resolve_config(ctx)
+    out = emitter(ctx)
+    if out is None:
+        console.print(connection_panel(config.server, config.auth_port, config.secret))
+
+    client = make_client(config)
+    mapping = load_passwords(passwords) if passwords is not None else {}
+    if not mapping and default_password is None and out is None:
+        console.print("[yellow]No --passwords or --default-pass: auth lines will be skipped.[/]")
+
+    lines: Counter = Counter()
+    result = ReplayResult(lines=lines)
+
+    with console.status("Replaying...") if out is None else contextlib.nullcontext() as spinner:
+
+        def progress(result: ReplayResult) -> None:
+            spinner.update(
+                f"log t={result.log_span:,.0f}s  sent={sum(result.sent.values()):,}  "
+                f"timeouts={sum(result.timeouts.values()):,}  lag={result.max_lag:.2f}s"
+            )
+
+        try:
+            asyncio.run(
+                run_replay(
+                    client,
+                    read_events(log, lines),
+                    mapping,
+                    default_password=default_password,
+                    speed=speed,
+                    sockets=sockets,
+                    timeout=timeout,
+                    max_pending=max_pending,
+                    result=result,
+                    on_progress=progress if spinner is not None else None,
+                )
+            )
+        except KeyboardInterrupt:
+            if out is None:
+                console.print("[yellow]Interrupted[/] — partial results below")
+        except OSError as exc:
+            if out is not None:
+                out.emit(error_record("replay", exc))
+            else:
+                console.print(f"[bold red]Error:[/] {exc}")
+            raise typer.Exit(code=2)
+
+    if out is not None:
+        summary = {
+            "op": "replay",
+            "log_span_s": round(result.log_span, 3),
+            "elapsed_s": round(result.elapsed, 3),
+            "rate": round(result.rate, 1),
+            "max_lag_s": round(result.max_lag, 3),
+            "errors": result.errors,
+            "mismatched": result.mismatched,
+            "sent": {kind: result.sent[kind] for kind in ("auth", "acct")},
+            "answered": {kind: result.answered[kind] for kind in ("auth", "acct")},
+            "timeouts": {kind: result.timeouts[kind] for kind in ("auth", "acct")},
+            "skipped": {k: v for k, v in sorted(lines.items()) if v},
+        }
+        if result.histogram.count:
+            summary["latency_ms"] = latency_summary(result.histogram)
+        out.emit({"summary": summary})
+        raise typer.Exit(code=1 if sum(result.timeouts.values()) or result.errors else 0)
+
+    table = Table(title="Replay", show_header=True, header_style="bold cyan")
+    table.add_column("Type", style="bold")
+    table.add_column("Sent", justify="right")
+    table.add_column("Answered", justify="right")
+    table.add_column("Timeouts", justify="right")
+    for kind in ("auth", "acct"):
+        table.add_row(kind, str(result.sent[kind]), str(result.answered[kind]), str(result.timeouts[kind]))
+    console.print(table)
+
+    pace = f"{result.log_span / result.elapsed:.1f}x" if result.elapsed else "-"
+    console.print(
+        f"Replayed {result.log_span:,.0f} s of log in {result.elapsed:.1f} s ({pace})  ·  "
+        f"{result.rate:,.0f} req/s  ·  max lag {result.max_lag:.2f} s"
+    )
+    skipped = {k: v for k, v in sorted(lines.items()) if v}
+    if skipped or result.mismatched:
+        notes = [f"{k.replace('_', ' ')} {v:,}" for k, v in skipped.items()]
+        if result.mismatched:
+            notes.append(f"auth result differs from log {result.mismatched:,}")
+        console.print("[dim]" + "  ·  ".join(notes) + "[/]")
+    if result.histogram.count:
+        console.print(latency_table(result.histogram))
+
+    if sum(result.timeouts.values()) or result.errors:
+        raise typer.Exit(code=1)
+    raise typer.Exit(code=0)
@@ -0,0 +1,166 @@
+"""report — Percentiles, time series and error breakdowns from `radcli bench --record` files."""
+
+import time
+from pathlib import Path
+from typing import Annotated
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from radcli.display import code_label, latency_table
+from radcli.histogram import format_latency
+from radcli.output import Emitter, emitter, error_record
+from radcli.recorder import RunSummary, summarize
+
+console = Console()
+
+
+def _summary_table(run: RunSummary) -> Table:
+    title = run.meta.get("label") or run.run
+    table = Table(title=f"Run {run.run}: {title}", show_header=True, header_style="bold cyan")
+    table.add_column("Metric", style="bold")
+    table.add_column("Value", justify="right")
+    started = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(run.started_at))
+    table.add_row("Started", started)
+    table.add_row("Target", run.meta.get("target", "-"))
+    table.add_row("Files", str(len(run.files)))
+    table.add_row("Requests", f"{run.requests:,}")
+    for code, count in sorted(run.codes.items()):
+        if code:
+            name, style = code_label(code)
+            table.add_row(f"[{style}]{name}[/]", f"{count:,}")
+    table.add_row("Timeouts", f"[red]{run.timeouts:,}[/]" if run.timeouts else "0")
+    if run.retransmitted:
+        table.add_row("Retransmitted", f"{run.retransmitted:,} ({run.retransmits:,} resends)")
+    if run.expected_rejects or run.accepted_bad:
+        table.add_row("Rejects (bad credential)", f"{run.expected_rejects:,}")
+    if run.unexpected_rejects:
+        table.add_row("Rejects (good credential)", f"[red]{run.unexpected_rejects:,}[/]")
+    if run.accepted_bad:
+        table.add_row("Accepts (bad credential)", f"[bold red]{run.accepted_bad:,}[/]")
+    table.add_row("Duration", f"{run.duration:.2f} s")
+    table.add_row("Throughput", f"{run.rate:,.0f} req/s")
+    if run.replies:
+        table.add_row("Mean reply size", f"{run.reply_bytes / run.replies:,.0f} B")
+    return table
+
+
+def _series_table(run: RunSummary, rows: int) -> Table:
+    table = Table(title="Time Series", show_header=True, header_style="bold cyan")
+    for column in ("t (s)", "Sent", "Replies/s", "Timeouts", "p50", "p99", "max"):
+        table.add_column(column, justify="right")
+    for start, width, interval in run.time_series(rows):
+        hist = interval.histogram
+        replies = interval.sent - interval.timeouts
+        latencies = (
+            [format_latency(hist.percentile(50)), format_latency(hist.percentile(99)), format_latency(hist.max)]
+            if hist.count
+            else ["-"] * 3
+        )
+        table.add_row(
+            f"{start:,.1f}",
+            f"{interval.sent:,}",
+            f"{replies / width:,.0f}",
+            f"[red]{interval.timeouts:,}[/]" if interval.timeouts else "0",
+            *latencies,
+        )
+    return table
+
+
+def _comparison_table(runs: list[RunSummary]) -> Table:
+    table = Table(title="Runs Compared", show_header=True, header_style="bold cyan")
+    table.add_column("Run", style="bold")
+    for column in ("Requests", "Throughput", "Timeouts", "p50", "p99", "p99.9"):
+        table.add_column(column, justify="right")
+    for run in runs:
+        hist = run.histogram
+        table.add_row(
+            run.meta.get("label") or run.run,
+            f"{run.requests:,}",
+            f"{run.rate:,.0f}/s",
+            f"{run.timeouts / run.requests:.2%}" if run.requests else "-",
+            *(format_latency(hist.percentile(q)) for q in (50, 99, 99.9)),
+        )
+    return table
+
+
+def _to_dict(run: RunSummary, rows: int) -> dict:
+    hist = run.histogram
+    return {
+        "run": run.run,
+        "label": run.meta.get("label", ""),
+        "target": run.meta.get("target", ""),
+        "started_at": run.started_at,
+        "files": run.files,
+        "requests": run.requests,
+        "codes": {str(code): count for code, count in sorted(run.codes.items()) if code},
+        "timeouts": run.timeouts,
+        "retransmitted": run.retransmitted,
+        "retransmits": run.retransmits,
+        "expected_rejects": run.expected_rejects,
+        "unexpected_rejects": run.unexpected_rejects,
+        "accepted_bad": run.accepted_bad,
+        "duration_s": round(run.duration, 3),
+        "rate": round(run.rate, 1),
+        "latency_ms": {label: round(value * 1000, 3) for label, value in hist.summary().items()},
+        "series": [
+            {
+                "t": round(start, 3),
+                "sent": interval.sent,
+                "timeouts": interval.timeouts,
+                "replies_per_s": round((interval.sent - interval.timeouts) / width, 1),
+                "p99_ms": round(interval.histogram.percentile(99) * 1000, 3),
+            }
+            for start, width, interval in run.time_series(rows)
+        ],
+    }
+
+
+def report(
+    ctx: typer.Context,
+    files: Annotated[
+        list[Path],
+        typer.Argument(exists=True, dir_okay=False, help="Recordings from `radcli bench --record` (any number of runs)"),
+    ],
+    interval: Annotated[
+        float,
+        typer.Option("--interval", "-i", min=0.001, help="Time-series resolution in seconds"),
+    ] = 1.0,
+    rows: Annotated[
+        int,
+        typer.Option("--rows", min=1, help="Merge time-series intervals down to at most this many rows"),
+    ] = 60,
+    series: Annotated[
+        bool,
+        typer.Option("--series/--no-series", help="Show the time series for each run"),
+    ] = True,
+    as_json: Annotated[
+        bool,
+        typer.Option("--json", help="Print one JSON line per run (same as radcli --output ndjson)"),
+    ] = False,
+) -> None:
+    """Summarise recorded bench runs: percentiles, time series and error breakdown."""
+    out = emitter(ctx) or (Emitter("ndjson") if as_json else None)
+    try:
+        runs = summarize(files, interval=interval)
+    except (ValueError, OSError) as exc:
+        if out is not None:
+            out.emit(error_record("report", exc))
+        else:
+            console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=2)
+
+    if out is not None:
+        for run in runs:
+            out.emit(_to_dict(run, rows))
+        return
+
+    for run in runs:
+        console.print(_summary_table(run))
+        if run.histogram.count:
+            console.print(latency_table(run.histogram))
+        if series and run.series:
+            console.print(_series_table(run, rows))
+    if len(runs) > 1:
+        console.print(_comparison_table(runs))
@@ -0,0 +1,98 @@
+"""responder — Run the in-process stand-in RADIUS server."""
+
+import asyncio
+import time
+from pathlib import Path
+from typing import Annotated, Optional
+
+import typer
+from rich.console import Console
+
+from radcli.client import _find_dictionary
+from radcli.dictcache import load_dictionary
+from radcli.responder import ANSIBLE_USERS, Responder, load_users
+
+console = Console(stderr=True)
+
+
+def responder(
+    users: Annotated[
+        Optional[Path],
+        typer.Option(
+            "--users",
+            "-u",
+            exists=True,
+            dir_okay=False,
+            help="Ansible vars (.yml) with freeradius_test_users, or a users file (default: the freeradius role's)",
+        ),
+    ] = None,
+    listen: Annotated[str, typer.Option("--listen", "-l", help="Address to bind")] = "127.0.0.1",
+    auth_port: Annotated[int, typer.Option("--auth-port", help="Auth/Status-Server port (0 = any free port)")] = 1812,
+    acct_port: Annotated[int, typer.Option("--acct-port", help="Accounting port (0 = any free port)")] = 1813,
+    secret: Annotated[str, typer.Option("--secret", "-k", help="Shared secret clients must use")] = "testing123",
+    latency: Annotated[
+        float,
+        typer.Option("--latency", min=0.0, help="Milliseconds to hold every reply"),
+    ] = 0.0,
+    jitter: Annotated[
+        float,
+        typer.Option("--jitter", min=0.0, help="Up to this many extra milliseconds, uniformly random"),
+    ] = 0.0,
+    loss: Annotated[
+        float,
+        typer.Option("--loss", min=0.0, max=1.0, help="Fraction of requests to drop silently (0.0 – 1.0)"),
+    ] = 0.0,
+    seed: Annotated[Optional[int], typer.Option("--seed", help="Seed for loss and jitter")] = None,
+    report: Annotated[
+        float,
+        typer.Option("--report", min=0.0, help="Print counters every N seconds (0 = only on exit)"),
+    ] = 10.0,
+) -> None:
+    """Answer Access, Accounting and Status-Server requests from the lab's user list."""
+    dictionary = load_dictionary(_find_dictionary())
+    source = users or ANSIBLE_USERS
+    try:
+        table = load_users(source, dictionary)
+    except (RuntimeError, ValueError, OSError) as exc:
+        console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=2)
+    server = Responder(
+        table, secret.encode(), latency=latency / 1000, jitter=jitter / 1000, loss=loss, seed=seed
+    )
+
+    def line(elapsed: float) -> str:
+        s = server.stats
+        answered = s.access_accepts + s.access_rejects + s.accounting_responses + s.status_requests
+        return (
+            f"{answered:,} answered ({answered / elapsed if elapsed else 0:,.0f}/s)  "
+            f"accept {s.access_accepts:,}  reject {s.access_rejects:,}  acct {s.accounting_responses:,}  "
+            f"status {s.status_requests:,}  dropped {s.dropped:,}  invalid {s.invalid:,}"
+        )
+
+    async def run() -> None:
+        bound_auth = await server.listen(listen, auth_port)
+        bound_acct = bound_auth
+        if acct_port != auth_port or acct_port == 0:
+            bound_acct = await server.listen(listen, acct_port, acct_port=True)
+        console.print(
+            f"[bold]radcli responder[/] {len(table):,} users from [cyan]{source}[/] — "
+            f"auth {listen}:{bound_auth}, acct {listen}:{bound_acct}  (Ctrl-C to stop)"
+        )
+        start = time.monotonic()
+        try:
+            while True:
+                await asyncio.sleep(report or 3600)
+                if report:
+                    console.print(f"[dim]{line(time.monotonic() - start)}[/]")
+        finally:
+            server.close()
+
+    start = time.monotonic()
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    except OSError as exc:
+        console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=2)
+    console.print(line(time.monotonic() - start))
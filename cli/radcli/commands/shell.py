@@ -0,0 +1,154 @@
+"""shell — Interactive REPL with config, dictionary and sockets kept warm."""
+
+import argparse
+import asyncio
+import shlex
+from typing import Annotated
+
+import typer
+from rich.console import Console
+
+from radcli.config import ProfileError, resolve_config
+from radcli.display import ATTR_NOTES, attribute_table, code_label, connection_panel
+from radcli.histogram import format_latency
+from radcli.session import OpResult, SessionPool
+
+console = Console()
+
+_HELP = """\
+[bold]Commands[/]
+  auth   [-u USER] [-p PASS]                  Access-Request
+  authz  [-u USER] [-p PASS]                  Access-Request, annotated reply attributes
+  acct   [-t start|stop|interim] [-u USER] [--session-id ID] [--session-time SECS]
+  status                                      Status-Server
+  use    PROFILE | -                          switch profile (- = startup target)
+  profiles                                    list warm sessions
+  help | quit"""
+
+
+class _Usage(Exception):
+    """Raised instead of exiting when a shell command line doesn't parse."""
+
+
+class _ShellParser(argparse.ArgumentParser):
+    def error(self, message: str) -> None:
+        raise _Usage(f"{self.prog}: {message}")
+
+    def exit(self, status: int = 0, message: str | None = None) -> None:
+        raise _Usage(message or "")
+
+
+def _parsers() -> dict[str, _ShellParser]:
+    auth = _ShellParser(prog="auth", add_help=False)
+    auth.add_argument("-u", "--user", default="testrunner")
+    auth.add_argument("-p", "--pass", dest="password", default="run123")
+
+    acct = _ShellParser(prog="acct", add_help=False)
+    acct.add_argument("-t", "--type", default="start")
+    acct.add_argument("-u", "--user", default="testrunner")
+    acct.add_argument("--session-id")
+    acct.add_argument("--session-time", type=int)
+
+    return {"auth": auth, "authz": auth, "acct": acct, "status": _ShellParser(prog="status", add_help=False)}
+
+
+def _render(result: OpResult, *, annotate: bool) -> None:
+    if result.code is None:
+        console.print(f"[bold red]Timeout[/] after {format_latency(result.latency)}")
+        return
+    label, style = code_label(result.code)
+    detail = f"  [dim]{result.detail}[/]" if result.detail else ""
+    console.print(f"[{style}]{label}[/]  ({format_latency(result.latency)}){detail}")
+    if result.reply is not None and result.op == "auth":
+        # Only auth replies carry attributes worth showing; nothing is
+        # decoded for acct/status.
+        if annotate:
+            table = attribute_table(result.reply, title="Authorization Attributes", notes=ATTR_NOTES)
+        else:
+            table = attribute_table(result.reply)
+        if table:
+            console.print(table)
+
+
+def shell(
+    ctx: typer.Context,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", help="Seconds to wait for each reply"),
+    ] = 5.0,
+) -> None:
+    """Interactive shell that keeps config, dictionary and sockets warm."""
+    try:
+        import readline  # noqa: F401 — line editing and history for input()
+    except ImportError:
+        pass
+
+    config = resolve_config(ctx)
+    console.print(connection_panel(config.server, config.auth_port, config.secret))
+    console.print("[dim]Type 'help' for commands, 'quit' to leave.[/]")
+
+    pool = SessionPool(config, timeout=timeout)
+    parsers = _parsers()
+    profile: str | None = None
+
+    with asyncio.Runner() as runner:
+        while True:
+            try:
+                line = input(f"radcli[{profile or 'default'}]> ")
+            except (EOFError, KeyboardInterrupt):
+                console.print()
+                break
+            try:
+                words = shlex.split(line)
+            except ValueError as exc:
+                console.print(f"[bold red]Error:[/] {exc}")
+                continue
+            if not words:
+                continue
+            cmd, args = words[0], words[1:]
+
+            if cmd in ("quit", "exit"):
+                break
+            if cmd == "help":
+                console.print(_HELP)
+                continue
+            if cmd == "profiles":
+                for name in pool.profiles:
+                    console.print(f"  {name or 'default'}")
+                continue
+            if cmd == "use":
+                if len(args) != 1:
+                    console.print("usage: use PROFILE | -")
+                    continue
+                target = None if args[0] == "-" else args[0]
+                try:
+                    pool.get(target)
+                except ProfileError as exc:
+                    console.print(f"[bold red]Error:[/] {exc}", highlight=False)
+                    continue
+                profile = target
+                continue
+            if cmd not in parsers:
+                console.print(f"[bold red]Unknown command:[/] {cmd}  (try 'help')")
+                continue
+
+            try:
+                opts = vars(parsers[cmd].parse_args(args))
+                session = pool.get(profile)
+                if cmd in ("auth", "authz"):
+                    result = runner.run(session.auth(opts["user"], opts["password"]))
+                elif cmd == "acct":
+                    result = runner.run(
+                        session.acct(opts["type"], opts["user"], opts["session_id"], opts["session_time"])
+                    )
+                else:
+                    result = runner.run(session.status())
+            except (_Usage, ValueError) as exc:
+                console.print(f"[bold red]Error:[/] {exc}")
+                continue
+            except OSError as exc:
+                console.print(f"[bold red]Error:[/] {exc}")
+                continue
+            _render(result, annotate=cmd == "authz")
+
+        runner.run(pool.close())
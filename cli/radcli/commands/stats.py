@@ -0,0 +1,125 @@
+"""stats — Poll FreeRADIUS server statistics (Status-Server + Statistics-Type)."""
+
+import asyncio
+import time
+from typing import Annotated, Optional
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from radcli.config import resolve_config
+from radcli.display import connection_panel
+from radcli.output import Emitter, emitter
+from radcli.serverstats import STATISTICS_TYPES, StatsPoller
+
+console = Console()
+
+_TIMES = ("start_time", "hup_time", "last_packet_recv", "last_packet_sent")
+
+
+def _stats_table(sample: dict) -> Table:
+    title = "Server Statistics" if sample["scope"] == "server" else f"Client {sample['client']}"
+    table = Table(title=title, show_header=True, header_style="bold cyan")
+    table.add_column("Statistic", style="bold")
+    table.add_column("Value", justify="right")
+    table.add_column("Δ", justify="right")
+    table.add_column("/s", justify="right")
+    for name, value in sample.items():
+        if name in ("ts", "scope", "client") or name.endswith(("_delta", "_rate")):
+            continue
+        if name in _TIMES and value:
+            value = f"{time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(value))}"
+        delta = sample.get(f"{name}_delta")
+        rate = sample.get(f"{name}_rate")
+        table.add_row(
+            name,
+            str(value),
+            "" if delta is None else str(delta),
+            "" if rate is None else f"{rate:.1f}",
+        )
+    return table
+
+
+def stats(
+    ctx: typer.Context,
+    stats_type: Annotated[
+        str,
+        typer.Option("--type", "-t", help=f"Statistics to request: {', '.join(STATISTICS_TYPES)}"),
+    ] = "all",
+    clients: Annotated[
+        bool,
+        typer.Option("--clients", help="Also poll per-client counters, one query per configured client"),
+    ] = False,
+    port: Annotated[
+        Optional[int],
+        typer.Option("--port", "-p", help="Status virtual server port (default: the auth port)"),
+    ] = None,
+    interval: Annotated[
+        float,
+        typer.Option("--interval", "-i", min=0.0, help="Seconds between polls (0 = poll once and exit)"),
+    ] = 0.0,
+    count: Annotated[
+        int,
+        typer.Option("--count", "-c", min=0, help="Stop after this many polls (0 = until Ctrl-C)"),
+    ] = 0,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", "-W", min=0.001, help="Seconds to wait for each reply"),
+    ] = 2.0,
+    json_out: Annotated[
+        bool,
+        typer.Option(
+            "--json",
+            help="One JSON object per sample per line, flushed as it is written (same as radcli --output ndjson)",
+        ),
+    ] = False,
+) -> None:
+    """Poll FreeRADIUS server statistics and report counters, rates and queues."""
+    config = resolve_config(ctx)
+    if stats_type not in STATISTICS_TYPES:
+        console.print(f"[bold red]Error:[/] unknown statistics type {stats_type!r}")
+        raise typer.Exit(code=2)
+    port = port or config.auth_port
+    poller = StatsPoller(
+        config.server,
+        port,
+        config.secret.encode(),
+        stats_type=STATISTICS_TYPES[stats_type],
+        clients=clients,
+        timeout=timeout,
+    )
+    out = emitter(ctx) or (Emitter("ndjson") if json_out else None)
+    if out is None:
+        console.print(connection_panel(config.server, port, config.secret))
+
+    async def run() -> int:
+        failures = polls = 0
+        first = time.monotonic()
+        try:
+            while True:
+                try:
+                    samples = await poller.poll()
+                except (TimeoutError, RuntimeError, OSError) as exc:
+                    failures += 1
+                    samples = [{"ts": round(time.time(), 3), "error": str(exc)}]
+                for sample in samples:
+                    if out is not None:
+                        out.emit(sample)
+                    elif "error" in sample:
+                        console.print(f"[bold red]Error:[/] {sample['error']}")
+                    else:
+                        console.print(_stats_table(sample))
+                polls += 1
+                if not interval or (count and polls >= count):
+                    return failures
+                # Fixed schedule: a slow reply doesn't push later polls back.
+                await asyncio.sleep(max(0.0, first + polls * interval - time.monotonic()))
+        finally:
+            await poller.close()
+
+    try:
+        failures = asyncio.run(run())
+    except KeyboardInterrupt:
+        raise typer.Exit(code=0)
+    raise typer.Exit(code=1 if failures else 0)
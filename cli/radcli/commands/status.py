@@ -1,17 +1,14 @@
 """status — Server liveness check (Status-Server with auth probe fallback)."""
 
-import time
-from typing import Annotated
+from typing import Annotated, Optional
 
 import pyrad.packet
 import typer
-from rich.console import Console
 
-from radcli.client import make_client
-from radcli.config import RadiusConfig
-from radcli.display import connection_panel
-
-console = Console()
+from radcli.client import DEFAULT_DEADLINE, make_client
+from radcli.config import resolve_config
+from radcli.histogram import LatencyHistogram, format_latency
+from radcli.output import Emitter, emitter, error_record, send_and_emit
 
 # Status-Server code (RFC 5997) — not in all pyrad versions as a constant
 STATUS_SERVER_CODE = 12
@@ -27,51 +24,115 @@ def status(
         str,
         typer.Option("--probe-pass", help="Password for auth-probe fallback"),
     ] = "run123",
+    count: Annotated[
+        int,
+        typer.Option("--count", "-n", min=1, help="Number of probes to send"),
+    ] = 1,
+    all_profiles: Annotated[
+        bool,
+        typer.Option("--all-profiles", help="Probe every profile in profiles.toml concurrently"),
+    ] = False,
+    profiles: Annotated[
+        Optional[str],
+        typer.Option("--profiles", help="Probe these profiles concurrently (comma-separated)"),
+    ] = None,
+    timeout: Annotated[
+        float,
+        typer.Option("--timeout", min=0.001, help="Per-server deadline in seconds (fleet mode)"),
+    ] = 5.0,
 ) -> None:
     """Check if the RADIUS server is alive (Status-Server with auth fallback)."""
-    config: RadiusConfig = ctx.obj["config"]
+    out = emitter(ctx)
+    if all_profiles or profiles:
+        from radcli.fleet import fan_out
+
+        fan_out("status", all_profiles, profiles, timeout, out=out, probe_user=probe_user, probe_pass=probe_pass)
+    config = resolve_config(ctx)
+    if out is not None:
+        _status_records(out, config, count, probe_user, probe_pass)
+
+    from rich.console import Console
+
+    from radcli.display import connection_panel, latency_table
+
+    console = Console()
     console.print(connection_panel(config.server, config.auth_port, config.secret))
 
     client = make_client(config)
+    hist = LatencyHistogram()
 
     # Try Status-Server first
     with console.status("Sending Status-Server..."):
         try:
-            req = client.CreateAuthPacket(code=STATUS_SERVER_CODE)
-            req["NAS-Identifier"] = "radcli"
-            start = time.monotonic()
-            reply = client.SendPacket(req)
-            latency_ms = (time.monotonic() - start) * 1000
+            for _ in range(count):
+                req = client.CreateAuthPacket(code=STATUS_SERVER_CODE)
+                req["NAS-Identifier"] = "radcli"
+                reply = client.SendPacket(req)
+                latency = client.last_latency
+                hist.record(latency)
             console.print(
                 f"\n[bold green]Server alive[/] via Status-Server  "
-                f"(code={reply.code}, {latency_ms:.0f} ms)"
+                f"(code={reply.code}, {format_latency(latency)})"
             )
+            if hist.count > 1:
+                console.print(latency_table(hist))
             raise typer.Exit(code=0)
         except typer.Exit:
             raise
-        except Exception:
+        except Exception as exc:
+            if hist.count:
+                console.print(f"\n[bold red]Server stopped answering:[/] {exc}")
+                console.print(latency_table(hist))
+                raise typer.Exit(code=1)
             console.print("[dim]Status-Server not supported, falling back to auth probe...[/]")
 
     # Fallback: send a real Access-Request
     with console.status("Sending auth probe..."):
         try:
-            req = client.CreateAuthPacket(
-                code=pyrad.packet.AccessRequest,
-                User_Name=probe_user,
-                NAS_Identifier="radcli",
-            )
-            req["User-Password"] = req.PwCrypt(probe_pass)
-            start = time.monotonic()
-            reply = client.SendPacket(req)
-            latency_ms = (time.monotonic() - start) * 1000
+            for _ in range(count):
+                req = client.CreateAuthPacket(
+                    code=pyrad.packet.AccessRequest,
+                    User_Name=probe_user,
+                    NAS_Identifier="radcli",
+                )
+                req["User-Password"] = req.PwCrypt(probe_pass)
+                reply = client.SendPacket(req)
+                latency = client.last_latency
+                hist.record(latency)
             label = "Accept" if reply.code == pyrad.packet.AccessAccept else "Reject"
             console.print(
                 f"\n[bold green]Server alive[/] via auth probe  "
-                f"(Access-{label}, {latency_ms:.0f} ms)"
+                f"(Access-{label}, {format_latency(latency)})"
             )
+            if hist.count > 1:
+                console.print(latency_table(hist))
             raise typer.Exit(code=0)
         except typer.Exit:
             raise
         except Exception as exc:
             console.print(f"\n[bold red]Server unreachable:[/] {exc}")
+            if hist.count:
+                console.print(latency_table(hist))
             raise typer.Exit(code=1)
+
+
+def _status_records(out: Emitter, config, count: int, probe_user: str, probe_pass: str) -> None:
+    """``--output``: the same Status-Server-then-auth-probe order, one record per probe."""
+    answered = fallback = False
+
+    async def probe(session):
+        nonlocal answered, fallback
+        if not fallback:
+            result = await session.status()
+            if result.code is not None or answered:
+                answered = True
+                return result
+            fallback = True  # never answered: Status-Server unsupported, probe with auth
+        return await session.auth(probe_user, probe_pass)
+
+    try:
+        results = send_and_emit(out, config, count, probe, timeout=DEFAULT_DEADLINE)
+    except OSError as exc:
+        out.emit(error_record("status", exc))
+        raise typer.Exit(code=1)
+    raise typer.Exit(code=0 if all(r.code is not None for r in results) else 1)
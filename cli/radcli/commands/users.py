@@ -0,0 +1,316 @@
+"""users — Generate large users files and measure auth latency against user count."""
+
+import asyncio
+import multiprocessing
+import queue
+import shlex
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Annotated, Optional
+
+import pyrad.packet
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from radcli.client import _find_dictionary, make_client
+from radcli.config import RadiusConfig, resolve_config
+from radcli.corpus import CorpusWriter, read_csv_credentials
+from radcli.dictcache import load_dictionary
+from radcli.histogram import format_latency
+from radcli.loadgen import run_bench
+from radcli.responder import _ITEM
+from radcli.template import PacketTemplate
+from radcli.usergen import (
+    DEFAULT_REPLY,
+    UserSpec,
+    credential_encoder,
+    serve_stand_in,
+    wait_for_user,
+    write_credentials,
+    write_users_file,
+)
+
+console = Console(stderr=True)
+
+users_app = typer.Typer()
+
+
+@users_app.callback()
+def users() -> None:
+    """Generate synthetic users files and credential corpora for scaling tests."""
+
+
+def _spec(count: int, seed: int, prefix: str, reply: Optional[list[str]]) -> UserSpec:
+    """Build the spec, checking every reply item against the dictionary first."""
+    items = tuple(reply) if reply is not None else DEFAULT_REPLY
+    dictionary = load_dictionary(_find_dictionary())
+    for item in items:
+        match = _ITEM.fullmatch(item.strip())
+        if match is None:
+            console.print(f'[bold red]Error:[/] reply item {item!r} is not "Attribute op value"')
+            raise typer.Exit(code=2)
+        if match.group(1) not in dictionary.attributes:
+            console.print(f"[bold red]Error:[/] attribute {match.group(1)!r} is not in the dictionary")
+            raise typer.Exit(code=2)
+    return UserSpec(count, seed=seed, prefix=prefix, reply=items)
+
+
+_REPLY_HELP = 'Reply item for every user, e.g. "Framed-Protocol := PPP" ({user}/{index} expand; repeatable)'
+
+
+@users_app.command("generate")
+def generate(
+    count: Annotated[int, typer.Option("--count", "-n", min=0, help="Number of users")] = 1000,
+    output: Annotated[
+        Optional[Path],
+        typer.Option("--output", "-o", help="Users file to write (default: stdout; '-' to skip)"),
+    ] = None,
+    credentials: Annotated[
+        Optional[Path],
+        typer.Option("--credentials", "-c", help="Also write the username,password CSV corpus here"),
+    ] = None,
+    corpus: Annotated[
+        Optional[Path],
+        typer.Option("--corpus", help="Also write a binary corpus for `radcli bench --corpus`"),
+    ] = None,
+    seed: Annotated[int, typer.Option("--seed", help="Seed for the derived passwords")] = 0,
+    prefix: Annotated[str, typer.Option("--prefix", help="Username prefix")] = "user",
+    reply: Annotated[
+        Optional[list[str]],
+        typer.Option("--reply", "-r", help=_REPLY_HELP),
+    ] = None,
+) -> None:
+    """Stream COUNT users in the users-file format, with a matching credential corpus."""
+    spec = _spec(count, seed, prefix, reply)
+    if output is not None and str(output) == "-" and credentials is None and corpus is None:
+        console.print("[bold red]Error:[/] nothing to write (--output - without --credentials or --corpus)")
+        raise typer.Exit(code=2)
+    start = time.monotonic()
+    creds = open(credentials, "w", encoding="utf-8") if credentials else None
+    try:
+        if output is not None and str(output) == "-":
+            if creds is not None:
+                write_credentials(spec, creds)
+        elif output is None:
+            write_users_file(spec, sys.stdout, creds)
+        else:
+            with open(output, "w", encoding="utf-8") as out:
+                write_users_file(spec, out, creds)
+    finally:
+        if creds is not None:
+            creds.close()
+    if corpus is not None:
+        with CorpusWriter(corpus) as writer:
+            writer.extend((user.encode(), password.encode()) for user, password in spec.credentials())
+    console.print(f"[dim]{count:,} users (seed {seed}) in {time.monotonic() - start:.2f} s[/]")
+
+
+@users_app.command("corpus")
+def convert_corpus(
+    source: Annotated[
+        Path,
+        typer.Argument(exists=True, dir_okay=False, help="username,password CSV (e.g. from generate --credentials)"),
+    ],
+    output: Annotated[Path, typer.Option("--output", "-o", help="Binary corpus to write")],
+) -> None:
+    """Convert a username,password CSV into a binary corpus for `radcli bench --corpus`."""
+    start = time.monotonic()
+    try:
+        with open(source, encoding="utf-8") as lines, CorpusWriter(output) as writer:
+            writer.extend(read_csv_credentials(lines))
+    except ValueError as exc:
+        console.print(f"[bold red]Error:[/] {source}: {exc}")
+        raise typer.Exit(code=2)
+    console.print(f"[dim]{writer.count:,} credentials → {output} in {time.monotonic() - start:.2f} s[/]")
+
+
+def _parse_sizes(text: str) -> list[int]:
+    multipliers = {"k": 1_000, "m": 1_000_000}
+    sizes = []
+    for part in text.split(","):
+        part = part.strip().lower()
+        scale = multipliers.get(part[-1:], 1)
+        try:
+            sizes.append(int(float(part[:-1] if scale > 1 else part) * scale))
+        except ValueError:
+            raise typer.BadParameter(f"{part!r} is not a user count", param_hint="--sizes") from None
+    if any(size < 1 for size in sizes):
+        raise typer.BadParameter("user counts must be positive", param_hint="--sizes")
+    return sorted(sizes)
+
+
+def _reload_command(template: str, path: Path, count: int) -> str:
+    """Fill ``--reload``'s {path} (shell-quoted) and {count}."""
+    try:
+        return template.format(path=shlex.quote(str(path)), count=count)
+    except KeyError as exc:
+        problem = f"unknown placeholder {{{exc.args[0]}}}"
+    except (IndexError, ValueError) as exc:
+        problem = str(exc)
+    raise typer.BadParameter(
+        f"{problem} in {template!r}; only {{path}} and {{count}} are filled in, write literal braces as {{{{ }}}}",
+        param_hint="--reload",
+    )
+
+
+class _StandIn:
+    """A stand-in responder in a child process, so it doesn't share a core's GIL with the bench."""
+
+    def __init__(self, path: Path, secret: bytes, load_timeout: float) -> None:
+        context = multiprocessing.get_context("spawn")
+        ready = context.Queue()
+        self.process = context.Process(
+            target=serve_stand_in, args=(str(path), "127.0.0.1", secret, ready), daemon=True
+        )
+        self.process.start()
+        try:
+            port = ready.get(timeout=load_timeout)
+        except queue.Empty:
+            self.close()
+            raise RuntimeError(f"stand-in did not load {path} within {load_timeout:g}s") from None
+        if isinstance(port, str):
+            self.close()
+            raise RuntimeError(port)
+        self.port = port
+
+    def close(self) -> None:
+        self.process.terminate()
+        self.process.join()
+
+
+@users_app.command("bench")
+def bench(
+    ctx: typer.Context,
+    sizes: Annotated[
+        str,
+        typer.Option("--sizes", help="User counts to compare, e.g. 1k,100k,1m"),
+    ] = "1k,100k,1m",
+    reload: Annotated[
+        Optional[str],
+        typer.Option(
+            "--reload",
+            help="Shell command that installs {path} (shell-quoted) on the target server and reloads it; "
+            "{count} is the user count (default: run the stand-in responder locally)",
+        ),
+    ] = None,
+    ready_timeout: Annotated[
+        float,
+        typer.Option("--ready-timeout", min=1.0, help="Seconds to wait for the server to serve a new file"),
+    ] = 300.0,
+    rate: Annotated[float, typer.Option("--rate", "-r", min=0.001, help="Open-loop requests/s per size")] = 500.0,
+    duration: Annotated[float, typer.Option("--duration", "-d", min=0.1, help="Seconds per size")] = 10.0,
+    timeout: Annotated[float, typer.Option("--timeout", help="Seconds to wait for each reply")] = 5.0,
+    seed: Annotated[int, typer.Option("--seed", help="Seed for passwords and the users sampled")] = 0,
+    prefix: Annotated[str, typer.Option("--prefix", help="Username prefix")] = "user",
+    reply: Annotated[
+        Optional[list[str]],
+        typer.Option("--reply", help=_REPLY_HELP),
+    ] = None,
+    workdir: Annotated[
+        Optional[Path],
+        typer.Option("--workdir", file_okay=False, help="Keep the generated users files here (default: a temp dir)"),
+    ] = None,
+) -> None:
+    """Measure auth latency as the users file grows, sampling users uniformly."""
+    counts = _parse_sizes(sizes)
+    if reload is not None:
+        _reload_command(reload, Path("users"), 0)  # reject a bad template before writing anything
+    config = resolve_config(ctx)
+    specs = [_spec(count, seed, prefix, reply) for count in counts]
+    directory = workdir or Path(tempfile.mkdtemp(prefix="radcli-users-"))
+    directory.mkdir(parents=True, exist_ok=True)
+
+    table = Table(title="Auth Latency vs Users", show_header=True, header_style="bold cyan")
+    for column in ("Users", "File", "Ready", "Accept", "Reject", "Timeouts", "Rate", "p50", "p99"):
+        table.add_column(column, justify="right")
+    try:
+        for spec in specs:
+            row = _bench_size(config, spec, directory, reload, ready_timeout, rate, duration, timeout, seed)
+            table.add_row(*row)
+            console.print(f"[dim]{spec.count:,} users: " + "  ".join(row[2:]) + "[/]")
+    except RuntimeError as exc:
+        console.print(f"[bold red]Error:[/] {exc}")
+        raise typer.Exit(code=2)
+    finally:
+        if workdir is None:
+            shutil.rmtree(directory, ignore_errors=True)
+    Console().print(table)
+
+
+def _bench_size(
+    config: RadiusConfig,
+    spec: UserSpec,
+    directory: Path,
+    reload: str | None,
+    ready_timeout: float,
+    rate: float,
+    duration: float,
+    timeout: float,
+    seed: int,
+) -> list[str]:
+    path = directory / f"users-{spec.count}"
+    with console.status(f"Writing {spec.count:,} users to {path}..."):
+        with open(path, "w", encoding="utf-8") as out:
+            write_users_file(spec, out)
+
+    stand_in = None
+    start = time.monotonic()
+    with console.status(f"Loading {spec.count:,} users..."):
+        if reload is None:
+            stand_in = _StandIn(path, config.secret.encode(), ready_timeout)
+            config = RadiusConfig("127.0.0.1", config.secret, stand_in.port, stand_in.port)
+        else:
+            command = _reload_command(reload, path, spec.count)
+            done = subprocess.run(command, shell=True, capture_output=True, text=True)
+            if done.returncode != 0:
+                raise RuntimeError(f"--reload exited {done.returncode}: {done.stderr.strip() or command}")
+    try:
+        client = make_client(config)
+        template = PacketTemplate(client, NAS_Identifier="radcli")
+        last = spec.count - 1
+        waited = asyncio.run(
+            wait_for_user(
+                config.server,
+                config.auth_port,
+                template,
+                spec.username(last),
+                spec.password(last),
+                deadline=max(ready_timeout - (time.monotonic() - start), 1.0),
+            )
+        )
+        if waited is None:
+            raise RuntimeError(f"{spec.username(last)} was never accepted; is the {spec.count:,}-user file live?")
+        ready = time.monotonic() - start
+        with console.status(f"Benchmarking {spec.count:,} users at {rate:,.0f} req/s..."):
+            result = asyncio.run(
+                run_bench(
+                    client,
+                    config.auth_port,
+                    credential_encoder(spec, template, seed=seed),
+                    duration=duration,
+                    rate=rate,
+                    timeout=timeout,
+                )
+            )
+    finally:
+        if stand_in is not None:
+            stand_in.close()
+
+    accepts = result.codes[pyrad.packet.AccessAccept]
+    rejects = result.codes[pyrad.packet.AccessReject]
+    latency = [format_latency(result.percentile(q)) if result.completed else "-" for q in (50, 99)]
+    return [
+        f"{spec.count:,}",
+        f"{path.stat().st_size / 1e6:,.0f}MB",
+        f"{ready:.1f} s",
+        f"{accepts:,}",
+        f"[red]{rejects:,}[/]" if rejects else "0",
+        f"[red]{result.timeouts:,}[/]" if result.timeouts else "0",
+        f"{result.rate:,.0f}/s",
+        *latency,
+    ]
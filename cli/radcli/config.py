@@ -1,11 +1,10 @@
 """Configuration loading: profiles.toml → .env file → environment variables → CLI overrides."""
 
+import os
 import tomllib
 from dataclasses import dataclass
 from pathlib import Path
-
-from dotenv import load_dotenv
-import os
+from typing import NoReturn
 
 
 @dataclass
@@ -30,24 +29,36 @@ def load_profiles() -> dict[str, dict]:
         return tomllib.load(f)
 
 
-def get_profile(name: str) -> dict:
-    """Load a single profile by name. Raises typer.Exit on error."""
-    import typer
-    from radcli.display import console
+class ProfileError(LookupError):
+    """The selected profile isn't in profiles.toml (or there is no profiles.toml)."""
 
+
+def find_profile(name: str) -> dict:
+    """Load a single profile by name. Raises ProfileError when there isn't one."""
     profiles = load_profiles()
     if not profiles:
-        console.print(f"[bold red]Error:[/] profiles.toml not found in {Path.cwd()}")
-        console.print("  cp profiles.toml.example profiles.toml")
-        raise typer.Exit(code=1)
+        raise ProfileError(f"profiles.toml not found in {Path.cwd()} (cp profiles.toml.example profiles.toml)")
     if name not in profiles:
-        available = ", ".join(profiles.keys())
-        console.print(f"[bold red]Error:[/] profile [bold]{name}[/] not found")
-        console.print(f"  Available: {available}")
-        raise typer.Exit(code=1)
+        raise ProfileError(f"profile {name} not found (available: {', '.join(profiles)})")
     return profiles[name]
 
 
+def _exit_with(exc: ProfileError) -> NoReturn:
+    import typer
+    from rich.console import Console
+
+    Console().print(f"[bold red]Error:[/] {exc}", highlight=False)
+    raise typer.Exit(code=1)
+
+
+def get_profile(name: str) -> dict:
+    """Load a single profile by name. Prints the problem and raises typer.Exit on error."""
+    try:
+        return find_profile(name)
+    except ProfileError as exc:
+        _exit_with(exc)
+
+
 def save_profile(name: str, profile: dict) -> Path:
     """Write or update a single profile in profiles.toml. Returns the file path."""
     path = _profiles_path()
@@ -77,7 +88,12 @@ def load_config(
     auth_port: int | None = None,
     acct_port: int | None = None,
 ) -> RadiusConfig:
-    """Build config with precedence: CLI flags > .env/env vars > profile > defaults."""
+    """Build config with precedence: CLI flags > .env/env vars > profile > defaults.
+
+    Raises ProfileError for an unknown ``profile``.
+    """
+    from dotenv import load_dotenv
+
     # Load .env from cli/ directory (where radcli is run)
     load_dotenv(Path.cwd() / ".env")
 
@@ -89,7 +105,7 @@ def load_config(
 
     # Layer 2: profile values (if selected)
     if profile:
-        p = get_profile(profile)
+        p = find_profile(profile)
         cfg_server = p.get("server", cfg_server)
         cfg_secret = p.get("secret", cfg_secret)
         cfg_auth_port = p.get("auth_port", cfg_auth_port)
@@ -108,3 +124,19 @@ def load_config(
         auth_port=auth_port or cfg_auth_port,
         acct_port=acct_port or cfg_acct_port,
     )
+
+
+def resolve_config(ctx) -> RadiusConfig:
+    """Return the RadiusConfig for this invocation, building it on first use.
+
+    The top-level callback only records the global CLI flags; commands that
+    never send a packet (``profile``, ``--help``) skip .env and profile
+    loading entirely.
+    """
+    obj = ctx.ensure_object(dict)
+    if "config" not in obj:
+        try:
+            obj["config"] = load_config(**obj.get("overrides", {}))
+        except ProfileError as exc:
+            _exit_with(exc)
+    return obj["config"]
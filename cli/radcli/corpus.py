@@ -0,0 +1,273 @@
+"""Memory-mapped credential corpus and the samplers that draw from it.
+
+A load test that always sends ``testrunner/run123`` hits one users-file
+entry and the same caches on every request, which flatters the server.
+A corpus holds millions of credentials in one binary file. It is
+``mmap``'d, not loaded: a credential is two offset reads and a slice,
+and worker processes share the pages through the page cache. Layout,
+little-endian::
+
+    header   b"RADCORP1", u64 count, u64 index offset
+    records  u8 len(username), username, password    (back to back)
+    index    u64 start of each record, then one for the end of the last
+
+Samplers turn a random stream into record indices: ``uniform``,
+``zipf[:S]`` (rank-frequency exponent S, default 1.0) or ``hot:K[:P]``
+(K hot users get share P of the traffic, default 0.9). Zipf ranks and hot
+users are spread over the file by a fixed permutation, so the popular
+credentials are not just the first ones. ``CorpusEncoder`` can also mix
+in wrong passwords and unknown users, so the reject path gets traffic
+the way it does in production.
+"""
+
+import math
+import mmap
+import os
+import random
+import struct
+import tempfile
+from collections.abc import Callable, Iterable
+from pathlib import Path
+
+from radcli.recorder import FLAG_BAD_PASSWORD, FLAG_UNKNOWN_USER
+from radcli.template import PacketTemplate
+
+MAGIC = b"RADCORP1"
+_HEADER = struct.Struct("<8sQQ")
+_OFFSET = struct.Struct("<Q")
+_SPAN = struct.Struct("<QQ")
+
+# Odd multiplier for the rank → record permutation (Knuth's golden ratio).
+_SCATTER = 2654435761
+
+
+class CorpusWriter:
+    """Append credentials to a corpus file in constant memory.
+
+    Record offsets go to a temporary spool file and are copied after the
+    records on ``close``. Records are written to a temporary file next to
+    ``path`` that only replaces it once ``close`` has written the index;
+    leaving a ``with`` block on an exception, or calling ``abort``,
+    removes it, so a failed run never leaves a short corpus behind.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        self.count = 0
+        fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=f".{self.path.name}.", suffix=".tmp")
+        self._tmp = Path(tmp)
+        self._out = os.fdopen(fd, "wb")
+        self._out.write(_HEADER.pack(MAGIC, 0, 0))
+        self._position = _HEADER.size
+        self._offsets = tempfile.TemporaryFile()
+        self._pending: list[bytes] = []
+
+    def add(self, username: bytes, password: bytes) -> None:
+        if not 0 < len(username) <= 253 or len(password) > 128:
+            raise ValueError(f"credential for {username[:32]!r} is out of range for RADIUS")
+        record = bytes([len(username)]) + username + password
+        self._pending.append(_OFFSET.pack(self._position))
+        self._out.write(record)
+        self._position += len(record)
+        self.count += 1
+        if len(self._pending) >= 8192:
+            self._offsets.write(b"".join(self._pending))
+            self._pending.clear()
+
+    def extend(self, credentials: Iterable[tuple[bytes, bytes]]) -> None:
+        for username, password in credentials:
+            self.add(username, password)
+
+    def close(self) -> None:
+        self._offsets.write(b"".join(self._pending) + _OFFSET.pack(self._position))
+        self._pending.clear()
+        padding = -self._position % 8
+        self._out.write(bytes(padding))
+        index_at = self._position + padding
+        self._offsets.seek(0)
+        while chunk := self._offsets.read(1 << 20):
+            self._out.write(chunk)
+        self._offsets.close()
+        self._out.seek(0)
+        self._out.write(_HEADER.pack(MAGIC, self.count, index_at))
+        self._out.close()
+        os.replace(self._tmp, self.path)
+
+    def abort(self) -> None:
+        """Discard everything written so far; ``path`` is left untouched."""
+        self._offsets.close()
+        self._out.close()
+        self._tmp.unlink(missing_ok=True)
+
+    def __enter__(self) -> "CorpusWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is not None:
+            self.abort()
+            return
+        try:
+            self.close()
+        except BaseException:
+            self.abort()
+            raise
+
+
+class Corpus:
+    """Read-only view of a corpus file; nothing is decoded until asked for."""
+
+    def __init__(self, path: str | Path) -> None:
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            if size < _HEADER.size:
+                raise ValueError(f"{self.path} is not a radcli corpus (too short)")
+            self._map = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, self.count, self._index = _HEADER.unpack_from(self._map, 0)
+        if magic != MAGIC or self._index + 8 * (self.count + 1) > size:
+            self._map.close()
+            raise ValueError(f"{self.path} is not a radcli corpus (bad header)")
+
+    def __len__(self) -> int:
+        return self.count
+
+    def __getitem__(self, index: int) -> tuple[bytes, bytes]:
+        """``(username, password)`` of record ``index``."""
+        if not 0 <= index < self.count:
+            raise IndexError(index)
+        start, end = _SPAN.unpack_from(self._map, self._index + 8 * index)
+        name_end = start + 1 + self._map[start]
+        return self._map[start + 1 : name_end], self._map[name_end:end]
+
+    def close(self) -> None:
+        self._map.close()
+
+
+def read_csv_credentials(lines: Iterable[str]) -> Iterable[tuple[bytes, bytes]]:
+    """``(username, password)`` from ``username,password`` lines (header optional)."""
+    for number, line in enumerate(lines):
+        line = line.rstrip("\r\n")
+        if not line or (number == 0 and line == "username,password"):
+            continue
+        username, sep, password = line.partition(",")
+        if not sep:
+            raise ValueError(f"line {number + 1}: expected username,password")
+        yield username.encode(), password.encode()
+
+
+class _Zipf:
+    """Zipf ranks 1..n in O(1) per draw (rejection-inversion, Hörmann & Derflinger 1996)."""
+
+    def __init__(self, n: int, exponent: float, random_: Callable[[], float]) -> None:
+        if exponent <= 0:
+            raise ValueError("zipf exponent must be > 0")
+        self.n, self.s, self.random = n, exponent, random_
+        self._x1 = self._h_integral(1.5) - 1.0
+        self._xn = self._h_integral(n + 0.5)
+        self._cut = 2.0 - self._h_integral_inverse(self._h_integral(2.5) - self._h(2.0))
+
+    def _h(self, x: float) -> float:
+        return math.exp(-self.s * math.log(x))
+
+    def _h_integral(self, x: float) -> float:
+        log_x = math.log(x)
+        t = (1.0 - self.s) * log_x
+        return (math.expm1(t) / t if abs(t) > 1e-8 else 1 + t * 0.5 * (1 + t / 3 * (1 + 0.25 * t))) * log_x
+
+    def _h_integral_inverse(self, x: float) -> float:
+        t = max(x * (1.0 - self.s), -1.0)
+        return math.exp((math.log1p(t) / t if abs(t) > 1e-8 else 1 - t * (0.5 - t * (1 / 3 - 0.25 * t))) * x)
+
+    def __call__(self) -> int:
+        while True:
+            u = self._xn + self.random() * (self._x1 - self._xn)
+            x = self._h_integral_inverse(u)
+            k = min(max(int(x + 0.5), 1), self.n)
+            if k - x <= self._cut or u >= self._h_integral(k + 0.5) - self._h(k):
+                return k
+
+
+def _scatter(count: int) -> Callable[[int], int]:
+    """A fixed permutation of ``range(count)``: popular ranks land all over the file."""
+    step = _SCATTER
+    while math.gcd(step, count) != 1:
+        step += 2
+    return lambda rank: (rank * step) % count
+
+
+def make_sampler(spec: str, count: int, random_: Callable[[], float]) -> Callable[[], int]:
+    """Parse ``uniform``, ``zipf[:S]`` or ``hot:K[:P]`` into a draw of record indices."""
+    if count < 1:
+        raise ValueError("cannot sample from an empty corpus")
+    kind, _, args = spec.partition(":")
+    params = args.split(":") if args else []
+    try:
+        numbers = [float(p) for p in params]
+    except ValueError:
+        raise ValueError(f"malformed sampler {spec!r}") from None
+    scatter = _scatter(count)
+    if kind == "uniform" and not numbers:
+        return lambda: int(random_() * count)
+    if kind == "zipf" and len(numbers) <= 1:
+        ranks = _Zipf(count, numbers[0] if numbers else 1.0, random_)
+        return lambda: scatter(ranks() - 1)
+    if kind == "hot" and 1 <= len(numbers) <= 2:
+        hot = int(numbers[0])
+        share = numbers[1] if len(numbers) == 2 else 0.9
+        if not 1 <= hot <= count or not 0 <= share <= 1:
+            raise ValueError(f"hot set needs 1 <= K <= {count:,} users and 0 <= P <= 1")
+
+        def draw() -> int:
+            if random_() < share:
+                return scatter(int(random_() * hot))
+            return int(random_() * count)
+
+        return draw
+    raise ValueError(f"unknown sampler {spec!r} (uniform, zipf[:S], hot:K[:P])")
+
+
+class CorpusEncoder:
+    """``encode(identifier)`` for ``radcli.loadgen``: a PAP request for a sampled credential.
+
+    A ``bad_password`` share keeps the sampled username and sends a wrong
+    password. An ``unknown_user`` share sends a username outside the
+    corpus. Both should be rejected. ``last`` is the ``(record, flags)``
+    of the most recent request, which makes this a
+    ``radcli.loadgen.TrackedEncoder``.
+    """
+
+    def __init__(
+        self,
+        corpus: Corpus,
+        template: PacketTemplate,
+        *,
+        sampling: str = "uniform",
+        bad_password: float = 0.0,
+        unknown_user: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        if bad_password < 0 or unknown_user < 0 or bad_password + unknown_user > 1:
+            raise ValueError("bad-password and unknown-user ratios must be >= 0 and add up to at most 1")
+        self.corpus = corpus
+        self.template = template
+        self._rng = random.Random(seed)
+        self._pick = make_sampler(sampling, len(corpus), self._rng.random)
+        self._bad_password = bad_password
+        self._reject_at = bad_password + unknown_user
+        self.last: tuple[int, int] = (-1, 0)
+
+    def __call__(self, ident: int) -> bytes:
+        index = self._pick()
+        username, password = self.corpus[index]
+        flags = 0
+        if self._reject_at:
+            roll = self._rng.random()
+            if roll < self._bad_password:
+                password = b"!" + password
+                flags = FLAG_BAD_PASSWORD
+            elif roll < self._reject_at:
+                username = b"unknown-%d" % self._rng.getrandbits(48)
+                index, flags = -1, FLAG_UNKNOWN_USER
+        self.last = (index, flags)
+        return self.template.encode(ident, username, password)
+
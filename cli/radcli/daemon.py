@@ -0,0 +1,184 @@
+"""Local Unix-socket API over a SessionPool.
+
+The protocol is newline-delimited JSON. Each request is one object with an
+``op`` — ``auth``, ``acct``, ``status``, ``ping`` or ``shutdown`` — plus
+that op's arguments (the same names as the CLI options: ``user``,
+``password``, ``type``, ``session_id``, ``session_time``), an optional
+``profile`` and an optional ``id`` that is echoed back. Each request gets
+exactly one JSON line in reply. Requests on one connection are handled
+concurrently, so replies can come back out of order; match them on ``id``.
+
+Scripts that want the lowest overhead can skip Python entirely::
+
+    echo '{"op":"auth","user":"testrunner","password":"run123"}' \\
+        | socat - UNIX-CONNECT:"$XDG_RUNTIME_DIR/radcli.sock"
+"""
+
+import json
+import os
+import socket
+import stat
+import time
+from pathlib import Path
+
+
+def _fallback_dir() -> Path:
+    return Path("/tmp") / f"radcli-{os.getuid()}"
+
+
+def default_socket_path() -> Path:
+    """``$XDG_RUNTIME_DIR/radcli.sock``, else a socket in a per-user 0700 directory in /tmp."""
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime:
+        return Path(runtime) / "radcli.sock"
+    return _fallback_dir() / "radcli.sock"
+
+
+def _is_own_socket(st: os.stat_result) -> bool:
+    return stat.S_ISSOCK(st.st_mode) and st.st_uid == os.getuid()
+
+
+def _private_dir(directory: Path) -> None:
+    """Create ``directory`` owner-only, or check that an existing one is."""
+    try:
+        directory.mkdir(mode=0o700)
+    except FileExistsError:
+        pass
+    st = directory.lstat()
+    if not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid() or st.st_mode & 0o077:
+        raise RuntimeError(f"{directory} must be a directory owned by you with mode 0700")
+
+
+def call(request: dict, path: str | os.PathLike | None = None, timeout: float = 30.0) -> dict:
+    """Send one request to a running daemon and return its decoded reply.
+
+    Refuses (``PermissionError``) to talk to anything but a socket owned by
+    the current user, so requests and their passwords can't be collected by
+    a socket another user planted at the path first.
+
+    Deliberately stdlib-only so thin clients don't import pyrad or asyncio.
+    """
+    path = str(path or default_socket_path())
+    if not _is_own_socket(os.lstat(path)):
+        raise PermissionError(f"{path} is not a socket owned by you")
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(path)
+        sock.sendall(json.dumps(request).encode() + b"\n")
+        buf = b""
+        while not buf.endswith(b"\n"):
+            chunk = sock.recv(65536)
+            if not chunk:
+                break
+            buf += chunk
+    if not buf:
+        raise ConnectionError("daemon closed the connection without replying")
+    return json.loads(buf)
+
+
+async def _dispatch(pool, request: dict) -> dict:
+    op = request.get("op")
+    if op == "ping":
+        return {
+            "uptime_s": round(time.monotonic() - pool.started, 1),
+            "profiles": [p or "default" for p in pool.profiles],
+        }
+
+    session = pool.get(request.get("profile"))
+    if op == "auth":
+        result = await session.auth(
+            request.get("user", "testrunner"),
+            request.get("password", "run123"),
+        )
+    elif op == "acct":
+        result = await session.acct(
+            request.get("type", "start"),
+            request.get("user", "testrunner"),
+            request.get("session_id"),
+            request.get("session_time"),
+        )
+    elif op == "status":
+        result = await session.status()
+    else:
+        raise ValueError(f"unknown op {op!r}")
+    return result.to_dict()
+
+
+async def serve(pool, path: str | os.PathLike | None = None) -> None:
+    """Serve ``pool`` on a Unix socket until a ``shutdown`` request arrives."""
+    import asyncio
+
+    path = Path(path or default_socket_path())
+    if path.parent == _fallback_dir():
+        _private_dir(path.parent)
+    try:
+        st = path.lstat()
+    except FileNotFoundError:
+        st = None
+    if st is not None:
+        # Refuse to steal the socket from a live daemon or to delete anything
+        # that isn't our own socket; clear a stale one.
+        if not _is_own_socket(st):
+            raise RuntimeError(f"{path} exists and is not a socket owned by you; not replacing it")
+        try:
+            call({"op": "ping"}, path, timeout=1.0)
+        except ValueError:
+            raise RuntimeError(f"something other than a radcli daemon is listening on {path}") from None
+        except OSError:
+            try:
+                path.unlink()
+            except OSError as exc:
+                raise RuntimeError(f"can't remove stale socket {path}: {exc}") from None
+        else:
+            raise RuntimeError(f"a radcli daemon is already listening on {path}")
+
+    stop = asyncio.Event()
+
+    async def answer(request: dict, writer: asyncio.StreamWriter) -> None:
+        try:
+            if request.get("op") == "shutdown":
+                response = {"ok": True}
+                stop.set()
+            else:
+                response = {"ok": True, **await _dispatch(pool, request)}
+        except Exception as exc:  # noqa: BLE001 — every failure goes back to the caller
+            response = {"ok": False, "error": str(exc) or type(exc).__name__}
+        if "id" in request:
+            response["id"] = request["id"]
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        tasks = set()
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("request must be a JSON object")
+                except ValueError as exc:
+                    writer.write(json.dumps({"ok": False, "error": f"bad request: {exc}"}).encode() + b"\n")
+                    continue
+                task = asyncio.create_task(answer(request, writer))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks)
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    # Create the socket owner-only: a chmod after bind would leave a window
+    # in which another local user could connect.
+    umask = os.umask(0o077)
+    try:
+        server = await asyncio.start_unix_server(handle, path=str(path))
+    finally:
+        os.umask(umask)
+    try:
+        async with server:
+            await stop.wait()
+    finally:
+        await pool.close()
+        path.unlink(missing_ok=True)
@@ -0,0 +1,145 @@
+"""Compiled RADIUS dictionary cache.
+
+Parsing the text dictionary with ``pyrad.dictionary.Dictionary`` on every
+invocation is wasted work when radcli is called thousands of times from
+scripts. ``load_dictionary`` stores the parsed lookup tables next to the
+source file and reuses them for as long as the source's path, mtime and
+size are unchanged; a stale or unreadable cache is simply rebuilt.
+
+The cache holds plain data only (names, codes, types and values written
+with ``marshal``), never pickled objects, and a cache file owned by
+another user or writable by group or others is ignored, so a planted
+file can't run code or swap attribute definitions.
+
+The key covers the top-level file only — edits to files pulled in with
+``$INCLUDE`` need a touch of the main dictionary (or ``clear_cache``).
+"""
+
+import hashlib
+import marshal
+import os
+import stat
+import tempfile
+from pathlib import Path
+
+import pyrad
+from pyrad.dictionary import Attribute, Dictionary
+
+# Bump when the stored layout changes so old caches are ignored.
+_FORMAT = 2
+
+
+def _cache_key(path: Path) -> tuple:
+    st = path.stat()
+    return (_FORMAT, pyrad.__version__, str(path), st.st_mtime_ns, st.st_size)
+
+
+def cache_path(path: str | os.PathLike) -> Path:
+    """Where the compiled cache for ``path`` lives.
+
+    Next to the source when that directory is writable, otherwise under
+    ``$XDG_CACHE_HOME/radcli`` (default ``~/.cache/radcli``).
+    """
+    source = Path(path).resolve()
+    if os.access(source.parent, os.W_OK):
+        return source.with_name(f".{source.name}.radcli-cache")
+    digest = hashlib.sha1(str(source).encode()).hexdigest()[:16]
+    base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "radcli"
+    return base / f"{source.name}-{digest}.radcli-cache"
+
+
+def _tables(dictionary: Dictionary) -> tuple:
+    """The parsed dictionary as plain marshal-able data."""
+    attributes = tuple(
+        (
+            a.name,
+            a.code,
+            a.type,
+            a.vendor,
+            a.encrypt,
+            a.has_tag,
+            a.is_sub_attribute,
+            a.values.forward,
+            a.sub_attributes,
+            a.parent.name if a.parent else None,
+        )
+        for a in dictionary.attributes.values()
+    )
+    return dictionary.vendors.forward, dictionary.attrindex.forward, attributes
+
+
+def _dictionary(tables: tuple) -> Dictionary:
+    """Rebuild a ``Dictionary`` from ``_tables`` output."""
+    vendors, attrindex, attributes = tables
+    dictionary = Dictionary()
+    for name, number in vendors.items():
+        dictionary.vendors.Add(name, number)
+    for name, index in attrindex.items():
+        dictionary.attrindex.Add(name, index)
+    parents = {}
+    for name, code, datatype, vendor, encrypt, has_tag, is_sub, values, subs, parent in attributes:
+        attribute = Attribute(name, code, datatype, is_sub, vendor, encrypt=encrypt, has_tag=has_tag)
+        # Fill the value map directly; BiDict.Add per value dominates the rebuild.
+        attribute.values.forward = values
+        attribute.values.backward = {value: key for key, value in values.items()}
+        attribute.sub_attributes = subs
+        dictionary.attributes[name] = attribute
+        if parent is not None:
+            parents[name] = parent
+    for name, parent in parents.items():
+        dictionary.attributes[name].parent = dictionary.attributes[parent]
+    return dictionary
+
+
+def _trusted(f) -> bool:
+    """Only load caches this user wrote and nobody else can rewrite."""
+    st = os.fstat(f.fileno())
+    return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+
+
+def _read(cache: Path, key: tuple) -> Dictionary | None:
+    try:
+        with open(cache, "rb") as f:
+            if not _trusted(f):
+                return None
+            stored_key, tables = marshal.loads(f.read())
+        if stored_key != key:
+            return None
+        return _dictionary(tables)
+    except (OSError, EOFError, KeyError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def _write(cache: Path, key: tuple, dictionary: Dictionary) -> None:
+    try:
+        cache.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp = tempfile.mkstemp(dir=cache.parent, prefix=cache.name, suffix=".tmp")
+    except OSError:
+        # A read-only checkout just means every run parses; never fail over it.
+        return
+    try:
+        with os.fdopen(fd, "wb") as f:
+            marshal.dump((key, _tables(dictionary)), f)
+        os.replace(tmp, cache)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+
+
+def load_dictionary(path: str | os.PathLike) -> Dictionary:
+    """Return the parsed dictionary at ``path``, from the compiled cache when fresh."""
+    source = Path(path).resolve()
+    key = _cache_key(source)
+    cache = cache_path(source)
+    dictionary = _read(cache, key)
+    if dictionary is None:
+        dictionary = Dictionary(str(source))
+        _write(cache, key, dictionary)
+    return dictionary
+
+
+def clear_cache(path: str | os.PathLike) -> None:
+    """Remove the compiled cache for ``path`` if there is one."""
+    try:
+        cache_path(path).unlink()
+    except FileNotFoundError:
+        pass
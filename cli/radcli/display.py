@@ -1,23 +1,31 @@
 """Rich output helpers — panels, tables, colored response codes."""
 
+from typing import TYPE_CHECKING
+
 import pyrad.packet
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from radcli.histogram import LatencyHistogram, format_latency
+from radcli.reply import LazyReply, code_name
+
+if TYPE_CHECKING:
+    from radcli.fleet import FleetResult
+
 console = Console()
 
 _CODE_STYLES = {
-    pyrad.packet.AccessAccept: ("Access-Accept", "bold green"),
-    pyrad.packet.AccessReject: ("Access-Reject", "bold red"),
-    pyrad.packet.AccessChallenge: ("Access-Challenge", "bold yellow"),
-    pyrad.packet.AccountingResponse: ("Accounting-Response", "bold green"),
+    pyrad.packet.AccessAccept: "bold green",
+    pyrad.packet.AccessReject: "bold red",
+    pyrad.packet.AccessChallenge: "bold yellow",
+    pyrad.packet.AccountingResponse: "bold green",
 }
 
 
 def code_label(code: int) -> tuple[str, str]:
     """Return (label, rich style) for a RADIUS response code."""
-    return _CODE_STYLES.get(code, (f"Unknown ({code})", "bold magenta"))
+    return code_name(code), _CODE_STYLES.get(code, "bold magenta")
 
 
 def connection_panel(server: str, port: int, secret: str) -> Panel:
@@ -27,16 +35,83 @@ def connection_panel(server: str, port: int, secret: str) -> Panel:
     return Panel(content, title="RADIUS Target", border_style="dim", expand=False)
 
 
-def attribute_table(reply: pyrad.packet.Packet) -> Table | None:
-    """Build a Rich Table of reply AVPs. Returns None if the reply has no attributes."""
+# Known attribute descriptions for richer output
+ATTR_NOTES = {
+    "Session-Timeout": "Max session duration (seconds)",
+    "Reply-Message": "Server greeting / message to client",
+    "Framed-Protocol": "L2 framing for the session",
+    "Framed-IP-Address": "IP assigned to client",
+    "Framed-IP-Netmask": "Subnet mask for client",
+    "Idle-Timeout": "Max idle time before disconnect (seconds)",
+    "Service-Type": "Type of service authorized",
+    "Class": "Opaque value echoed in accounting",
+}
+
+
+def attribute_table(
+    reply: pyrad.packet.Packet | LazyReply,
+    *,
+    title: str = "Reply Attributes",
+    notes: dict[str, str] | None = None,
+) -> Table | None:
+    """Build a Rich Table of reply AVPs. Returns None if the reply has no attributes.
+
+    ``reply`` is a pyrad packet or a ``LazyReply``; only the attributes are
+    decoded, on demand. With ``notes`` a third column annotates known
+    attributes (see ``ATTR_NOTES``).
+    """
     keys = list(reply.keys())
     if not keys:
         return None
-    table = Table(title="Reply Attributes", show_header=True, header_style="bold cyan")
+    table = Table(title=title, show_header=True, header_style="bold cyan")
     table.add_column("Attribute", style="bold")
     table.add_column("Value")
-    for key in sorted(keys):
+    if notes is not None:
+        table.add_column("Note", style="dim")
+    for key in sorted(keys, key=str):
         values = reply[key]
         for val in values:
-            table.add_row(str(key), str(val))
+            if notes is None:
+                table.add_row(str(key), str(val))
+            else:
+                table.add_row(str(key), str(val), notes.get(str(key), ""))
+    return table
+
+
+def latency_table(hist: LatencyHistogram, title: str = "Latency") -> Table:
+    """Build a Rich Table of latency percentiles from a histogram."""
+    table = Table(title=title, show_header=True, header_style="bold cyan")
+    table.add_column("Stat", style="bold")
+    table.add_column("Latency", justify="right")
+    table.add_row("samples", str(hist.count))
+    table.add_row("min", format_latency(hist.min))
+    table.add_row("mean", format_latency(hist.mean))
+    for label, value in hist.summary().items():
+        table.add_row(label, format_latency(value))
+    return table
+
+
+def fleet_table(results: list["FleetResult"], title: str = "Fleet") -> Table:
+    """One row per target: code, latency and error, failures highlighted."""
+    table = Table(title=title, show_header=True, header_style="bold cyan")
+    table.add_column("Profile", style="bold")
+    table.add_column("Server")
+    table.add_column("Result")
+    table.add_column("Latency", justify="right")
+    table.add_column("Via", style="dim")
+    table.add_column("Error", style="red")
+    for r in results:
+        if r.code is None:
+            result = "[bold red]unreachable[/]"
+        else:
+            label, style = code_label(r.code)
+            result = f"[{style}]{label}[/]"
+        table.add_row(
+            r.profile,
+            f"{r.server}:{r.port}",
+            result,
+            format_latency(r.latency) if r.latency is not None else "-",
+            r.method,
+            r.error,
+        )
     return table
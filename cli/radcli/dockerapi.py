@@ -0,0 +1,149 @@
+"""Minimal async Docker Engine API client over the local Unix socket.
+
+``radcli health`` only needs a few endpoints: container inspect, exec
+create/start/inspect. Forking the docker CLI for each of them costs
+hundreds of milliseconds per call. A tiny HTTP/1.1 client on
+``asyncio.open_unix_connection`` makes the same calls in a few
+milliseconds, and they can run concurrently. Each request opens its own
+connection with ``Connection: close``. The response is read to EOF, which
+also covers the raw exec output stream.
+"""
+
+import asyncio
+import json
+import os
+import struct
+from dataclasses import dataclass
+from urllib.parse import quote
+
+DEFAULT_SOCKET = "/var/run/docker.sock"
+API_VERSION = "v1.41"  # Docker 20.10+; lowest version with everything used here
+
+
+class DockerError(Exception):
+    """The Engine API answered with an error, or the socket is unreachable."""
+
+    def __init__(self, message: str, status: int | None = None) -> None:
+        super().__init__(message)
+        self.status = status
+
+
+def socket_path() -> str:
+    """The Engine socket from ``DOCKER_HOST`` (``unix://`` only), else the default."""
+    host = os.environ.get("DOCKER_HOST", "")
+    if host.startswith("unix://"):
+        return host[len("unix://") :]
+    return DEFAULT_SOCKET
+
+
+@dataclass
+class ExecResult:
+    exit_code: int
+    stdout: str
+    stderr: str
+
+
+def _dechunk(body: bytes) -> bytes:
+    out = bytearray()
+    pos = 0
+    while True:
+        eol = body.index(b"\r\n", pos)
+        size = int(body[pos:eol].split(b";")[0], 16)
+        if size == 0:
+            return bytes(out)
+        out += body[eol + 2 : eol + 2 + size]
+        pos = eol + 2 + size + 2
+
+
+def _demux(stream: bytes) -> tuple[bytes, bytes]:
+    """Split Docker's multiplexed exec stream (8-byte frame headers) into stdout and stderr."""
+    stdout, stderr = bytearray(), bytearray()
+    pos = 0
+    while pos + 8 <= len(stream):
+        kind, size = struct.unpack_from(">BxxxL", stream, pos)
+        frame = stream[pos + 8 : pos + 8 + size]
+        (stderr if kind == 2 else stdout).extend(frame)
+        pos += 8 + size
+    return bytes(stdout), bytes(stderr)
+
+
+def _json(data: bytes, what: str) -> dict:
+    """Decode a JSON object from an Engine API response body."""
+    try:
+        value = json.loads(data)
+    except ValueError:
+        raise DockerError(f"malformed JSON from {what}") from None
+    if not isinstance(value, dict):
+        raise DockerError(f"unexpected reply from {what}: {value!r:.80}")
+    return value
+
+
+def _field(data: bytes, key: str, what: str):
+    value = _json(data, what)
+    if key not in value:
+        raise DockerError(f"no {key} in reply from {what}")
+    return value[key]
+
+
+class DockerClient:
+    """Engine API calls used by ``radcli health``; every method is a coroutine."""
+
+    def __init__(self, path: str | None = None, *, timeout: float = 10.0) -> None:
+        self.path = path or socket_path()
+        self.timeout = timeout
+
+    async def _request(self, method: str, url: str, body: dict | None = None) -> tuple[int, bytes]:
+        payload = json.dumps(body).encode() if body is not None else b""
+        head = (
+            f"{method} /{API_VERSION}{url} HTTP/1.1\r\n"
+            "Host: docker\r\n"
+            "Connection: close\r\n"
+            "Content-Type: application/json\r\n"
+            f"Content-Length: {len(payload)}\r\n\r\n"
+        )
+        try:
+            reader, writer = await asyncio.wait_for(asyncio.open_unix_connection(self.path), self.timeout)
+        except (OSError, asyncio.TimeoutError) as exc:
+            raise DockerError(f"cannot reach Docker at {self.path}: {exc or 'timed out'}") from exc
+        try:
+            writer.write(head.encode() + payload)
+            await writer.drain()
+            raw = await asyncio.wait_for(reader.read(), self.timeout)
+        except asyncio.TimeoutError:
+            raise DockerError(f"{method} {url} timed out after {self.timeout:g}s") from None
+        finally:
+            writer.close()
+        header, _, data = raw.partition(b"\r\n\r\n")
+        lines = header.decode("latin-1").split("\r\n")
+        try:
+            if not lines[0].startswith("HTTP/"):
+                raise ValueError(lines[0])
+            status = int(lines[0].split()[1])
+            if any(line.lower().replace(" ", "") == "transfer-encoding:chunked" for line in lines[1:]):
+                data = _dechunk(data)
+        except (IndexError, ValueError):
+            reply = "a malformed HTTP reply" if raw else "an empty reply"
+            raise DockerError(f"{method} {url}: {reply} from {self.path}") from None
+        if status >= 400:
+            try:
+                message = _field(data, "message", f"{method} {url}")
+            except DockerError:
+                message = data.decode(errors="replace").strip()
+            raise DockerError(message, status)
+        return status, data
+
+    async def inspect(self, container: str) -> dict:
+        url = f"/containers/{quote(container)}/json"
+        _, data = await self._request("GET", url)
+        return _json(data, f"GET {url}")
+
+    async def exec(self, container: str, cmd: list[str]) -> ExecResult:
+        """Run ``cmd`` in ``container`` and wait for it, like ``docker exec``."""
+        url = f"/containers/{quote(container)}/exec"
+        _, data = await self._request("POST", url, {"Cmd": cmd, "AttachStdout": True, "AttachStderr": True})
+        exec_id = _field(data, "Id", f"POST {url}")
+        _, stream = await self._request("POST", f"/exec/{exec_id}/start", {"Detach": False, "Tty": False})
+        _, data = await self._request("GET", f"/exec/{exec_id}/json")
+        exit_code = _field(data, "ExitCode", f"GET /exec/{exec_id}/json")
+        stdout, stderr = _demux(stream)
+        return ExecResult(exit_code, stdout.decode(errors="replace"), stderr.decode(errors="replace"))
@@ -0,0 +1,325 @@
+"""asyncio UDP transport — many RADIUS requests in flight on one socket.
+
+pyrad's ``Client.SendPacket`` blocks until a reply (or timeout) arrives, so
+only one request is ever outstanding. ``RadiusEndpoint`` instead owns a
+single datagram socket and hands out the 256 RADIUS identifiers, matching
+each reply back to its request by identifier *and* Response Authenticator.
+
+With a ``RetryPolicy`` the endpoint also retransmits, following RFC 5080
+§2.2.1. The first timeout comes from a smoothed RTT estimate (RFC 6298),
+or from the policy's initial value before there are samples. Each
+retransmission doubles it, with ±``jitter``, so that many clients that
+lost packets together don't retransmit together. The caller's timeout is
+a deadline for the whole exchange, retransmissions included.
+Retransmissions resend the same bytes, with the same identifier and
+Request Authenticator, so the server's duplicate detection recognises
+them. Replies that arrive after their request is over are counted as
+duplicates (the request was already answered) or late (it had timed
+out), apart from strays that match nothing.
+"""
+
+import asyncio
+import random
+import time
+from collections import deque
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import pyrad.packet
+
+from radcli.reply import verify_reply
+
+# The Identifier field is one octet, so one source port can have at most
+# 256 requests outstanding at any instant.
+MAX_IDENTIFIERS = 256
+
+
+class EndpointClosed(Exception):
+    """Raised when sending on an endpoint whose socket has gone away."""
+
+
+@dataclass
+class Outcome:
+    """Result of one request/reply exchange."""
+
+    code: int | None  # None → no valid reply before the timeout
+    latency: float  # seconds from (intended) send to reply, or to giving up
+    raw: bytes | None = None  # verified reply bytes
+    retransmits: int = 0  # times the request was resent before the outcome
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retransmission timers in seconds (RFC 5080 IRT, MRT, MRC and RAND)."""
+
+    initial: float = 2.0  # timeout before the first RTT sample
+    maximum: float = 16.0  # cap on any single timeout
+    retransmits: int = 5  # resends after the first send
+    jitter: float = 0.1  # each timeout is scaled by 1 ± jitter
+    minimum: float = 0.2  # floor for the RTT-derived timeout
+
+    def __post_init__(self) -> None:
+        if not 0 < self.minimum <= self.initial <= self.maximum:
+            raise ValueError("retry timers need 0 < minimum <= initial <= maximum")
+        if self.retransmits < 0 or not 0 <= self.jitter < 1:
+            raise ValueError("retransmits must be >= 0 and jitter in [0, 1)")
+
+
+class RttEstimator:
+    """Smoothed round-trip time and retransmission timeout (RFC 6298).
+
+    Only replies to requests that were never retransmitted are sampled
+    (Karn's algorithm). Otherwise it is unclear which send the reply
+    answers.
+    """
+
+    def __init__(self, policy: RetryPolicy) -> None:
+        self.policy = policy
+        self.srtt: float | None = None
+        self.rttvar = 0.0
+
+    def sample(self, rtt: float) -> None:
+        if self.srtt is None:
+            self.srtt, self.rttvar = rtt, rtt / 2
+        else:
+            self.rttvar = 0.75 * self.rttvar + 0.25 * abs(self.srtt - rtt)
+            self.srtt = 0.875 * self.srtt + 0.125 * rtt
+
+    @property
+    def rto(self) -> float:
+        """The first timeout for the next request, before jitter."""
+        if self.srtt is None:
+            return self.policy.initial
+        return min(max(self.srtt + 4 * self.rttvar, self.policy.minimum), self.policy.maximum)
+
+
+class IdentifierPool:
+    """FIFO pool of free RADIUS identifiers.
+
+    Identifiers are recycled least-recently-used first, which keeps a late
+    reply to an abandoned request from landing on a fresh one that happens
+    to reuse the same identifier straight away.
+    """
+
+    def __init__(self, size: int = MAX_IDENTIFIERS) -> None:
+        self._free: deque[int] = deque(range(size))
+        self._available = asyncio.Semaphore(size)
+
+    async def acquire(self) -> int:
+        await self._available.acquire()
+        return self._free.popleft()
+
+    def release(self, ident: int) -> None:
+        self._free.append(ident)
+        self._available.release()
+
+
+class _RadiusProtocol(asyncio.DatagramProtocol):
+    """Dispatch incoming datagrams to the waiting request by identifier."""
+
+    def __init__(self, secret: bytes) -> None:
+        self.secret = secret
+        # identifier → (request authenticator, future)
+        self.pending: dict[int, tuple[bytes, asyncio.Future]] = {}
+        # identifier → (request authenticator, answered) of the last request
+        # that finished with it; replaced when the next one finishes
+        self.finished: dict[int, tuple[bytes, bool]] = {}
+        self.stray = 0  # replies that matched no request or failed verification
+        self.duplicates = 0  # further replies to a request already answered
+        self.late = 0  # replies to a request that had already timed out
+        self.transport: asyncio.DatagramTransport | None = None
+        self.closed: asyncio.Future = asyncio.get_running_loop().create_future()
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        if len(data) < 20:
+            self.stray += 1
+            return
+        entry = self.pending.get(data[1])
+        if entry is None:
+            self._after_the_fact(data)
+            return
+        authenticator, future = entry
+        if not verify_reply(data, authenticator, self.secret):
+            self._after_the_fact(data)  # maybe for the identifier's previous request
+        elif future.cancelled():
+            self.late += 1  # timed out, not yet cleaned up
+        elif future.done():
+            self.duplicates += 1  # answers to the original and a retransmission
+        else:
+            future.set_result(data)
+
+    def _after_the_fact(self, data: bytes) -> None:
+        entry = self.finished.get(data[1])
+        if entry is None or not verify_reply(data, entry[0], self.secret):
+            self.stray += 1
+        elif entry[1]:
+            self.duplicates += 1
+        else:
+            self.late += 1
+
+    def error_received(self, exc: Exception) -> None:
+        # ICMP port-unreachable and friends; the request will simply time out.
+        pass
+
+    def connection_lost(self, exc: Exception | None) -> None:
+        for _, future in self.pending.values():
+            if not future.done():
+                future.set_exception(EndpointClosed("socket closed"))
+        if not self.closed.done():
+            self.closed.set_result(None)
+
+
+class RadiusEndpoint:
+    """One connected UDP socket with up to 256 outstanding identifiers."""
+
+    def __init__(
+        self,
+        transport,
+        protocol: _RadiusProtocol,
+        window: int,
+        retry: RetryPolicy | None = None,
+        rtt: RttEstimator | None = None,
+    ) -> None:
+        self._transport = transport
+        self._protocol = protocol
+        self._ids = IdentifierPool(window)
+        self.retry = retry
+        self.rtt = rtt or (RttEstimator(retry) if retry else None)
+        self.retransmits = 0
+
+    @classmethod
+    async def open(
+        cls,
+        server: str,
+        port: int,
+        secret: bytes,
+        *,
+        window: int = MAX_IDENTIFIERS,
+        retry: RetryPolicy | None = None,
+        rtt: RttEstimator | None = None,
+    ) -> "RadiusEndpoint":
+        """Open a UDP socket connected to ``server:port``.
+
+        Without ``retry`` every request is sent once. Pass an ``rtt``
+        estimator to carry RTT samples over from an earlier endpoint.
+        """
+        if not 1 <= window <= MAX_IDENTIFIERS:
+            raise ValueError(f"window must be between 1 and {MAX_IDENTIFIERS}")
+        loop = asyncio.get_running_loop()
+        transport, protocol = await loop.create_datagram_endpoint(
+            lambda: _RadiusProtocol(secret),
+            remote_addr=(server, port),
+        )
+        return cls(transport, protocol, window, retry, rtt)
+
+    @property
+    def in_flight(self) -> int:
+        return len(self._protocol.pending)
+
+    @property
+    def stray_replies(self) -> int:
+        return self._protocol.stray
+
+    @property
+    def duplicate_replies(self) -> int:
+        return self._protocol.duplicates
+
+    @property
+    def late_replies(self) -> int:
+        return self._protocol.late
+
+    async def send(
+        self,
+        pkt: pyrad.packet.Packet,
+        timeout: float,
+        *,
+        intended: float | None = None,
+    ) -> Outcome:
+        """Send ``pkt`` and wait up to ``timeout`` seconds for its reply.
+
+        The packet's identifier is overwritten with one from the pool, so
+        callers can build packets with pyrad as usual. With a retry policy,
+        ``timeout`` is the deadline for all retransmissions together.
+        Open-loop callers pass the ``intended`` send time
+        (``time.perf_counter()`` clock) so that latency includes any time
+        spent waiting for a free identifier
+        — measuring from the actual send would hide exactly the queueing
+        delay a saturated server causes (coordinated omission).
+        """
+
+        def encode(ident: int) -> bytes:
+            pkt.id = ident
+            return pkt.RequestPacket()
+
+        return await self.send_encoded(encode, timeout, intended=intended)
+
+    async def send_encoded(
+        self,
+        encode: Callable[[int], bytes],
+        timeout: float,
+        *,
+        intended: float | None = None,
+    ) -> Outcome:
+        """Like ``send``, but ``encode(identifier)`` supplies the wire bytes.
+
+        This is the path for ``radcli.template.PacketTemplate``, which skips
+        building a pyrad packet per request.
+        """
+        ident = await self._ids.acquire()
+        protocol = self._protocol
+        answered = False
+        try:
+            raw = encode(ident)
+            future = asyncio.get_running_loop().create_future()
+            protocol.pending[ident] = (raw[4:20], future)
+            sent = time.perf_counter()
+            start = sent if intended is None else min(intended, sent)
+            if self._transport.is_closing():
+                raise EndpointClosed("socket closed")
+            self._transport.sendto(raw)
+            if self.retry is None:
+                try:
+                    reply = await asyncio.wait_for(future, timeout)
+                except asyncio.TimeoutError:
+                    return Outcome(code=None, latency=time.perf_counter() - start)
+                answered = True
+                return Outcome(code=reply[0], latency=time.perf_counter() - start, raw=reply)
+            reply, retransmits = await self._retransmit(raw, future, sent + timeout)
+            if reply is None:
+                return Outcome(code=None, latency=time.perf_counter() - start, retransmits=retransmits)
+            answered = True
+            if not retransmits:
+                self.rtt.sample(time.perf_counter() - sent)
+            return Outcome(code=reply[0], latency=time.perf_counter() - start, raw=reply, retransmits=retransmits)
+        finally:
+            entry = protocol.pending.pop(ident, None)
+            if entry is not None:
+                protocol.finished[ident] = (entry[0], answered)
+            self._ids.release(ident)
+
+    async def _retransmit(self, raw: bytes, future: asyncio.Future, deadline: float) -> tuple[bytes | None, int]:
+        """Wait for ``future``, resending ``raw`` on each backed-off timeout until ``deadline``."""
+        policy = self.retry
+        rto = self.rtt.rto
+        retransmits = 0
+        while True:
+            wait = min(rto * (1 + policy.jitter * random.uniform(-1, 1)), deadline - time.perf_counter())
+            if wait > 0:
+                await asyncio.wait((future,), timeout=wait)
+            if future.done():
+                return future.result(), retransmits
+            if retransmits >= policy.retransmits or time.perf_counter() >= deadline:
+                return None, retransmits
+            if self._transport.is_closing():
+                raise EndpointClosed("socket closed")
+            self._transport.sendto(raw)
+            retransmits += 1
+            self.retransmits += 1
+            rto = min(rto * 2, policy.maximum)
+
+    async def close(self) -> None:
+        self._transport.close()
+        await self._protocol.closed
@@ -0,0 +1,255 @@
+"""Fan one probe out to many servers at once (``--all-profiles`` / ``--profiles``).
+
+Every target from profiles.toml gets its own ``RadiusEndpoint`` and its own
+deadline, and all of them run concurrently on one event loop. A fleet of
+40 therefore finishes in about one timeout. Run one after another, each
+with pyrad's 3 × 5 s retries, it could take ten minutes. Only the profile
+values are used for each target: RADIUS_SERVER and the other environment
+overrides would otherwise point every profile at the same server.
+"""
+
+import asyncio
+import time
+import uuid
+from collections.abc import Callable
+from dataclasses import dataclass
+
+import pyrad.packet
+from pyrad.client import Client
+from pyrad.dictionary import Dictionary
+
+from radcli.config import RadiusConfig, get_profile, load_profiles
+from radcli.engine import Outcome, RadiusEndpoint
+from radcli.template import STATUS_SERVER_CODE, PacketTemplate
+
+# Share of the deadline Status-Server gets to itself before ``status`` also
+# sends the auth probe, for servers that silently drop Status-Server.
+_STATUS_HEAD_START = 0.2
+
+
+@dataclass
+class FleetResult:
+    profile: str
+    server: str
+    port: int
+    ok: bool
+    code: int | None = None
+    latency: float | None = None  # seconds; None when nothing came back
+    method: str = ""
+    error: str = ""
+
+    def to_dict(self) -> dict:
+        return {
+            "profile": self.profile,
+            "server": self.server,
+            "port": self.port,
+            "ok": self.ok,
+            "code": self.code,
+            "latency_ms": round(self.latency * 1000, 3) if self.latency is not None else None,
+            "method": self.method,
+            "error": self.error,
+        }
+
+
+def fleet_configs(names: list[str] | None = None) -> dict[str, RadiusConfig]:
+    """RadiusConfig per profile: all of them, or just ``names`` (in that order)."""
+    profiles = {name: get_profile(name) for name in names} if names is not None else load_profiles()
+    return {
+        name: RadiusConfig(
+            server=p.get("server", "localhost"),
+            secret=p.get("secret", "testing123"),
+            auth_port=p.get("auth_port", 1812),
+            acct_port=p.get("acct_port", 1813),
+        )
+        for name, p in profiles.items()
+    }
+
+
+async def _status(client: Client, endpoint: RadiusEndpoint, deadline: float, user: str, password: str):
+    status_template = PacketTemplate(client, STATUS_SERVER_CODE, NAS_Identifier="radcli")
+    status = asyncio.create_task(endpoint.send_encoded(status_template.encode, deadline))
+    await asyncio.wait({status}, timeout=deadline * _STATUS_HEAD_START)
+    if status.done() and status.result().code is not None:
+        return "Status-Server", status.result()
+
+    auth_template = PacketTemplate(client, NAS_Identifier="radcli")
+    auth = asyncio.create_task(
+        endpoint.send_encoded(
+            lambda ident: auth_template.encode(ident, user, password),
+            deadline * (1 - _STATUS_HEAD_START),
+        )
+    )
+    outcome = await status
+    if outcome.code is not None:
+        auth.cancel()
+        return "Status-Server", outcome
+    return "auth probe", await auth
+
+
+def _describe(exc: BaseException) -> str:
+    return str(exc) or type(exc).__name__
+
+
+async def _probe(
+    name: str,
+    config: RadiusConfig,
+    dictionary: Dictionary,
+    op: str,
+    deadline: float,
+    options: dict,
+) -> FleetResult:
+    port = config.acct_port if op == "acct" else config.auth_port
+    result = FleetResult(name, config.server, port, ok=False)
+    client = Client(
+        server=config.server,
+        secret=config.secret.encode(),
+        dict=dictionary,
+        authport=config.auth_port,
+        acctport=config.acct_port,
+    )
+    start = time.perf_counter()
+    try:
+        endpoint = await asyncio.wait_for(
+            RadiusEndpoint.open(config.server, port, client.secret, window=8), deadline
+        )
+    except asyncio.TimeoutError:
+        result.error = "name resolution timed out"
+        return result
+    except Exception as exc:
+        result.error = _describe(exc)
+        return result
+    try:
+        remaining = max(0.001, deadline - (time.perf_counter() - start))
+        outcome: Outcome
+        if op == "status":
+            result.method, outcome = await _status(
+                client, endpoint, remaining, options["probe_user"], options["probe_pass"]
+            )
+        elif op == "auth":
+            template = PacketTemplate(client, NAS_Identifier="radcli")
+            result.method = "Access-Request"
+            outcome = await endpoint.send_encoded(
+                lambda ident: template.encode(ident, options["user"], options["password"]), remaining
+            )
+        else:
+            pkt = client.CreateAcctPacket(code=pyrad.packet.AccountingRequest)
+            pkt["User-Name"] = options["user"]
+            pkt["Acct-Session-Id"] = options.get("session_id") or uuid.uuid4().hex[:16]
+            pkt["Acct-Status-Type"] = options["status_type"]
+            pkt["NAS-Identifier"] = "radcli"
+            pkt["NAS-IP-Address"] = "127.0.0.1"
+            result.method = "Accounting-Request"
+            outcome = await endpoint.send(pkt, remaining)
+    except Exception as exc:  # one bad target (closed socket, bad reply, bad option) mustn't sink the fleet
+        result.error = _describe(exc)
+        return result
+    finally:
+        await endpoint.close()
+
+    if outcome.code is None:
+        result.error = f"no reply within {deadline:g}s"
+        return result
+    result.code = outcome.code
+    result.latency = outcome.latency
+    if op == "auth":
+        result.ok = outcome.code == pyrad.packet.AccessAccept
+        if not result.ok:
+            result.error = "rejected" if outcome.code == pyrad.packet.AccessReject else ""
+    elif op == "acct":
+        result.ok = outcome.code == pyrad.packet.AccountingResponse
+    else:
+        result.ok = True  # any verified reply means the server is alive
+    return result
+
+
+async def run_fleet(
+    configs: dict[str, RadiusConfig],
+    dictionary: Dictionary,
+    op: str,
+    *,
+    deadline: float = 5.0,
+    on_result: Callable[[FleetResult], None] | None = None,
+    **options,
+) -> list[FleetResult]:
+    """Probe every target concurrently; results come back in ``configs`` order.
+
+    ``op`` is ``status``, ``auth`` or ``acct``. ``options`` carries the
+    per-op request fields (``user``/``password``, ``probe_user``/``probe_pass``,
+    ``status_type``/``session_id``).
+    """
+    if op not in ("status", "auth", "acct"):
+        raise ValueError(f"unknown fleet op {op!r}")
+
+    async def one(name: str, config: RadiusConfig) -> FleetResult:
+        result = await _probe(name, config, dictionary, op, deadline, options)
+        if on_result:
+            on_result(result)
+        return result
+
+    return list(await asyncio.gather(*(one(name, config) for name, config in configs.items())))
+
+
+def fan_out(op: str, all_profiles: bool, profiles: str | None, deadline: float, *, out=None, **options) -> None:
+    """Command entry point for ``--all-profiles`` / ``--profiles``: one table, aggregate exit code.
+
+    With ``out`` (a ``radcli.output.Emitter``) each target's result is
+    emitted as it finishes, then a summary, and nothing is rendered.
+    Exits 0 when every target passed, 1 when any failed.
+    """
+    import typer
+
+    from radcli.client import make_client
+
+    def fail(message: str):
+        if out is not None:
+            from radcli.output import error_record
+
+            out.emit(error_record(op, message))
+        else:
+            from rich.console import Console
+
+            Console().print(f"[bold red]Error:[/] {message}")
+        raise typer.Exit(code=2)
+
+    names = None if all_profiles else [name.strip() for name in (profiles or "").split(",") if name.strip()]
+    if names == []:
+        fail(f"--profiles {profiles!r} names no profiles (use --all-profiles for every one)")
+    configs = fleet_configs(names)
+    if not configs:
+        fail("no profiles to probe (see profiles.toml.example)")
+    dictionary = make_client(next(iter(configs.values()))).dict
+
+    start = time.perf_counter()
+    if out is not None:
+        results = asyncio.run(
+            run_fleet(configs, dictionary, op, deadline=deadline, on_result=lambda r: out.emit(r.to_dict()), **options)
+        )
+        failed = sum(not r.ok for r in results)
+        elapsed = round(time.perf_counter() - start, 3)
+        out.emit({"summary": {"op": op, "servers": len(results), "failed": failed, "elapsed_s": elapsed}})
+        raise typer.Exit(code=1 if failed else 0)
+
+    from rich.console import Console
+
+    from radcli.display import fleet_table
+
+    console = Console()
+    with console.status(f"Probing {len(configs)} servers...") as status:
+        done = 0
+
+        def progress(_: FleetResult) -> None:
+            nonlocal done
+            done += 1
+            status.update(f"Probing {len(configs)} servers... {done} done")
+
+        results = asyncio.run(run_fleet(configs, dictionary, op, deadline=deadline, on_result=progress, **options))
+    elapsed = time.perf_counter() - start
+
+    console.print(fleet_table(results, title=f"{op} — {len(results)} servers"))
+    failed = sum(not r.ok for r in results)
+    summary = f"{len(results) - failed}/{len(results)} ok in {elapsed:.2f}s"
+    if failed:
+        console.print(f"\n[bold red]{failed} failed[/] — {summary}")
+        raise typer.Exit(code=1)
+    console.print(f"\n[bold green]All servers ok[/] — {summary}")
+    raise typer.Exit(code=0)
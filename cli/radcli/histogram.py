@@ -0,0 +1,124 @@
+"""Fixed-memory, log-bucketed latency histogram (HDR Histogram layout).
+
+Values are recorded as integer microseconds into a log-linear bucket array:
+the first bucket covers 0–127 µs at 1 µs resolution and every following
+power of two is split into 64 linear sub-buckets, so any recorded value is
+reported to within 1/64 (~1.6 %) of its true value. The array size depends
+only on the highest trackable value, never on how many samples are taken,
+and two histograms with the same range merge by adding their counts.
+
+Latencies are recorded as given. Open-loop runs avoid coordinated
+omission by measuring from the intended send time, not by back-filling
+samples here.
+"""
+
+from array import array
+
+# 2**7 sub-buckets in the first bucket, half of that in every later one.
+_SUB_BUCKET_BITS = 7
+_SUB_BUCKET_COUNT = 1 << _SUB_BUCKET_BITS
+_SUB_BUCKET_HALF = _SUB_BUCKET_COUNT >> 1
+
+PERCENTILES = (50.0, 90.0, 99.0, 99.9)
+
+
+def _index(value: int) -> int:
+    shift = max(0, value.bit_length() - _SUB_BUCKET_BITS)
+    return _SUB_BUCKET_HALF * shift + (value >> shift)
+
+
+def _highest_equivalent(index: int) -> int:
+    """Largest value that lands in bucket ``index``."""
+    shift = max(0, index // _SUB_BUCKET_HALF - 1)
+    low = (index - _SUB_BUCKET_HALF * shift) << shift
+    return low + (1 << shift) - 1
+
+
+class LatencyHistogram:
+    """Mergeable latency histogram with microsecond resolution.
+
+    Latencies are passed in and reported back in seconds to match
+    ``time.perf_counter()``; anything above ``max_seconds`` is clamped into
+    the top bucket (the exact maximum is still tracked separately).
+    """
+
+    def __init__(self, max_seconds: float = 3600.0) -> None:
+        self.max_seconds = max_seconds
+        self._highest = int(max_seconds * 1_000_000)
+        self._counts = array("Q", bytes(8 * (_index(self._highest) + 1)))
+        self.count = 0
+        self._total_us = 0
+        self._min_us: int | None = None
+        self._max_us = 0
+
+    def record(self, seconds: float, count: int = 1) -> None:
+        """Record ``count`` occurrences of a latency of ``seconds``."""
+        us = max(0, int(seconds * 1_000_000))
+        self._counts[_index(min(us, self._highest))] += count
+        self.count += count
+        self._total_us += us * count
+        if self._min_us is None or us < self._min_us:
+            self._min_us = us
+        if us > self._max_us:
+            self._max_us = us
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts into this one."""
+        if len(other._counts) != len(self._counts):
+            raise ValueError("cannot merge histograms with different ranges")
+        counts = self._counts
+        for i, n in enumerate(other._counts):
+            if n:
+                counts[i] += n
+        self.count += other.count
+        self._total_us += other._total_us
+        if other._min_us is not None and (self._min_us is None or other._min_us < self._min_us):
+            self._min_us = other._min_us
+        self._max_us = max(self._max_us, other._max_us)
+
+    def reset(self) -> None:
+        self._counts = array("Q", bytes(8 * len(self._counts)))
+        self.count = 0
+        self._total_us = 0
+        self._min_us = None
+        self._max_us = 0
+
+    @property
+    def min(self) -> float:
+        return (self._min_us or 0) / 1_000_000
+
+    @property
+    def max(self) -> float:
+        return self._max_us / 1_000_000
+
+    @property
+    def mean(self) -> float:
+        return self._total_us / self.count / 1_000_000 if self.count else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Latency (seconds) at or below which ``q`` percent of samples fall."""
+        if not self.count:
+            return 0.0
+        if q >= 100.0:
+            return self.max
+        target = max(1, -(-self.count * q // 100))  # ceil without floats drifting
+        seen = 0
+        for i, n in enumerate(self._counts):
+            seen += n
+            if seen >= target:
+                return min(_highest_equivalent(i), self._max_us) / 1_000_000
+        return self.max
+
+    def summary(self) -> dict[str, float]:
+        """Return p50/p90/p99/p99.9/max (seconds) keyed by label."""
+        result = {f"p{q:g}": self.percentile(q) for q in PERCENTILES}
+        result["max"] = self.max
+        return result
+
+
+def format_latency(seconds: float) -> str:
+    """Render a latency with microsecond resolution: ``842 µs`` / ``12.345 ms``."""
+    us = seconds * 1_000_000
+    if us < 1000:
+        return f"{us:.0f} µs"
+    return f"{us / 1000:.3f} ms"
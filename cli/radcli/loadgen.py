@@ -0,0 +1,263 @@
+"""Load generator built on the asyncio RadiusEndpoint.
+
+Closed loop by default: each of ``concurrency`` workers per socket sends its
+next request as soon as the previous reply arrives. With a target ``rate``
+or an ``arrivals`` schedule (see ``radcli.loadprofile``) the run is open
+loop instead — requests are scheduled at fixed intended send times
+regardless of how quickly replies come back, and latency is measured from
+those intended times.
+"""
+
+import asyncio
+import itertools
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from typing import Protocol, runtime_checkable
+
+import pyrad.packet
+from pyrad.client import Client
+from pyrad.dictionary import Dictionary
+
+from radcli.engine import EndpointClosed, Outcome, RadiusEndpoint, RetryPolicy
+from radcli.histogram import LatencyHistogram
+from radcli.output import latency_summary
+from radcli.recorder import Recorder
+from radcli.reply import LazyReply
+from radcli.template import PacketTemplate
+
+
+@dataclass
+class BenchResult:
+    """Counters and latency histogram from one bench run."""
+
+    sent: int = 0
+    codes: Counter = field(default_factory=Counter)
+    timeouts: int = 0
+    errors: int = 0
+    stray: int = 0
+    retransmits: int = 0
+    duplicates: int = 0  # extra replies to requests already answered
+    late: int = 0  # replies that arrived after their request timed out
+    elapsed: float = 0.0
+    failure_messages: Counter = field(default_factory=Counter)  # Reply-Message of non-Accept replies
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def merge(self, other: "BenchResult") -> None:
+        """Fold another run's counters and histogram into this one.
+
+        Shards run side by side, so the merged elapsed time is the longest
+        shard's wall-clock time rather than the sum.
+        """
+        self.sent += other.sent
+        self.codes.update(other.codes)
+        self.timeouts += other.timeouts
+        self.errors += other.errors
+        self.stray += other.stray
+        self.retransmits += other.retransmits
+        self.duplicates += other.duplicates
+        self.late += other.late
+        self.failure_messages.update(other.failure_messages)
+        self.elapsed = max(self.elapsed, other.elapsed)
+        self.histogram.merge(other.histogram)
+
+    @property
+    def completed(self) -> int:
+        return sum(self.codes.values())
+
+    @property
+    def rate(self) -> float:
+        """Replies per second over the whole run."""
+        return self.completed / self.elapsed if self.elapsed else 0.0
+
+    def percentile(self, q: float) -> float:
+        """Latency (seconds) at quantile ``q`` in [0, 100]."""
+        return self.histogram.percentile(q)
+
+    def to_dict(self) -> dict:
+        result = {
+            "sent": self.sent,
+            "codes": {str(code): count for code, count in sorted(self.codes.items())},
+            "timeouts": self.timeouts,
+            "errors": self.errors,
+            "retransmits": self.retransmits,
+            "duplicates": self.duplicates,
+            "late": self.late,
+            "stray": self.stray,
+            "elapsed_s": round(self.elapsed, 3),
+            "rate": round(self.rate, 1),
+            "failure_messages": dict(self.failure_messages.most_common(10)),
+        }
+        if self.histogram.count:
+            result["latency_ms"] = latency_summary(self.histogram)
+        return result
+
+    def record(self, outcome: Outcome, dictionary: Dictionary | None = None) -> None:
+        if outcome.code is None:
+            self.timeouts += 1
+            return
+        self.codes[outcome.code] += 1
+        self.histogram.record(outcome.latency)
+        if dictionary is not None and outcome.code != pyrad.packet.AccessAccept:
+            # Accepts are counted from the header alone; only failures are
+            # worth decoding attributes for.
+            try:
+                messages = LazyReply(outcome.raw, dictionary).get("Reply-Message") or ["(no Reply-Message)"]
+            except (pyrad.packet.PacketError, ValueError):
+                # A corrupt AVP list or a Reply-Message that isn't UTF-8: the
+                # reply itself is already counted, note why it has no message.
+                messages = ["(undecodable attributes)"]
+            self.failure_messages.update(str(m) for m in messages)
+
+
+def auth_packet_factory(client: Client, user: str, password: str) -> Callable[[int], bytes]:
+    """Return ``encode(identifier)`` producing a fresh PAP Access-Request each call.
+
+    Built on a pre-encoded ``PacketTemplate``, so the send loop never
+    constructs a pyrad packet.
+    """
+    template = PacketTemplate(client, NAS_Identifier="radcli")
+
+    def encode(ident: int) -> bytes:
+        return template.encode(ident, user, password)
+
+    return encode
+
+
+@runtime_checkable
+class TrackedEncoder(Protocol):
+    """An ``encode(identifier)`` that also says which credential it sent.
+
+    After each call, ``last`` is ``(record, flags)``: the corpus record
+    index (-1 for none) and the ``radcli.recorder`` flags for that request.
+    ``run_bench`` copies it into the recording; plain encoders are
+    recorded as ``(-1, 0)``. ``radcli.corpus.CorpusEncoder`` is one.
+    """
+
+    last: tuple[int, int]
+
+    def __call__(self, ident: int) -> bytes: ...
+
+
+async def run_bench(
+    client: Client,
+    port: int,
+    encode: Callable[[int], bytes],
+    *,
+    requests: int | None = None,
+    duration: float | None = None,
+    concurrency: int = 64,
+    sockets: int = 1,
+    timeout: float = 5.0,
+    rate: float | None = None,
+    arrivals: Iterable[float] | None = None,
+    retry: RetryPolicy | None = None,
+    recorder: Recorder | None = None,
+) -> BenchResult:
+    """Keep ``concurrency`` requests in flight on each of ``sockets`` source ports
+    (or send at a fixed ``rate`` per second, or at each ``arrivals`` offset in
+    seconds from the start) until ``requests`` are sent, ``duration`` elapses
+    or the arrivals run out. With ``retry``, lost requests are retransmitted
+    within ``timeout``, as a real NAS would. A ``recorder`` gets one row per
+    request, naming the credential if ``encode`` is a ``TrackedEncoder``;
+    the caller closes it."""
+    if requests is None and duration is None and arrivals is None:
+        raise ValueError("either requests, duration or arrivals is required")
+    if rate and arrivals is not None:
+        raise ValueError("rate and arrivals both set the send schedule; pass one")
+    if rate:
+        arrivals = (k / rate for k in itertools.count())
+
+    source = encode if recorder is not None and isinstance(encode, TrackedEncoder) else None
+
+    endpoints = [
+        await RadiusEndpoint.open(client.server, port, client.secret, window=concurrency, retry=retry)
+        for _ in range(sockets)
+    ]
+    result = BenchResult()
+    deadline = time.perf_counter() + duration if duration is not None else None
+
+    def more() -> bool:
+        if requests is not None and result.sent >= requests:
+            return False
+        if deadline is not None and time.perf_counter() >= deadline:
+            return False
+        return True
+
+    async def send(endpoint: RadiusEndpoint, intended: float | None = None) -> bool:
+        """One request; ``False`` once the endpoint's socket has closed."""
+        if recorder is None:
+            try:
+                outcome = await endpoint.send_encoded(encode, timeout, intended=intended)
+            except EndpointClosed:
+                result.errors += 1
+                return False
+            result.record(outcome, client.dict)
+            return True
+
+        sent = time.perf_counter() if intended is None else intended
+        drawn = (-1, 0)
+
+        def tracked(ident: int) -> bytes:
+            nonlocal drawn
+            raw = source(ident)
+            drawn = source.last
+            return raw
+
+        try:
+            outcome = await endpoint.send_encoded(encode if source is None else tracked, timeout, intended=intended)
+        except EndpointClosed:
+            result.errors += 1
+            return False
+        result.record(outcome, client.dict)
+        recorder.record(
+            sent - start,
+            outcome.latency,
+            outcome.code,
+            outcome.retransmits,
+            *drawn,
+            len(outcome.raw) if outcome.raw is not None else 0,
+        )
+        return True
+
+    async def worker(endpoint: RadiusEndpoint) -> None:
+        while more():
+            result.sent += 1
+            if not await send(endpoint):
+                return
+
+    async def scheduler() -> None:
+        first = time.perf_counter()
+        tasks: set[asyncio.Task] = set()
+        for offset in arrivals:
+            if not more():
+                break
+            intended = first + offset
+            delay = intended - time.perf_counter()
+            # Yield even when behind schedule so replies keep being processed.
+            await asyncio.sleep(max(0.0, delay))
+            task = asyncio.create_task(send(endpoints[result.sent % sockets], intended))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            result.sent += 1
+        if tasks:
+            await asyncio.gather(*tasks)
+
+    if recorder is not None:
+        recorder.begin()
+    start = time.perf_counter()
+    try:
+        if arrivals is not None:
+            await scheduler()
+        else:
+            await asyncio.gather(*(worker(ep) for ep in endpoints for _ in range(concurrency)))
+    finally:
+        result.elapsed = time.perf_counter() - start
+        for endpoint in endpoints:
+            result.stray += endpoint.stray_replies
+            result.retransmits += endpoint.retransmits
+            result.duplicates += endpoint.duplicate_replies
+            result.late += endpoint.late_replies
+            await endpoint.close()
+    return result
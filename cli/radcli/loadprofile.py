@@ -0,0 +1,118 @@
+"""Open-loop arrival schedules: constant, step, linear ramp and Poisson.
+
+A load profile is a piecewise-linear request rate over time. Arrival ``k``
+is due when the integral of the rate reaches ``k``. For Poisson arrivals
+the gaps in that integral are exponential instead of 1, which gives a
+non-homogeneous Poisson process by time-rescaling. The load generator
+only consumes the resulting intended send times; it never looks at the
+rate itself.
+
+Profiles are written as short specs for ``radcli bench --load``::
+
+    constant:500              500 req/s for --duration
+    poisson:500               Poisson arrivals averaging 500 req/s
+    step:100,200,400@10       100, 200, then 400 req/s, 10 s each
+    ramp:100-2000@60          linear 100 → 2000 req/s over 60 s
+    ramp:100-2000@60:poisson  any profile can take :poisson arrivals
+"""
+
+import math
+import random
+from collections.abc import Iterator
+from dataclasses import dataclass, replace
+
+
+@dataclass(frozen=True)
+class Segment:
+    duration: float  # seconds
+    start_rate: float  # requests/s at the beginning of the segment
+    end_rate: float  # requests/s at the end (== start_rate when flat)
+
+    def area(self) -> float:
+        return (self.start_rate + self.end_rate) / 2 * self.duration
+
+    def time_for(self, area: float) -> float:
+        """Seconds into the segment at which ``area`` arrivals have accumulated."""
+        r0 = self.start_rate
+        slope = (self.end_rate - r0) / self.duration
+        if abs(slope) < 1e-12:
+            return area / r0
+        return (-r0 + math.sqrt(max(0.0, r0 * r0 + 2 * slope * area))) / slope
+
+
+@dataclass(frozen=True)
+class LoadProfile:
+    """A request rate over time, made of linear segments."""
+
+    name: str
+    segments: tuple[Segment, ...]
+    poisson: bool = False
+
+    @property
+    def duration(self) -> float:
+        return sum(s.duration for s in self.segments)
+
+    @property
+    def total(self) -> float:
+        """Expected number of requests over the whole profile."""
+        return sum(s.area() for s in self.segments)
+
+    def scaled(self, factor: float) -> "LoadProfile":
+        """The same shape at ``factor`` × the rate (one worker's share)."""
+        segments = tuple(Segment(s.duration, s.start_rate * factor, s.end_rate * factor) for s in self.segments)
+        return replace(self, segments=segments)
+
+    def arrivals(self, seed: int | None = None) -> Iterator[float]:
+        """Intended send times in seconds from the start, until the profile ends."""
+        draw = random.Random(seed).expovariate if self.poisson else None
+        offset = 0.0  # start time of the current segment
+        target = draw(1.0) if draw else 0.0  # cumulative arrivals still to reach in this segment
+        for segment in self.segments:
+            area = segment.area()
+            while target < area:
+                yield offset + segment.time_for(target)
+                target += draw(1.0) if draw else 1.0
+            target -= area
+            offset += segment.duration
+
+
+def constant(rate: float, duration: float, *, poisson: bool = False) -> LoadProfile:
+    return LoadProfile("poisson" if poisson else "constant", (Segment(duration, rate, rate),), poisson)
+
+
+def _number(text: str, spec: str) -> float:
+    try:
+        return float(text)
+    except ValueError:
+        raise ValueError(f"malformed load spec {spec!r}: {text!r} is not a number") from None
+
+
+def parse_profile(spec: str, duration: float | None = None) -> LoadProfile:
+    """Parse a ``--load`` spec (see the module docstring); raises ``ValueError``."""
+    kind, _, rest = spec.partition(":")
+    rest, _, modifier = rest.partition(":")
+    if modifier not in ("", "poisson"):
+        raise ValueError(f"unknown arrival modifier {modifier!r} (only 'poisson')")
+    poisson = modifier == "poisson" or kind == "poisson"
+    if kind in ("constant", "poisson"):
+        if duration is None:
+            raise ValueError(f"{kind} load needs --duration")
+        profile = constant(_number(rest, spec), duration, poisson=poisson)
+    elif kind == "step":
+        rates, _, hold = rest.partition("@")
+        length = _number(hold, spec)
+        segments = tuple(Segment(length, rate, rate) for rate in (_number(r, spec) for r in rates.split(",")))
+        profile = LoadProfile("step", segments, poisson)
+    elif kind == "ramp":
+        span, _, length = rest.partition("@")
+        start, _, end = span.partition("-")
+        segment = Segment(_number(length, spec), _number(start, spec), _number(end, spec))
+        profile = LoadProfile("ramp", (segment,), poisson)
+    else:
+        raise ValueError(f"unknown load profile {kind!r} (constant, poisson, step, ramp)")
+    for segment in profile.segments:
+        if segment.duration <= 0 or segment.start_rate < 0 or segment.end_rate < 0:
+            raise ValueError(f"load spec {spec!r} needs positive durations and non-negative rates")
+        if segment.start_rate == segment.end_rate == 0:
+            raise ValueError(f"load spec {spec!r} has a zero-rate segment")
+    return profile
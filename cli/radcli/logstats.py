@@ -0,0 +1,309 @@
+"""Linelog analytics — aggregate the JSON lines written by rlm_linelog.
+
+The log is memory-mapped and split into newline-aligned byte ranges, and
+each range is parsed in its own worker process; the per-range ``LogStats``
+are then merged. Only complete lines are consumed, and the byte offset
+just past the last one is saved in a checkpoint (with the cumulative
+stats) so the next run on the same file parses only what was appended
+since. A file that shrank or changed inode was rotated, and is read
+from the start again.
+
+The checkpoint stays bounded however long the log grows. Only the
+busiest ``_MAX_USERS`` users are kept by name, and the rest are summed
+into ``other_users``. Only the latest ``_WINDOW`` active seconds keep a
+per-second count. Older seconds are rolled up into a histogram of lines
+per second, which is all ``throughput`` needs.
+"""
+
+import hashlib
+import json
+import mmap
+import os
+import tempfile
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+# Bump when the checkpoint layout changes so old checkpoints are ignored.
+_FORMAT = 2
+
+# Checkpoint bounds: users kept by name, and active seconds kept individually.
+_MAX_USERS = 10_000
+_WINDOW = 86_400
+
+# Ranges smaller than this aren't worth a process of their own.
+_MIN_CHUNK = 4 << 20
+
+
+@dataclass
+class LogStats:
+    """Counters aggregated over a span of linelog lines."""
+
+    lines: int = 0
+    malformed: int = 0
+    events: Counter = field(default_factory=Counter)  # "auth/accept", "acct/Start", ...
+    users: Counter = field(default_factory=Counter)
+    nas: Counter = field(default_factory=Counter)  # NAS-Identifier, else NAS-IP-Address
+    reject_reasons: Counter = field(default_factory=Counter)  # module_fail_msg
+    per_second: Counter = field(default_factory=Counter)  # "YYYY-MM-DD HH:MM:SS" → lines
+    other_users: int = 0  # lines from users compacted out of ``users``
+    earlier_rates: Counter = field(default_factory=Counter)  # lines/s → seconds, rolled out of ``per_second``
+    earlier_first: str = ""  # first second rolled up
+    earlier_peak: int = 0
+    earlier_peak_at: str = ""
+
+    def merge(self, other: "LogStats") -> None:
+        self.lines += other.lines
+        self.malformed += other.malformed
+        self.events.update(other.events)
+        self.users.update(other.users)
+        self.nas.update(other.nas)
+        self.reject_reasons.update(other.reject_reasons)
+        self.per_second.update(other.per_second)
+        self.other_users += other.other_users
+        self.earlier_rates.update(other.earlier_rates)
+        if other.earlier_first and (not self.earlier_first or other.earlier_first < self.earlier_first):
+            self.earlier_first = other.earlier_first
+        if other.earlier_peak > self.earlier_peak:
+            self.earlier_peak, self.earlier_peak_at = other.earlier_peak, other.earlier_peak_at
+
+    def compact(self, max_users: int = _MAX_USERS, window: int = _WINDOW) -> None:
+        """Bound ``users`` and ``per_second`` for the checkpoint (see the module docstring).
+
+        Counts for a user dropped here restart from zero if it shows up
+        again, so names near the cut-off are approximate; the top of the
+        table is not.
+        """
+        if len(self.users) > max_users:
+            kept = Counter(dict(self.users.most_common(max_users)))
+            self.other_users += self.users.total() - kept.total()
+            self.users = kept
+        if len(self.per_second) > window:
+            seconds = sorted(self.per_second)
+            for stamp in seconds[:-window]:
+                n = self.per_second.pop(stamp)
+                self.earlier_rates[n] += 1
+                if n > self.earlier_peak:
+                    self.earlier_peak, self.earlier_peak_at = n, stamp
+            if not self.earlier_first or seconds[0] < self.earlier_first:
+                self.earlier_first = seconds[0]
+
+    def add(self, record: dict) -> None:
+        kind = record.get("type", "unknown")
+        if kind == "auth":
+            detail = record.get("result", "")
+        elif kind == "acct":
+            detail = record.get("acct_status", "")
+        else:
+            detail = record.get("packet_type", "")
+        self.events[f"{kind}/{detail}" if detail else kind] += 1
+        if user := record.get("user"):
+            self.users[user] += 1
+        if nas := record.get("nas_id") or record.get("nas_ip"):
+            self.nas[nas] += 1
+        if kind == "auth" and detail == "reject":
+            self.reject_reasons[record.get("module_fail_msg") or "(none)"] += 1
+        if stamp := record.get("timestamp"):
+            self.per_second[stamp] += 1
+
+    @property
+    def accepts(self) -> int:
+        return self.events["auth/accept"]
+
+    @property
+    def rejects(self) -> int:
+        return self.events["auth/reject"]
+
+    @property
+    def auths(self) -> int:
+        return sum(n for key, n in self.events.items() if key.startswith("auth"))
+
+    def throughput(self) -> dict[str, float | str]:
+        """Lines per logged second: mean, p50, p99 and the peak second.
+
+        Seconds with no lines at all aren't in the log, so the mean is over
+        active seconds.
+        """
+        if not self.per_second:
+            return {}
+        rates = Counter(self.earlier_rates)  # lines/s → seconds
+        rates.update(self.per_second.values())
+        seconds = rates.total()
+
+        ordered = sorted(rates.items())
+
+        def rank(k: int) -> int:
+            """The ``k``-th smallest per-second count (0-based)."""
+            for rate, n in ordered:
+                if k < n:
+                    return rate
+                k -= n
+            return ordered[-1][0]
+
+        peak_at, peak = self.per_second.most_common(1)[0]
+        if self.earlier_peak >= peak:  # ties go to the earlier second, as most_common does
+            peak, peak_at = self.earlier_peak, self.earlier_peak_at
+        return {
+            "seconds": seconds,
+            "mean": sum(rate * n for rate, n in rates.items()) / seconds,
+            "p50": rank(seconds // 2),
+            "p99": rank(min(seconds - 1, int(seconds * 0.99))),
+            "peak": peak,
+            "peak_at": peak_at,
+            "first": self.earlier_first or min(self.per_second),
+            "last": max(self.per_second),
+        }
+
+    def to_dict(self) -> dict:
+        return {
+            "lines": self.lines,
+            "malformed": self.malformed,
+            "events": dict(self.events),
+            "users": dict(self.users),
+            "nas": dict(self.nas),
+            "reject_reasons": dict(self.reject_reasons),
+            "per_second": dict(self.per_second),
+            "other_users": self.other_users,
+            "earlier_rates": [[rate, n] for rate, n in sorted(self.earlier_rates.items())],
+            "earlier_first": self.earlier_first,
+            "earlier_peak": self.earlier_peak,
+            "earlier_peak_at": self.earlier_peak_at,
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "LogStats":
+        return cls(
+            lines=data["lines"],
+            malformed=data["malformed"],
+            **{
+                name: Counter(data[name])
+                for name in ("events", "users", "nas", "reject_reasons", "per_second")
+            },
+            other_users=data["other_users"],
+            earlier_rates=Counter({rate: n for rate, n in data["earlier_rates"]}),
+            earlier_first=data["earlier_first"],
+            earlier_peak=data["earlier_peak"],
+            earlier_peak_at=data["earlier_peak_at"],
+        )
+
+
+def parse_range(path: str, start: int, end: int) -> LogStats:
+    """Aggregate the lines in ``[start, end)`` of ``path``; both on line boundaries."""
+    stats = LogStats()
+    with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        mm.seek(start)
+        while mm.tell() < end:
+            line = mm.readline()
+            if not line.strip():
+                continue
+            stats.lines += 1
+            try:
+                record = json.loads(line)
+            except ValueError:
+                stats.malformed += 1
+                continue
+            if not isinstance(record, dict):
+                stats.malformed += 1
+                continue
+            stats.add(record)
+    return stats
+
+
+def split_ranges(mm: mmap.mmap, start: int, end: int, parts: int) -> list[tuple[int, int]]:
+    """Cut ``[start, end)`` into up to ``parts`` ranges that end on newlines."""
+    size = end - start
+    parts = max(1, min(parts, size // _MIN_CHUNK))
+    ranges = []
+    pos = start
+    for i in range(1, parts):
+        cut = mm.find(b"\n", start + size * i // parts, end)
+        if cut < 0:
+            break
+        if cut + 1 > pos:
+            ranges.append((pos, cut + 1))
+            pos = cut + 1
+    if pos < end:
+        ranges.append((pos, end))
+    return ranges
+
+
+def checkpoint_path(log: str | os.PathLike) -> Path:
+    """Checkpoint file for ``log``, under ``$XDG_CACHE_HOME/radcli``.
+
+    Logs usually live somewhere radcli can't write (``/var/log/radius``), so
+    unlike the dictionary cache this never goes next to the source.
+    """
+    source = Path(log).resolve()
+    digest = hashlib.sha1(str(source).encode()).hexdigest()[:16]
+    base = Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "radcli"
+    return base / f"{source.name}-{digest}.logstats.json"
+
+
+def _load_checkpoint(path: Path, inode: int, size: int) -> tuple[int, LogStats]:
+    try:
+        data = json.loads(path.read_text())
+        if data["format"] == _FORMAT and data["inode"] == inode and data["offset"] <= size:
+            return data["offset"], LogStats.from_dict(data["stats"])
+    except (OSError, ValueError, KeyError, TypeError):
+        pass
+    return 0, LogStats()
+
+
+def _save_checkpoint(path: Path, log: Path, inode: int, offset: int, stats: LogStats) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=path.name, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w") as f:
+            json.dump(
+                {"format": _FORMAT, "path": str(log), "inode": inode, "offset": offset, "stats": stats.to_dict()},
+                f,
+            )
+        os.replace(tmp, path)
+    except OSError:
+        Path(tmp).unlink(missing_ok=True)
+        raise
+
+
+@dataclass
+class AnalyzeResult:
+    stats: LogStats
+    start: int  # offset this run began at (0 = from scratch)
+    end: int  # offset just past the last complete line
+    ranges: int  # byte ranges parsed this run
+
+
+def analyze(
+    log: str | os.PathLike,
+    *,
+    workers: int | None = None,
+    checkpoint: Path | None = None,
+) -> AnalyzeResult:
+    """Aggregate ``log``, resuming from (and updating) ``checkpoint`` if given."""
+    log = Path(log)
+    st = log.stat()
+    start, stats = (0, LogStats())
+    if checkpoint is not None:
+        start, stats = _load_checkpoint(checkpoint, st.st_ino, st.st_size)
+
+    end = start
+    ranges: list[tuple[int, int]] = []
+    if st.st_size > start:
+        with open(log, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # A line still being written has no newline yet; leave it for next time.
+            end = mm.rfind(b"\n", start) + 1 or start
+            if end > start:
+                ranges = split_ranges(mm, start, end, workers or os.cpu_count() or 1)
+
+    if len(ranges) == 1:
+        stats.merge(parse_range(str(log), *ranges[0]))
+    elif ranges:
+        with ProcessPoolExecutor(max_workers=len(ranges)) as pool:
+            futures = [pool.submit(parse_range, str(log), a, b) for a, b in ranges]
+            for future in futures:
+                stats.merge(future.result())
+
+    if checkpoint is not None and end > start:
+        stats.compact()
+        _save_checkpoint(checkpoint, log, st.st_ino, end, stats)
+    return AnalyzeResult(stats=stats, start=start, end=end, ranges=len(ranges))
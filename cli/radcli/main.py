@@ -1,15 +1,111 @@
-"""Typer app — global options and command registration."""
+"""Typer app — global options and lazy command registration.
 
+Subcommand modules pull in pyrad, rich, asyncio and friends, so importing
+them all up front makes even ``radcli --help`` or ``radcli profile list``
+pay for the heaviest command. Instead each subcommand is listed in
+``_COMMANDS`` and only imported when it is actually invoked; ``--help``
+lists them from the one-line summaries kept here.
+"""
+
+import importlib
 from typing import Annotated, Optional
 
 import typer
+from typer.core import TyperCommand, TyperGroup
+
+# name → (module, attribute, summary shown by `radcli --help`)
+# The summary must match the first paragraph of the command's docstring;
+# tests/test_radcli_commands.py checks it.
+_COMMANDS: dict[str, tuple[str, str, str]] = {
+    "auth": ("radcli.commands.auth", "auth", "Send an Access-Request and display the result."),
+    "acct": ("radcli.commands.acct", "acct_app", "Send an Accounting-Request and display the result."),
+    "authz": (
+        "radcli.commands.authz",
+        "authz",
+        "Authenticate and show detailed reply attributes with annotations.",
+    ),
+    "bench": (
+        "radcli.commands.bench",
+        "bench",
+        "Flood the server with Access-Requests and report throughput and latency.",
+    ),
+    "daemon": ("radcli.commands.daemon", "daemon_app", "Run radcli as a daemon and talk to it over a Unix socket."),
+    "health": ("radcli.commands.health", "health", "Run health checks against the freeradius-lab Docker container."),
+    "logs": ("radcli.commands.logs", "logs_app", "Analyse linelog JSON files locally."),
+    "ping": (
+        "radcli.commands.ping",
+        "ping",
+        "Probe the server with Status-Server continuously and report ping-style RTT stats.",
+    ),
+    "replay": ("radcli.commands.replay", "replay", "Replay auth/acct traffic from a linelog JSON file."),
+    "report": (
+        "radcli.commands.report",
+        "report",
+        "Summarise recorded bench runs: percentiles, time series and error breakdown.",
+    ),
+    "responder": (
+        "radcli.commands.responder",
+        "responder",
+        "Answer Access, Accounting and Status-Server requests from the lab's user list.",
+    ),
+    "shell": ("radcli.commands.shell", "shell", "Interactive shell that keeps config, dictionary and sockets warm."),
+    "stats": (
+        "radcli.commands.stats",
+        "stats",
+        "Poll FreeRADIUS server statistics and report counters, rates and queues.",
+    ),
+    "status": (
+        "radcli.commands.status",
+        "status",
+        "Check if the RADIUS server is alive (Status-Server with auth fallback).",
+    ),
+    "users": (
+        "radcli.commands.users",
+        "users_app",
+        "Generate synthetic users files and credential corpora for scaling tests.",
+    ),
+    "profile": ("radcli.commands.profile", "profile_app", "Manage named server profiles (profiles.toml)."),
+}
+
+
+def _load_command(name: str) -> TyperCommand | TyperGroup:
+    """Import a subcommand's module and build its click command."""
+    module_name, attr, _ = _COMMANDS[name]
+    target = getattr(importlib.import_module(module_name), attr)
+    if not isinstance(target, typer.Typer):
+        wrapper = typer.Typer()
+        wrapper.command(name=name)(target)
+        target = wrapper
+    command = typer.main.get_command(target)
+    command.name = name
+    return command
+
+
+class LazyGroup(TyperGroup):
+    """Top-level group that imports subcommands on first use."""
+
+    def list_commands(self, ctx) -> list[str]:
+        return [*self.commands, *(name for name in _COMMANDS if name not in self.commands)]
+
+    def get_command(self, ctx, cmd_name: str):
+        if cmd_name in self.commands:
+            return self.commands[cmd_name]
+        if cmd_name in _COMMANDS:
+            # Help and completion only need the summary, not the module.
+            return TyperCommand(name=cmd_name, help=_COMMANDS[cmd_name][2])
+        return None
+
+    def resolve_command(self, ctx, args: list[str]):
+        if args and args[0] in _COMMANDS and args[0] not in self.commands:
+            self.commands[args[0]] = _load_command(args[0])
+        return super().resolve_command(ctx, args)
 
-from radcli.config import load_config
 
 app = typer.Typer(
     name="radcli",
     help="Interactive CLI for ad-hoc FreeRADIUS testing.",
     no_args_is_help=True,
+    cls=LazyGroup,
 )
 
 
@@ -36,25 +132,30 @@ def main(
         Optional[int],
         typer.Option("--acct-port", help="RADIUS accounting port"),
     ] = None,
+    output: Annotated[
+        str,
+        typer.Option(
+            "--output",
+            help="text (Rich), json (one document at exit) or ndjson (one line per result, no Rich)",
+        ),
+    ] = "text",
 ) -> None:
     """Global connection options (override .env / environment variables)."""
+    # Resolved by radcli.config.resolve_config only when a command needs it.
     ctx.ensure_object(dict)
-    ctx.obj["config"] = load_config(
-        profile=profile,
-        server=server,
-        secret=secret,
-        auth_port=auth_port,
-        acct_port=acct_port,
-    )
-
-
-# Register subcommands
-from radcli.commands import auth, acct, authz, health, status  # noqa: E402
-from radcli.commands.profile import profile_app  # noqa: E402
-
-app.command(name="auth")(auth.auth)
-app.command(name="acct")(acct.acct)
-app.command(name="authz")(authz.authz)
-app.command(name="health")(health.health)
-app.command(name="status")(status.status)
-app.add_typer(profile_app, name="profile")
+    if output != "text":
+        from radcli.output import Emitter
+
+        try:
+            ctx.obj["emitter"] = Emitter(output)
+        except ValueError:
+            raise typer.BadParameter(f"{output!r} is not one of text, json, ndjson", param_hint="--output") from None
+        # Runs on typer.Exit too, so `json` still writes its document.
+        ctx.call_on_close(ctx.obj["emitter"].close)
+    ctx.obj["overrides"] = {
+        "profile": profile,
+        "server": server,
+        "secret": secret,
+        "auth_port": auth_port,
+        "acct_port": acct_port,
+    }
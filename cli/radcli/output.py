@@ -0,0 +1,126 @@
+"""Machine-readable results for scripts: ``radcli --output json|ndjson``.
+
+Panels, spinners and tables are wasted work when radcli runs in a loop,
+and their ANSI text has to be parsed back apart. With ``--output`` set,
+commands build no Rich objects at all. Each result goes to an ``Emitter``
+as a plain dict instead:
+
+- ``ndjson`` writes every result as one compact JSON line the moment it
+  exists, with one flush per result, so a pipe sees it straight away.
+- ``json`` writes a single document when the command ends: the result
+  itself, or a list if there was more than one.
+
+Field names are shared across commands. Request results use
+``OpResult.to_dict`` (``op``, ``code``, ``result``, ``latency_ms``,
+``attributes``), failures carry ``error``, and closing statistics are
+wrapped as ``{"summary": {...}}``.
+
+The one-shot commands scripts call in loops (auth, authz, acct, status,
+health) import Rich only on their rendering paths, so under ``--output``
+they don't pay its import time either.
+"""
+
+import json
+import sys
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING, TextIO
+
+if TYPE_CHECKING:
+    from radcli.config import RadiusConfig
+    from radcli.histogram import LatencyHistogram
+    from radcli.session import OpResult, Session
+
+FORMATS = ("text", "json", "ndjson")
+
+
+class Emitter:
+    """Write result dicts to ``out`` as NDJSON lines or one JSON document."""
+
+    def __init__(self, fmt: str, out: TextIO | None = None) -> None:
+        if fmt not in FORMATS[1:]:
+            raise ValueError(f"unknown output format {fmt!r} (use json or ndjson)")
+        self.format = fmt
+        self.out = out if out is not None else sys.stdout
+        self._held: list[dict] = []
+        self._closed = False
+
+    @property
+    def streaming(self) -> bool:
+        return self.format == "ndjson"
+
+    def emit(self, record: dict) -> None:
+        if self.streaming:
+            self.out.write(json.dumps(record) + "\n")
+            self.out.flush()
+        else:
+            self._held.append(record)
+
+    def close(self) -> None:
+        """Write the held document (``json``). Safe to call more than once."""
+        if self._closed:
+            return
+        self._closed = True
+        if not self.streaming and self._held:
+            document = self._held[0] if len(self._held) == 1 else self._held
+            self.out.write(json.dumps(document, indent=2) + "\n")
+            self.out.flush()
+
+
+def emitter(ctx) -> Emitter | None:
+    """The emitter ``radcli --output`` set up, or ``None`` for Rich output."""
+    return (ctx.obj or {}).get("emitter")
+
+
+def error_record(op: str, exc: BaseException | str) -> dict:
+    return {"op": op, "code": None, "result": "Error", "error": str(exc)}
+
+
+def latency_summary(hist: "LatencyHistogram") -> dict[str, float]:
+    """``latency_table`` as milliseconds: min, mean and the percentiles."""
+    stats = {"min": hist.min, "mean": hist.mean, **hist.summary()}
+    return {label: round(value * 1000, 3) for label, value in stats.items()}
+
+
+def send_and_emit(
+    out: Emitter,
+    config: "RadiusConfig",
+    count: int,
+    send: Callable[["Session"], Awaitable["OpResult"]],
+    *,
+    timeout: float,
+) -> list["OpResult"]:
+    """Run ``send`` ``count`` times over one Session, emitting each result as it lands.
+
+    With ``count`` > 1 a ``summary`` record follows. A timeout is a result
+    (``code`` null), not an exception.
+    """
+    import asyncio
+
+    from radcli.histogram import LatencyHistogram
+    from radcli.session import Session
+
+    async def run() -> list["OpResult"]:
+        session = Session(config, timeout=timeout)
+        results = []
+        try:
+            for _ in range(count):
+                result = await send(session)
+                out.emit(result.to_dict())
+                results.append(result)
+        finally:
+            await session.close()
+        return results
+
+    results = asyncio.run(run())
+    if count > 1:
+        hist = LatencyHistogram()
+        labels: dict[str, int] = {}
+        for result in results:
+            labels[result.label] = labels.get(result.label, 0) + 1
+            if result.code is not None:
+                hist.record(result.latency)
+        summary = {"op": results[0].op, "sent": len(results), "results": labels}
+        if hist.count:
+            summary["latency_ms"] = latency_summary(hist)
+        out.emit({"summary": summary})
+    return results
@@ -0,0 +1,134 @@
+"""Continuous Status-Server probing on one socket, ping(8) style.
+
+A probe is a single pre-encoded Status-Server (see ``radcli.template``)
+sent on a long-lived ``RadiusEndpoint``. Probes go out on a fixed schedule
+as independent tasks, so a slow or lost reply never delays the next one.
+The schedule is what makes ``--interval`` honest at 100 Hz. Up to 256
+probes can be outstanding, one per RADIUS identifier.
+"""
+
+import asyncio
+import math
+import time
+from collections.abc import Callable
+from dataclasses import dataclass, field
+
+from radcli.engine import EndpointClosed, RadiusEndpoint
+from radcli.histogram import LatencyHistogram
+from radcli.template import STATUS_SERVER_CODE, PacketTemplate
+
+
+@dataclass
+class Probe:
+    seq: int
+    code: int | None  # None → lost (no valid reply before the timeout)
+    rtt: float  # seconds
+
+
+@dataclass
+class PingStats:
+    """Running min/avg/max/mdev, loss and percentiles."""
+
+    sent: int = 0
+    received: int = 0
+    min: float = math.inf
+    max: float = 0.0
+    _sum: float = 0.0
+    _sumsq: float = 0.0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    def add(self, probe: Probe) -> None:
+        if probe.code is None:
+            return
+        rtt = probe.rtt
+        self.received += 1
+        self.min = min(self.min, rtt)
+        self.max = max(self.max, rtt)
+        self._sum += rtt
+        self._sumsq += rtt * rtt
+        self.histogram.record(rtt)
+
+    @property
+    def lost(self) -> int:
+        return self.sent - self.received
+
+    @property
+    def loss(self) -> float:
+        """Fraction of sent probes without a reply (0.0 – 1.0)."""
+        return self.lost / self.sent if self.sent else 0.0
+
+    @property
+    def avg(self) -> float:
+        return self._sum / self.received if self.received else 0.0
+
+    @property
+    def mdev(self) -> float:
+        """Standard deviation of the RTT, as ping reports it."""
+        if not self.received:
+            return 0.0
+        mean = self.avg
+        return math.sqrt(max(0.0, self._sumsq / self.received - mean * mean))
+
+    def to_dict(self) -> dict:
+        timings = {"min": self.min, "avg": self.avg, "max": self.max, "mdev": self.mdev}
+        timings["p99"] = self.histogram.percentile(99) if self.received else 0.0
+        return {
+            "sent": self.sent,
+            "received": self.received,
+            "loss_pct": round(100 * self.loss, 2),
+            **{f"{k}_ms": round(v * 1000, 3) if self.received else None for k, v in timings.items()},
+        }
+
+
+async def run_ping(
+    template: PacketTemplate,
+    server: str,
+    port: int,
+    *,
+    interval: float = 1.0,
+    count: int | None = None,
+    timeout: float = 1.0,
+    stats: PingStats | None = None,
+    on_probe: Callable[[Probe, PingStats], None] | None = None,
+) -> PingStats:
+    """Probe every ``interval`` seconds until ``count`` probes (or cancelled).
+
+    The loop can be cancelled (Ctrl-C) at any point; ``stats`` then holds
+    everything answered so far, so pass one in to keep it.
+    """
+    if template.code != STATUS_SERVER_CODE:
+        raise ValueError("ping needs a Status-Server template")
+    stats = stats if stats is not None else PingStats()
+    endpoint = await RadiusEndpoint.open(server, port, template.secret)
+    tasks: set[asyncio.Task] = set()
+
+    async def probe(seq: int) -> None:
+        try:
+            outcome = await endpoint.send_encoded(template.encode, timeout)
+        except EndpointClosed:
+            return
+        result = Probe(seq, outcome.code, outcome.latency)
+        stats.add(result)
+        if on_probe:
+            on_probe(result, stats)
+
+    first = time.perf_counter()
+    try:
+        seq = 0
+        while count is None or seq < count:
+            await asyncio.sleep(max(0.0, first + seq * interval - time.perf_counter()))
+            task = asyncio.create_task(probe(seq))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            stats.sent += 1
+            seq += 1
+        if tasks:
+            await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            task.cancel()
+        # Probes still waiting when cancelled were never answered; don't
+        # count them as lost.
+        stats.sent -= len(tasks)
+        await endpoint.close()
+    return stats
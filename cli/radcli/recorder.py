@@ -0,0 +1,280 @@
+"""Columnar per-request recording for big runs, and the summaries ``radcli report`` prints.
+
+A ten-million-request run can't keep a dict or a table row per request.
+``Recorder`` appends each outcome to one typed ``array`` per column. Every
+``chunk_rows`` requests, the columns go to disk as fixed-width binary,
+one column after another, and the arrays are emptied. Memory stays at one
+chunk however long the run is. Layout, little-endian::
+
+    header   b"RADREC01", u32 length, run metadata as JSON
+    chunk    b"CHNK", u32 rows, then every column of COLUMNS in order
+
+Readers stream the file one chunk at a time too. ``RunSummary`` folds
+chunks into counters, a latency histogram and a per-interval time series.
+Files that share a run id (the shards of one bench) merge into one run.
+"""
+
+import json
+import struct
+import sys
+import time
+from array import array
+from collections import Counter
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pyrad.packet
+
+from radcli.histogram import LatencyHistogram
+
+MAGIC = b"RADREC01"
+_CHUNK = b"CHNK"
+_LENGTH = struct.Struct("<I")
+
+# name → array typecode. The sizes are the same on every platform CPython supports.
+COLUMNS = (
+    ("sent", "d"),  # seconds from the run start to the (intended) send
+    ("latency", "f"),  # seconds to the reply, or to giving up
+    ("code", "B"),  # reply code, 0 = timed out
+    ("retransmits", "B"),
+    ("user", "q"),  # corpus record index, -1 if not from a corpus
+    ("flags", "B"),  # FLAG_* of the credential sent
+    ("reply_size", "H"),  # bytes, 0 if no reply
+)
+
+FLAG_BAD_PASSWORD = 1
+FLAG_UNKNOWN_USER = 2
+
+# Per-interval histograms only need to resolve a timeout-sized latency.
+_SERIES_MAX_SECONDS = 60.0
+
+
+class Recorder:
+    """Append request outcomes to a recording file in fixed-size column chunks."""
+
+    def __init__(self, path: str | Path, meta: dict | None = None, *, chunk_rows: int = 65536) -> None:
+        self.path = Path(path)
+        self.meta = dict(meta or {})
+        self.chunk_rows = chunk_rows
+        self.rows = 0
+        self._columns = [array(code) for _, code in COLUMNS]
+        self._out = open(self.path, "wb")
+        self._header_written = False
+
+    def begin(self) -> None:
+        """Mark the run start; ``sent`` offsets are relative to this instant."""
+        self.meta["started_at"] = time.time()
+
+    def record(
+        self,
+        sent: float,
+        latency: float,
+        code: int | None,
+        retransmits: int = 0,
+        user: int = -1,
+        flags: int = 0,
+        reply_size: int = 0,
+    ) -> None:
+        sent_col, latency_col, code_col, retransmit_col, user_col, flags_col, size_col = self._columns
+        sent_col.append(sent)
+        latency_col.append(latency)
+        code_col.append(code or 0)
+        retransmit_col.append(min(retransmits, 255))
+        user_col.append(user)
+        flags_col.append(flags)
+        size_col.append(reply_size)
+        if len(sent_col) >= self.chunk_rows:
+            self.flush()
+
+    def flush(self) -> None:
+        if not self._header_written:
+            self.meta.setdefault("started_at", time.time())
+            self.meta["columns"] = [f"{name}:{code}" for name, code in COLUMNS]
+            encoded = json.dumps(self.meta).encode()
+            self._out.write(MAGIC + _LENGTH.pack(len(encoded)) + encoded)
+            self._header_written = True
+        rows = len(self._columns[0])
+        if not rows:
+            return
+        self._out.write(_CHUNK + _LENGTH.pack(rows))
+        for column in self._columns:
+            if sys.byteorder == "big":
+                column.byteswap()
+            column.tofile(self._out)
+            del column[:]
+        self.rows += rows
+
+    def close(self) -> None:
+        self.flush()
+        self._out.close()
+
+    def __enter__(self) -> "Recorder":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+def read_recording(path: str | Path) -> tuple[dict, Iterator[dict[str, array]]]:
+    """The run metadata and an iterator over the file's chunks as ``{column: array}``."""
+    f = open(path, "rb")
+    if f.read(len(MAGIC)) != MAGIC:
+        f.close()
+        raise ValueError(f"{path} is not a radcli recording")
+    (length,) = _LENGTH.unpack(f.read(_LENGTH.size))
+    meta = json.loads(f.read(length))
+
+    def chunks() -> Iterator[dict[str, array]]:
+        with f:
+            while marker := f.read(len(_CHUNK)):
+                if marker != _CHUNK:
+                    raise ValueError(f"{path}: corrupt chunk marker at byte {f.tell() - len(_CHUNK)}")
+                (rows,) = _LENGTH.unpack(f.read(_LENGTH.size))
+                chunk = {}
+                for name, code in COLUMNS:
+                    column = array(code)
+                    try:
+                        column.fromfile(f, rows)
+                    except EOFError:
+                        return  # the run was cut off mid-chunk; keep what was complete
+                    if sys.byteorder == "big":
+                        column.byteswap()
+                    chunk[name] = column
+                yield chunk
+
+    return meta, chunks()
+
+
+@dataclass
+class _Interval:
+    sent: int = 0
+    timeouts: int = 0
+    histogram: LatencyHistogram = field(default_factory=lambda: LatencyHistogram(_SERIES_MAX_SECONDS))
+
+    def merge(self, other: "_Interval") -> None:
+        self.sent += other.sent
+        self.timeouts += other.timeouts
+        self.histogram.merge(other.histogram)
+
+
+@dataclass
+class RunSummary:
+    """Everything ``radcli report`` shows for one run, built chunk by chunk."""
+
+    run: str
+    meta: dict
+    interval: float = 1.0
+    files: list[str] = field(default_factory=list)
+    requests: int = 0
+    codes: Counter = field(default_factory=Counter)  # reply code → count, 0 = timeout
+    retransmitted: int = 0  # requests sent more than once
+    retransmits: int = 0
+    expected_rejects: int = 0  # rejects for a deliberately bad credential
+    unexpected_rejects: int = 0
+    accepted_bad: int = 0  # accepts for a deliberately bad credential
+    reply_bytes: int = 0
+    first: float | None = None  # epoch seconds
+    last: float | None = None
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+    series: dict[int, _Interval] = field(default_factory=dict)
+    origin: float | None = None  # epoch seconds of series slot 0
+
+    @property
+    def started_at(self) -> float:
+        return self.meta.get("started_at", 0.0)
+
+    @property
+    def timeouts(self) -> int:
+        return self.codes[0]
+
+    @property
+    def replies(self) -> int:
+        return self.requests - self.timeouts
+
+    @property
+    def duration(self) -> float:
+        return (self.last - self.first) if self.first is not None else 0.0
+
+    @property
+    def rate(self) -> float:
+        return self.replies / self.duration if self.duration else 0.0
+
+    def add_file(self, meta: dict, chunks: Iterable[dict[str, array]], name: str) -> None:
+        self.files.append(name)
+        base = meta.get("started_at", 0.0)
+        if self.origin is None:
+            self.origin = base
+        for chunk in chunks:
+            self._add_chunk(chunk, base)
+
+    def _add_chunk(self, chunk: dict[str, array], base: float) -> None:
+        sent, latency, codes = chunk["sent"], chunk["latency"], chunk["code"]
+        retransmits, flags = chunk["retransmits"], chunk["flags"]
+        self.requests += len(sent)
+        self.codes.update(codes)
+        self.reply_bytes += sum(chunk["reply_size"])
+        start = base + min(sent)
+        end = max(base + s + lat for s, lat in zip(sent, latency))
+        self.first = start if self.first is None else min(self.first, start)
+        self.last = end if self.last is None else max(self.last, end)
+
+        # Slots count from the first file's start, so shards that started apart still line up.
+        histogram, series, width = self.histogram, self.series, self.interval
+        shift = base - self.origin
+        reject = pyrad.packet.AccessReject
+        for i, offset in enumerate(sent):
+            code = codes[i]
+            bucket = series.get(slot := int((shift + offset) // width))
+            if bucket is None:
+                bucket = series[slot] = _Interval()
+            bucket.sent += 1
+            if code:
+                histogram.record(latency[i])
+                bucket.histogram.record(latency[i])
+            else:
+                bucket.timeouts += 1
+            if retransmits[i]:
+                self.retransmitted += 1
+                self.retransmits += retransmits[i]
+            if flags[i]:
+                if code == reject:
+                    self.expected_rejects += 1
+                elif code:
+                    self.accepted_bad += 1
+            elif code == reject:
+                self.unexpected_rejects += 1
+
+    def time_series(self, rows: int = 60) -> list[tuple[float, float, _Interval]]:
+        """``(seconds into the run, width, interval)`` rows, merged down to at most ``rows``."""
+        if not self.series:
+            return []
+        low, high = min(self.series), max(self.series)
+        group = max(1, -(-(high - low + 1) // rows))
+        merged: dict[int, _Interval] = {}
+        for slot in range(low, high + 1):
+            bucket = self.series.get(slot)
+            if bucket is None:
+                continue
+            key = (slot - low) // group
+            if key not in merged:
+                merged[key] = _Interval()
+            merged[key].merge(bucket)
+        width = self.interval * group
+        origin = self.origin + low * self.interval - self.started_at
+        return [(origin + key * width, width, merged[key]) for key in sorted(merged)]
+
+
+def summarize(paths: Iterable[str | Path], *, interval: float = 1.0) -> list[RunSummary]:
+    """Read recordings and fold them into one ``RunSummary`` per run id, oldest first."""
+    runs: dict[str, RunSummary] = {}
+    for path in paths:
+        meta, chunks = read_recording(path)
+        run = meta.get("run") or str(path)
+        summary = runs.get(run)
+        if summary is None:
+            summary = runs[run] = RunSummary(run, meta, interval)
+        elif meta.get("started_at", 0.0) < summary.started_at:
+            summary.meta["started_at"] = meta["started_at"]
+        summary.add_file(meta, chunks, str(path))
+    return sorted(runs.values(), key=lambda s: s.started_at)
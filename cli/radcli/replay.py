@@ -0,0 +1,265 @@
+"""Replay linelog JSON traffic against a RADIUS server.
+
+``rlm_linelog`` (see ansible/roles/freeradius/templates/linelog.j2) writes
+one JSON object per answered request. Each auth or acct line carries
+enough to rebuild its request: user, NAS, session id and time. Passwords
+aren't logged, so they come from a mapping file.
+
+The log is streamed and never loaded whole. Timestamps only have
+one-second resolution, so the events of each logged second are buffered
+(one second of traffic at most) and spread evenly across that second.
+Replaying them all at the second boundary would turn a smooth load into a
+once-a-second burst. Sends are open loop: each request has an intended
+send time taken from the log, and latency is measured from that time. A
+server that can't keep up therefore shows up as latency and lag, not as a
+quietly slower replay.
+"""
+
+import asyncio
+import gzip
+import io
+import json
+import sys
+import time
+from collections import Counter
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import groupby
+from pathlib import Path
+
+import pyrad.packet
+from pyrad.client import Client
+
+from radcli.batch import BadRecord, detect_format, read_credentials
+from radcli.engine import EndpointClosed, RadiusEndpoint
+from radcli.histogram import LatencyHistogram
+
+# linelog's %S expansion
+_TIMESTAMP_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Expected reply to an auth line, by its logged result.
+_EXPECTED_CODE = {"accept": pyrad.packet.AccessAccept, "reject": pyrad.packet.AccessReject}
+
+
+@dataclass
+class Event:
+    kind: str  # "auth" or "acct"
+    when: float  # epoch seconds, from the log
+    fields: dict
+
+
+def _parse_timestamp(value) -> float:
+    if isinstance(value, (int, float)):
+        return float(value)
+    try:
+        return float(value)
+    except ValueError:
+        pass
+    try:
+        stamp = datetime.strptime(value, _TIMESTAMP_FORMAT)
+    except ValueError:
+        stamp = datetime.fromisoformat(value)
+    if stamp.tzinfo is None:
+        stamp = stamp.replace(tzinfo=timezone.utc)
+    return stamp.timestamp()
+
+
+def _open_log(path: str) -> io.TextIOBase:
+    if path == "-":
+        return sys.stdin
+    if path.endswith(".gz"):
+        return gzip.open(path, "rt")
+    return open(path)
+
+
+def read_events(path: str, counts: Counter | None = None) -> Iterator[Event]:
+    """Yield auth/acct events from a linelog file (``-`` for stdin, ``.gz`` ok).
+
+    Lines that don't parse, or aren't auth/acct, are counted in ``counts``
+    under ``malformed`` / ``skipped`` and passed over.
+    """
+    counts = counts if counts is not None else Counter()
+    f = _open_log(path)
+    try:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+                when = _parse_timestamp(record["timestamp"])
+            except (ValueError, KeyError, TypeError):
+                counts["malformed"] += 1
+                continue
+            kind = record.get("type")
+            if kind not in ("auth", "acct") or not record.get("user"):
+                counts["skipped"] += 1
+                continue
+            yield Event(kind, when, record)
+    finally:
+        if f is not sys.stdin:
+            f.close()
+
+
+def spread(events: Iterator[Event]) -> Iterator[tuple[float, Event]]:
+    """Yield ``(offset, event)`` with each second's events spaced evenly.
+
+    ``offset`` is seconds since the first event. Logs are appended in
+    reply order, so a line can carry an earlier second than the one before
+    it. The offset never goes backwards, which keeps the schedule monotonic.
+    """
+    first = None
+    floor = 0.0
+    for when, group in groupby(events, key=lambda e: int(e.when)):
+        batch = list(group)
+        if first is None:
+            first = when
+        base = max(float(when - first), floor)
+        for i, event in enumerate(batch):
+            yield base + i / len(batch), event
+        floor = base + 1.0
+
+
+def load_passwords(path: Path) -> dict[str, str]:
+    """user → password from a CSV or JSONL mapping file (see radcli.batch)."""
+    mapping = {}
+    for cred in read_credentials(path, detect_format(path)):
+        if isinstance(cred, BadRecord):
+            raise ValueError(f"{path}: line {cred.line}: {cred.error}")
+        mapping[cred.user] = cred.password
+    return mapping
+
+
+def _set(pkt: pyrad.packet.Packet, name: str, value) -> None:
+    """Copy a logged value, skipping blanks and values the dictionary rejects."""
+    if value in (None, ""):
+        return
+    try:
+        pkt[name] = value
+    except (KeyError, ValueError, TypeError):
+        pass
+
+
+def build_packet(client: Client, event: Event, password: str) -> pyrad.packet.Packet:
+    """Rebuild the Access-Request or Accounting-Request behind a linelog line."""
+    f = event.fields
+    if event.kind == "auth":
+        pkt = client.CreateAuthPacket(code=pyrad.packet.AccessRequest, User_Name=f["user"])
+        pkt["User-Password"] = pkt.PwCrypt(password)
+        _set(pkt, "Calling-Station-Id", f.get("calling_station"))
+        _set(pkt, "Service-Type", f.get("service_type"))
+    else:
+        pkt = client.CreateAcctPacket(code=pyrad.packet.AccountingRequest, User_Name=f["user"])
+        _set(pkt, "Acct-Status-Type", f.get("acct_status"))
+        _set(pkt, "Acct-Session-Id", f.get("session_id"))
+        session_time = f.get("session_time")
+        if isinstance(session_time, str) and session_time.isdigit():
+            session_time = int(session_time)
+        _set(pkt, "Acct-Session-Time", session_time)
+    _set(pkt, "NAS-IP-Address", f.get("nas_ip"))
+    _set(pkt, "NAS-Identifier", f.get("nas_id") or "radcli-replay")
+    return pkt
+
+
+@dataclass
+class ReplayResult:
+    """Counters and latency histogram from one replay."""
+
+    sent: Counter = field(default_factory=Counter)  # by kind
+    answered: Counter = field(default_factory=Counter)  # by kind
+    timeouts: Counter = field(default_factory=Counter)  # by kind
+    lines: Counter = field(default_factory=Counter)  # malformed / skipped / no_password
+    mismatched: int = 0  # auth replies that differ from the logged result
+    errors: int = 0
+    max_lag: float = 0.0
+    log_span: float = 0.0  # seconds of original traffic replayed
+    elapsed: float = 0.0
+    histogram: LatencyHistogram = field(default_factory=LatencyHistogram)
+
+    @property
+    def rate(self) -> float:
+        total = sum(self.answered.values())
+        return total / self.elapsed if self.elapsed else 0.0
+
+
+async def run_replay(
+    client: Client,
+    events: Iterator[Event],
+    passwords: dict[str, str],
+    *,
+    default_password: str | None = None,
+    speed: float = 1.0,
+    sockets: int = 1,
+    timeout: float = 5.0,
+    max_pending: int = 4096,
+    result: ReplayResult | None = None,
+    on_progress: Callable[[ReplayResult], None] | None = None,
+) -> ReplayResult:
+    """Send ``events`` at ``speed`` × their logged pace (``speed=0``: flat out).
+
+    At most ``max_pending`` requests are outstanding. That bounds memory
+    when the server falls behind; the replay then lags, and ``max_lag``
+    reports by how much.
+    """
+    ports = {"auth": client.authport, "acct": client.acctport}
+    endpoints = {
+        kind: [await RadiusEndpoint.open(client.server, port, client.secret) for _ in range(sockets)]
+        for kind, port in ports.items()
+    }
+    result = result if result is not None else ReplayResult()
+    slots = asyncio.Semaphore(max_pending)
+    tasks: set[asyncio.Task] = set()
+    n = 0
+
+    async def send(event: Event, pkt: pyrad.packet.Packet, endpoint: RadiusEndpoint, intended: float) -> None:
+        try:
+            outcome = await endpoint.send(pkt, timeout, intended=intended)
+        except EndpointClosed:
+            result.errors += 1
+            return
+        finally:
+            slots.release()
+        if outcome.code is None:
+            result.timeouts[event.kind] += 1
+            return
+        result.answered[event.kind] += 1
+        result.histogram.record(outcome.latency)
+        expected = _EXPECTED_CODE.get(event.fields.get("result"))
+        if expected is not None and outcome.code != expected:
+            result.mismatched += 1
+
+    start = time.perf_counter()
+    last_progress = start
+    try:
+        for offset, event in spread(events):
+            password = ""
+            if event.kind == "auth":
+                password = passwords.get(event.fields["user"], default_password)
+                if password is None:
+                    result.lines["no_password"] += 1
+                    continue
+            intended = start + offset / speed if speed else time.perf_counter()
+            delay = intended - time.perf_counter()
+            result.max_lag = max(result.max_lag, -delay)
+            # Yield even when behind schedule so replies keep being processed.
+            await asyncio.sleep(max(0.0, delay))
+            await slots.acquire()
+            pkt = build_packet(client, event, password)
+            task = asyncio.create_task(send(event, pkt, endpoints[event.kind][n % sockets], intended))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
+            result.sent[event.kind] += 1
+            result.log_span = offset
+            n += 1
+            if on_progress and time.perf_counter() - last_progress >= 0.25:
+                last_progress = time.perf_counter()
+                on_progress(result)
+        if tasks:
+            await asyncio.gather(*tasks)
+    finally:
+        result.elapsed = time.perf_counter() - start
+        for pool in endpoints.values():
+            for endpoint in pool:
+                await endpoint.close()
+    return result
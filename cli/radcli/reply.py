@@ -0,0 +1,145 @@
+"""Code-first, lazily decoded RADIUS replies.
+
+Throughput runs only need a reply's code, identifier and a valid Response
+Authenticator, and ``verify_reply`` checks those on a ``memoryview`` without
+copying the datagram. ``LazyReply`` wraps the same buffer and leaves the
+AVPs alone until something reads them. The first ``keys()`` or ``reply[name]``
+indexes the attribute list as offsets into the buffer, and values are
+decoded only when asked for. It answers the same ``keys()`` /
+``reply[name]`` calls as ``pyrad.packet.Packet``, so ``display.attribute_table``
+renders either one.
+"""
+
+import hashlib
+import hmac
+
+import pyrad.packet
+from pyrad import tools
+from pyrad.dictionary import Dictionary
+
+_VENDOR_SPECIFIC = 26
+
+_CODE_NAMES = {
+    pyrad.packet.AccessAccept: "Access-Accept",
+    pyrad.packet.AccessReject: "Access-Reject",
+    pyrad.packet.AccessChallenge: "Access-Challenge",
+    pyrad.packet.AccountingResponse: "Accounting-Response",
+}
+
+
+def code_name(code: int) -> str:
+    """The RFC name of a reply code, e.g. ``Access-Accept``."""
+    return _CODE_NAMES.get(code, f"Unknown ({code})")
+
+
+def verify_reply(data: bytes | memoryview, request_authenticator: bytes, secret: bytes) -> bool:
+    """Check the header length and Response Authenticator of a reply, copy-free."""
+    view = memoryview(data)
+    if len(view) < 20 or int.from_bytes(view[2:4], "big") != len(view):
+        return False
+    digest = hashlib.md5(view[0:4])
+    digest.update(request_authenticator)
+    digest.update(view[20:])
+    digest.update(secret)
+    return hmac.compare_digest(view[4:20], digest.digest())
+
+
+class LazyReply:
+    """Read-only view of a verified reply; AVPs are decoded on first access."""
+
+    __slots__ = ("_view", "dict", "secret", "_index")
+
+    def __init__(self, data: bytes | memoryview, dictionary: Dictionary, secret: bytes = b"") -> None:
+        self._view = memoryview(data)
+        self.dict = dictionary
+        self.secret = secret
+        self._index: dict | None = None  # key → [memoryview of each raw value]
+
+    @property
+    def code(self) -> int:
+        return self._view[0]
+
+    @property
+    def id(self) -> int:
+        return self._view[1]
+
+    @property
+    def authenticator(self) -> bytes:
+        return bytes(self._view[4:20])
+
+    def _avps(self) -> dict:
+        if self._index is None:
+            index: dict = {}
+            view = self._view
+            pos, end = 20, len(view)
+            while pos + 2 <= end:
+                key, length = view[pos], view[pos + 1]
+                if length < 2 or pos + length > end:
+                    raise pyrad.packet.PacketError(f"attribute at offset {pos} is corrupt")
+                value = view[pos + 2 : pos + length]
+                if key == _VENDOR_SPECIFIC and len(value) >= 6:
+                    self._split_vendor(index, value)
+                else:
+                    index.setdefault(key, []).append(value)
+                pos += length
+            self._index = index
+        return self._index
+
+    @staticmethod
+    def _split_vendor(index: dict, value: memoryview) -> None:
+        vendor = int.from_bytes(value[0:4], "big")
+        pos = 4
+        while pos + 2 <= len(value):
+            vtype, vlen = value[pos], value[pos + 1]
+            if vlen < 2 or pos + vlen > len(value):
+                index.setdefault(_VENDOR_SPECIFIC, []).append(value)  # not RFC 2865 §5.26 form
+                return
+            index.setdefault((vendor, vtype), []).append(value[pos + 2 : pos + vlen])
+            pos += vlen
+
+    def _name(self, key):
+        attrindex = self.dict.attrindex
+        return attrindex.GetBackward(key) if attrindex.HasBackward(key) else key
+
+    def keys(self) -> list:
+        return [self._name(key) for key in self._avps()]
+
+    def __contains__(self, key) -> bool:
+        if isinstance(key, str):
+            key = self.dict.attrindex.GetForward(key) if self.dict.attrindex.HasForward(key) else None
+        return key in self._avps()
+
+    def __getitem__(self, key) -> list:
+        if not isinstance(key, str):
+            return [bytes(v) for v in self._avps()[key]]
+        attr = self.dict.attributes[key]
+        raw = self._avps()[self.dict.attrindex.GetForward(key)]
+        if attr.type == "tlv" or attr.encrypt == 2:
+            # Nested TLVs and salt-encrypted values are rare in replies;
+            # let pyrad handle them rather than duplicate its decoders.
+            return self.packet()[key]
+        values = []
+        for v in raw:
+            value = bytes(v)
+            values.append(
+                attr.values.GetBackward(value) if attr.values.HasBackward(value) else tools.DecodeAttr(attr.type, value)
+            )
+        return values
+
+    def vendor(self, vendor_id: int) -> dict[int, list[bytes]]:
+        """Raw values of one vendor's attributes by type, whatever the dictionary knows."""
+        found: dict[int, list[bytes]] = {}
+        for key, values in self._avps().items():
+            if isinstance(key, tuple) and key[0] == vendor_id:
+                found[key[1]] = [bytes(v) for v in values]
+        return found
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def packet(self) -> pyrad.packet.Packet:
+        """Fully decode into a ``pyrad.packet.Packet`` (copies the buffer)."""
+        return pyrad.packet.Packet(packet=bytes(self._view), dict=self.dict, secret=self.secret)
@@ -0,0 +1,302 @@
+"""In-process stand-in RADIUS server for benchmarks and integration tests.
+
+It answers Access-Request, Accounting-Request and Status-Server from the
+same user data the freeradius role renders into ``mods-config/files/authorize``
+(``authorize_users.j2``). That data can come from the role's
+``freeradius_test_users`` variable or from a users file in the rendered
+format. Compared with FreeRADIUS it only knows PAP and the ``files``
+module. In exchange it has no container to start, and it can inject
+latency and loss.
+
+Speed matters more than generality here. The reply attributes for every
+user are encoded once, at load time. The request path only scans the
+attribute list for User-Name and User-Password, runs one MD5 per 16
+password bytes, and sends the pre-encoded reply. One core answers tens of
+thousands of requests per second, so benchmarks measure the client rather
+than the stand-in.
+"""
+
+import asyncio
+import hashlib
+import hmac
+import random
+import re
+import struct
+import time
+from collections.abc import Iterator
+from dataclasses import dataclass, field
+from functools import lru_cache
+from pathlib import Path
+
+import pyrad.packet
+from pyrad.dictionary import Dictionary
+
+from radcli.serverstats import STATISTICS_TYPE, VENDOR
+from radcli.template import STATUS_SERVER_CODE, vsa
+
+# Where the freeradius role keeps freeradius_test_users.
+ANSIBLE_USERS = Path(__file__).resolve().parents[2] / "ansible" / "roles" / "freeradius" / "defaults" / "main.yml"
+
+_HEADER = struct.Struct("!BBH")
+_USER_NAME, _USER_PASSWORD, _VENDOR_SPECIFIC, _MESSAGE_AUTHENTICATOR = 1, 2, 26, 80
+_ZERO_AUTH = bytes(16)
+_STATS_REQUEST = VENDOR.to_bytes(4, "big") + bytes([STATISTICS_TYPE])
+
+# One "Attr op value" item; values are "quoted" or run to the next comma/space.
+_ITEM = re.compile(r'([\w.-]+)\s*(:=|==|\+=|=)\s*("(?:[^"\\]|\\.)*"|[^,\s]+)')
+
+
+def parse_users_file(lines) -> Iterator[tuple[str, dict[str, str], list[tuple[str, str]]]]:
+    """Yield ``(username, check items, reply items)`` per entry of a users file.
+
+    Covers what ``authorize_users.j2`` produces: the username and check
+    items on an unindented line, reply items on the indented lines below
+    it. Comments and blank lines are skipped. Entries are streamed, so
+    memory stays constant however long the file is.
+    """
+    entry = None
+    for line in lines:
+        stripped = line.strip()
+        if not stripped or stripped.startswith("#"):
+            continue
+        if not line[0].isspace():
+            if entry is not None:
+                yield entry
+            name, _, rest = stripped.partition(" ")
+            check = {attr: _unquote(value) for attr, _, value in _ITEM.findall(rest)}
+            entry = (_unquote(name), check, [])
+        elif entry is not None:
+            entry[2].extend((attr, _unquote(value)) for attr, _, value in _ITEM.findall(stripped))
+    if entry is not None:
+        yield entry
+
+
+def _unquote(value: str) -> str:
+    if len(value) >= 2 and value[0] == value[-1] == '"':
+        return value[1:-1].replace('\\"', '"').replace("\\\\", "\\")
+    return value
+
+
+def ansible_users(path: str | Path = ANSIBLE_USERS) -> Iterator[tuple[str, dict[str, str], list[tuple[str, str]]]]:
+    """The role's ``freeradius_test_users``, shaped like ``parse_users_file`` entries."""
+    try:
+        import yaml
+    except ImportError:
+        raise RuntimeError("reading Ansible variables needs PyYAML (pip install pyyaml)") from None
+    data = yaml.safe_load(Path(path).read_text()) or {}
+    for user in data.get("freeradius_test_users", []):
+        reply = [("Reply-Message", str(user["reply_message"])), ("Session-Timeout", str(user["session_timeout"]))]
+        for extra in user.get("extra_attrs", []):
+            reply.extend((attr, _unquote(value)) for attr, _, value in _ITEM.findall(extra))
+        yield str(user["username"]), {"Cleartext-Password": str(user["password"])}, reply
+
+
+def load_users(path: str | Path, dictionary: Dictionary) -> dict[bytes, tuple[bytes, bytes]]:
+    """``{username: (password, encoded reply AVPs)}`` from an Ansible vars file or a users file."""
+    path = Path(path)
+
+    @lru_cache(maxsize=65536)
+    def encode(attr: str, value: str) -> bytes:
+        # Generated corpora repeat the same few reply items; encode each once.
+        pkt = pyrad.packet.Packet(dict=dictionary)
+        definition = dictionary.attributes[attr]
+        if definition.type in ("integer", "integer64", "short", "byte", "date") and not definition.values.HasForward(
+            value
+        ):
+            value = int(value)
+        pkt.AddAttribute(attr, value)
+        return pkt._PktEncodeAttributes()
+
+    users = {}
+    if path.suffix in (".yml", ".yaml"):
+        entries = ansible_users(path)
+    else:
+        with open(path, encoding="utf-8") as f:
+            entries = list(parse_users_file(f))
+    for name, check, reply in entries:
+        password = check.get("Cleartext-Password")
+        if password is None:
+            continue  # no PAP secret, nothing the stand-in can authenticate
+        try:
+            attrs = b"".join(encode(attr, value) for attr, value in reply)
+        except KeyError as exc:
+            raise ValueError(f"user {name!r}: attribute {exc} is not in the dictionary") from None
+        users[name.encode()] = (password.encode(), attrs)
+    return users
+
+
+@dataclass
+class ResponderStats:
+    access_requests: int = 0
+    access_accepts: int = 0
+    access_rejects: int = 0
+    accounting_requests: int = 0
+    accounting_responses: int = 0
+    status_requests: int = 0
+    invalid: int = 0  # malformed or failed the Request Authenticator check
+    dropped: int = 0  # lost on purpose (``loss``)
+    start_time: float = field(default_factory=time.time)
+
+    def to_dict(self) -> dict:
+        return dict(vars(self))
+
+
+class Responder:
+    """Shared state for every port the stand-in listens on."""
+
+    def __init__(
+        self,
+        users: dict[bytes, tuple[bytes, bytes]],
+        secret: bytes,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        loss: float = 0.0,
+        seed: int | None = None,
+    ) -> None:
+        self.users = users
+        self.secret = secret
+        self.latency = latency
+        self.jitter = jitter
+        self.loss = loss
+        self.stats = ResponderStats()
+        self._random = random.Random(seed).random
+        self._secret_md5 = hashlib.md5(secret)
+        self._transports: list[asyncio.DatagramTransport] = []
+
+    def _reply(self, code: int, ident: int, request_auth: bytes, attrs: bytes, *, message_authenticator: bool) -> bytes:
+        if message_authenticator:
+            attrs += b"\x50\x12" + _ZERO_AUTH
+            header = _HEADER.pack(code, ident, 20 + len(attrs))
+            mac = hmac.new(self.secret, header + request_auth + attrs, hashlib.md5).digest()
+            attrs = attrs[:-16] + mac
+        else:
+            header = _HEADER.pack(code, ident, 20 + len(attrs))
+        return header + hashlib.md5(header + request_auth + attrs + self.secret).digest() + attrs
+
+    def _password(self, hidden: bytes, request_auth: bytes) -> bytes:
+        plain = bytearray()
+        last = request_auth
+        for i in range(0, len(hidden), 16):
+            digest = self._secret_md5.copy()
+            digest.update(last)
+            chunk = hidden[i : i + 16]
+            plain += (int.from_bytes(chunk, "big") ^ int.from_bytes(digest.digest()[: len(chunk)], "big")).to_bytes(
+                len(chunk), "big"
+            )
+            last = chunk
+        return bytes(plain).rstrip(b"\x00")
+
+    def _stats_attrs(self) -> bytes:
+        s = self.stats
+        counters = (
+            (128, s.access_requests),
+            (129, s.access_accepts),
+            (130, s.access_rejects),
+            (135, s.invalid),
+            (136, s.dropped),
+            (148, s.accounting_requests),
+            (149, s.accounting_responses),
+            (176, int(s.start_time)),
+            (177, int(s.start_time)),
+        )
+        return b"".join(vsa(VENDOR, attr, (value & 0xFFFFFFFF).to_bytes(4, "big")) for attr, value in counters)
+
+    def handle(self, data: bytes, *, acct_port: bool = False) -> bytes | None:
+        """The reply to one request datagram, or ``None`` to stay silent."""
+        if len(data) < 20 or int.from_bytes(data[2:4], "big") > len(data):
+            self.stats.invalid += 1
+            return None
+        code, ident = data[0], data[1]
+        request_auth = data[4:20]
+        user = hidden = None
+        has_ma = stats_query = False
+        pos, end = 20, int.from_bytes(data[2:4], "big")
+        while pos + 2 <= end:
+            attr, length = data[pos], data[pos + 1]
+            if length < 2:
+                self.stats.invalid += 1
+                return None
+            if attr == _USER_NAME:
+                user = data[pos + 2 : pos + length]
+            elif attr == _USER_PASSWORD:
+                hidden = data[pos + 2 : pos + length]
+            elif attr == _MESSAGE_AUTHENTICATOR:
+                has_ma = True
+            elif attr == _VENDOR_SPECIFIC and data[pos + 2 : pos + 7] == _STATS_REQUEST:
+                stats_query = True
+            pos += length
+
+        if code == pyrad.packet.AccessRequest:
+            self.stats.access_requests += 1
+            entry = self.users.get(user)
+            if entry is not None and hidden is not None and self._password(hidden, request_auth) == entry[0]:
+                self.stats.access_accepts += 1
+                return self._reply(
+                    pyrad.packet.AccessAccept, ident, request_auth, entry[1], message_authenticator=has_ma
+                )
+            self.stats.access_rejects += 1
+            return self._reply(pyrad.packet.AccessReject, ident, request_auth, b"", message_authenticator=has_ma)
+
+        if code == pyrad.packet.AccountingRequest:
+            expected = hashlib.md5(data[:4] + _ZERO_AUTH + data[20:end] + self.secret).digest()
+            if not hmac.compare_digest(expected, request_auth):
+                self.stats.invalid += 1
+                return None
+            self.stats.accounting_requests += 1
+            self.stats.accounting_responses += 1
+            return self._reply(
+                pyrad.packet.AccountingResponse, ident, request_auth, b"", message_authenticator=False
+            )
+
+        if code == STATUS_SERVER_CODE:
+            self.stats.status_requests += 1
+            reply_code = pyrad.packet.AccountingResponse if acct_port else pyrad.packet.AccessAccept
+            attrs = self._stats_attrs() if stats_query else b""
+            return self._reply(reply_code, ident, request_auth, attrs, message_authenticator=True)
+
+        self.stats.invalid += 1
+        return None
+
+    async def listen(self, host: str, port: int, *, acct_port: bool = False) -> int:
+        """Start answering on ``host:port`` (0 picks a free port); return the bound port."""
+        loop = asyncio.get_running_loop()
+        transport, _ = await loop.create_datagram_endpoint(
+            lambda: _ResponderProtocol(self, acct_port),
+            local_addr=(host, port),
+        )
+        self._transports.append(transport)
+        return transport.get_extra_info("sockname")[1]
+
+    def close(self) -> None:
+        for transport in self._transports:
+            transport.close()
+        self._transports.clear()
+
+
+class _ResponderProtocol(asyncio.DatagramProtocol):
+    def __init__(self, responder: Responder, acct_port: bool) -> None:
+        self.responder = responder
+        self.acct_port = acct_port
+        self.transport: asyncio.DatagramTransport | None = None
+
+    def connection_made(self, transport) -> None:
+        self.transport = transport
+
+    def datagram_received(self, data: bytes, addr) -> None:
+        responder = self.responder
+        if responder.loss and responder._random() < responder.loss:
+            responder.stats.dropped += 1
+            return
+        reply = responder.handle(data, acct_port=self.acct_port)
+        if reply is None:
+            return
+        delay = responder.latency + responder.jitter * responder._random() if responder.jitter else responder.latency
+        if delay > 0:
+            asyncio.get_running_loop().call_later(delay, self.transport.sendto, reply, addr)
+        else:
+            self.transport.sendto(reply, addr)
+
+    def error_received(self, exc: Exception) -> None:
+        # A client went away (ICMP port-unreachable); nothing to do.
+        pass
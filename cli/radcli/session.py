@@ -0,0 +1,149 @@
+"""Warm per-profile RADIUS sessions for the shell and daemon.
+
+A one-shot radcli run pays for interpreter startup, dictionary load,
+config layering and a fresh UDP socket on every request. A ``Session``
+keeps all of that alive — one resolved ``RadiusConfig``, one pyrad client
+(for its dictionary and packet factory) and one open ``RadiusEndpoint``
+per port — so repeated auth/acct/status requests cost a round trip and
+little else.
+"""
+
+import time
+import uuid
+from dataclasses import dataclass
+
+import pyrad.packet
+
+from radcli.client import make_client
+from radcli.config import RadiusConfig, load_config
+from radcli.engine import RadiusEndpoint
+from radcli.reply import LazyReply, code_name
+from radcli.template import STATUS_SERVER_CODE, PacketTemplate
+
+ACCT_STATUS_TYPES = {"start": "Start", "stop": "Stop", "interim": "Interim-Update"}
+
+
+@dataclass
+class OpResult:
+    """Outcome of one request sent through a Session."""
+
+    op: str
+    code: int | None  # None → timed out
+    latency: float  # seconds
+    reply: LazyReply | None = None  # attributes decode on first read
+    detail: str = ""  # e.g. the Acct-Session-Id used
+
+    @property
+    def label(self) -> str:
+        return "Timeout" if self.code is None else code_name(self.code)
+
+    def attributes(self) -> dict[str, list[str]]:
+        if self.reply is None:
+            return {}
+        # Octets print as FreeRADIUS shows them (0x…), not as a Python bytes repr.
+        return {
+            str(key): ["0x" + v.hex() if isinstance(v, bytes) else str(v) for v in self.reply[key]]
+            for key in self.reply.keys()
+        }
+
+    def to_dict(self) -> dict:
+        result = {
+            "op": self.op,
+            "code": self.code,
+            "result": self.label,
+            "latency_ms": round(self.latency * 1000, 3),
+            "attributes": self.attributes(),
+        }
+        if self.detail:
+            result["detail"] = self.detail
+        return result
+
+
+class Session:
+    """One target server with its dictionary loaded and sockets open."""
+
+    def __init__(self, config: RadiusConfig, *, timeout: float = 5.0) -> None:
+        self.config = config
+        self.timeout = timeout
+        self.client = make_client(config)
+        self._auth = PacketTemplate(self.client, NAS_Identifier="radcli")
+        self._status = PacketTemplate(self.client, STATUS_SERVER_CODE, NAS_Identifier="radcli")
+        self._endpoints: dict[int, RadiusEndpoint] = {}
+
+    async def _endpoint(self, port: int) -> RadiusEndpoint:
+        endpoint = self._endpoints.get(port)
+        if endpoint is None:
+            endpoint = await RadiusEndpoint.open(self.config.server, port, self.client.secret, retry=self.client.retry)
+            self._endpoints[port] = endpoint
+        return endpoint
+
+    async def _send(self, op: str, pkt: pyrad.packet.Packet, port: int, detail: str = "") -> OpResult:
+        endpoint = await self._endpoint(port)
+        outcome = await endpoint.send(pkt, self.timeout)
+        reply = LazyReply(outcome.raw, self.client.dict, self.client.secret) if outcome.raw is not None else None
+        return OpResult(op=op, code=outcome.code, latency=outcome.latency, reply=reply, detail=detail)
+
+    async def _send_template(self, op: str, template: PacketTemplate, port: int, **fields) -> OpResult:
+        endpoint = await self._endpoint(port)
+        outcome = await endpoint.send_encoded(lambda ident: template.encode(ident, **fields), self.timeout)
+        reply = template.decode_reply(outcome.raw) if outcome.raw is not None else None
+        return OpResult(op=op, code=outcome.code, latency=outcome.latency, reply=reply)
+
+    async def auth(self, user: str = "testrunner", password: str = "run123") -> OpResult:
+        return await self._send_template("auth", self._auth, self.config.auth_port, user=user, password=password)
+
+    async def acct(
+        self,
+        status_type: str = "start",
+        user: str = "testrunner",
+        session_id: str | None = None,
+        session_time: int | None = None,
+    ) -> OpResult:
+        resolved = ACCT_STATUS_TYPES.get(status_type.lower())
+        if resolved is None:
+            raise ValueError(f"invalid status type {status_type!r} (use start, stop, or interim)")
+        sid = session_id or uuid.uuid4().hex[:16]
+        req = self.client.CreateAcctPacket(code=pyrad.packet.AccountingRequest)
+        req["User-Name"] = user
+        req["Acct-Session-Id"] = sid
+        req["Acct-Status-Type"] = resolved
+        req["NAS-Identifier"] = "radcli"
+        req["NAS-IP-Address"] = "127.0.0.1"
+        if session_time is not None:
+            req["Acct-Session-Time"] = session_time
+        return await self._send("acct", req, self.config.acct_port, detail=sid)
+
+    async def status(self) -> OpResult:
+        return await self._send_template("status", self._status, self.config.auth_port)
+
+    async def close(self) -> None:
+        for endpoint in self._endpoints.values():
+            await endpoint.close()
+        self._endpoints.clear()
+
+
+class SessionPool:
+    """Sessions keyed by profile name (``None`` = the default config)."""
+
+    def __init__(self, default: RadiusConfig, *, timeout: float = 5.0) -> None:
+        self.default = default
+        self.timeout = timeout
+        self._sessions: dict[str | None, Session] = {}
+        self.started = time.monotonic()
+
+    def get(self, profile: str | None = None) -> Session:
+        session = self._sessions.get(profile)
+        if session is None:
+            config = self.default if profile is None else load_config(profile=profile)
+            session = Session(config, timeout=self.timeout)
+            self._sessions[profile] = session
+        return session
+
+    @property
+    def profiles(self) -> list[str | None]:
+        return list(self._sessions)
+
+    async def close(self) -> None:
+        for session in self._sessions.values():
+            await session.close()
+        self._sessions.clear()
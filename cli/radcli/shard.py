@@ -0,0 +1,183 @@
+"""Multi-process sharding for the load generator.
+
+One Python process saturates a core on packet encoding long before a
+production FreeRADIUS node saturates, so ``run_sharded`` fans the run out to
+worker processes (optionally pinned one per CPU), each with its own set of
+source sockets, and merges their results into a single ``BenchResult``.
+"""
+
+import asyncio
+import os
+import uuid
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from radcli.client import make_client
+from radcli.config import RadiusConfig
+from radcli.corpus import Corpus, CorpusEncoder
+from radcli.engine import RetryPolicy
+from radcli.loadgen import BenchResult, auth_packet_factory, run_bench
+from radcli.loadprofile import LoadProfile
+from radcli.recorder import Recorder
+from radcli.template import PacketTemplate
+
+
+@dataclass
+class ShardSpec:
+    """Everything one worker process needs; must stay picklable."""
+
+    config: RadiusConfig
+    user: str
+    password: str
+    requests: int | None
+    duration: float | None
+    concurrency: int
+    sockets: int
+    timeout: float
+    rate: float | None = None
+    load: LoadProfile | None = None
+    seed: int | None = None
+    retry: RetryPolicy | None = None
+    corpus: str | None = None  # path; each worker maps it itself
+    sampling: str = "uniform"
+    bad_password: float = 0.0
+    unknown_user: float = 0.0
+    record: str | None = None  # this worker's recording file
+    record_meta: dict | None = None
+    cpu: int | None = None
+
+
+def _available_cpus() -> list[int]:
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return []
+
+
+def _run_shard(spec: ShardSpec) -> BenchResult:
+    """Worker entry point: pin, build a client from the config, run the loop."""
+    if spec.cpu is not None and hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, {spec.cpu})
+    client = make_client(spec.config)
+    if spec.corpus:
+        encode = CorpusEncoder(
+            Corpus(spec.corpus),
+            PacketTemplate(client, NAS_Identifier="radcli"),
+            sampling=spec.sampling,
+            bad_password=spec.bad_password,
+            unknown_user=spec.unknown_user,
+            seed=spec.seed,
+        )
+    else:
+        encode = auth_packet_factory(client, spec.user, spec.password)
+    recorder = Recorder(spec.record, spec.record_meta) if spec.record else None
+    try:
+        return asyncio.run(
+            run_bench(
+                client,
+                spec.config.auth_port,
+                encode,
+                requests=spec.requests,
+                duration=spec.duration,
+                concurrency=spec.concurrency,
+                sockets=spec.sockets,
+                timeout=spec.timeout,
+                rate=spec.rate,
+                arrivals=spec.load.arrivals(spec.seed) if spec.load else None,
+                retry=spec.retry,
+                recorder=recorder,
+            )
+        )
+    finally:
+        if recorder is not None:
+            recorder.close()
+
+
+def record_path(record: str, worker: int, workers: int) -> str:
+    """One file per worker: ``run.rrec`` → ``run.0.rrec``, ``run.1.rrec``, …"""
+    if workers == 1:
+        return record
+    path = Path(record)
+    return str(path.with_name(f"{path.stem}.{worker}{path.suffix}"))
+
+
+def _split(total: int | None, parts: int) -> list[int | None]:
+    """Divide a request budget across ``parts`` shards, remainder first."""
+    if total is None:
+        return [None] * parts
+    base, extra = divmod(total, parts)
+    return [base + (1 if i < extra else 0) for i in range(parts)]
+
+
+def run_sharded(
+    config: RadiusConfig,
+    user: str,
+    password: str,
+    *,
+    workers: int = 1,
+    pin: bool = True,
+    requests: int | None = None,
+    duration: float | None = None,
+    concurrency: int = 64,
+    sockets: int = 1,
+    timeout: float = 5.0,
+    rate: float | None = None,
+    load: LoadProfile | None = None,
+    seed: int | None = None,
+    retry: RetryPolicy | None = None,
+    corpus: str | None = None,
+    sampling: str = "uniform",
+    bad_password: float = 0.0,
+    unknown_user: float = 0.0,
+    record: str | None = None,
+    label: str = "",
+) -> BenchResult:
+    """Run the bench across ``workers`` processes × ``sockets`` sockets and merge the results.
+
+    An open-loop ``rate`` or ``load`` profile is the total across all
+    workers; each gets an equal share (and its own Poisson seed). With a
+    ``corpus``, credentials are sampled from it instead of ``user``/``password``.
+    ``record`` writes every request to a recording (one file per worker,
+    sharing a run id) for ``radcli report``; ``label`` names the run there.
+    """
+    cpus = _available_cpus() if pin and workers > 1 else []
+    run = uuid.uuid4().hex[:12]
+    specs = [
+        ShardSpec(
+            config=config,
+            user=user,
+            password=password,
+            requests=budget,
+            duration=duration,
+            concurrency=concurrency,
+            sockets=sockets,
+            timeout=timeout,
+            rate=rate / workers if rate else None,
+            load=load.scaled(1 / workers) if load else None,
+            seed=None if seed is None else seed + i,
+            retry=retry,
+            corpus=corpus,
+            sampling=sampling,
+            bad_password=bad_password,
+            unknown_user=unknown_user,
+            record=record_path(record, i, workers) if record else None,
+            record_meta={
+                "run": run,
+                "label": label,
+                "worker": i,
+                "workers": workers,
+                "target": f"{config.server}:{config.auth_port}",
+            },
+            cpu=cpus[i % len(cpus)] if cpus else None,
+        )
+        for i, budget in enumerate(_split(requests, workers))
+    ]
+
+    if workers == 1:
+        return _run_shard(specs[0])
+
+    merged = BenchResult()
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for shard in pool.map(_run_shard, specs):
+            merged.merge(shard)
+    return merged
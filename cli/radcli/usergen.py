@@ -0,0 +1,185 @@
+"""Synthetic users files and credential corpora for server-side scaling tests.
+
+The freeradius role renders a handful of ``freeradius_test_users`` into
+``mods-config/files/authorize``, so the lab never sees what a large users
+file costs FreeRADIUS. ``UserSpec`` describes millions of users without
+holding any of them. User ``i`` is ``<prefix><i>``. Its password is a
+keyed BLAKE2b of ``i`` under the seed. So the users file, the matching
+credential corpus, and any credential a load generator picks at random
+can each be derived on their own, in any order, in constant memory.
+
+Entries are written in the same layout ``authorize_users.j2`` produces,
+so ``radcli responder --users`` reads them back too::
+
+    user00000000  Cleartext-Password := "3f9c0a1b7d2e"
+        Reply-Message := "Welcome, user00000000!",
+        Session-Timeout := 3600
+"""
+
+import asyncio
+import hashlib
+import random
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import TextIO
+
+import pyrad.packet
+
+from radcli.engine import RadiusEndpoint
+from radcli.template import PacketTemplate
+
+# Reply items for every user, as in the role's defaults; {user} and {index}
+# are filled in per user.
+DEFAULT_REPLY = ('Reply-Message := "Welcome, {user}!"', "Session-Timeout := 3600")
+
+# Entries formatted per write() call — big enough to amortise the call,
+# small enough that memory stays flat.
+_BATCH = 4096
+
+
+@dataclass(frozen=True)
+class UserSpec:
+    """``count`` users named ``prefix`` + zero-padded index, passwords keyed by ``seed``."""
+
+    count: int
+    seed: int = 0
+    prefix: str = "user"
+    reply: tuple[str, ...] = DEFAULT_REPLY
+
+    def __post_init__(self) -> None:
+        if self.count < 0:
+            raise ValueError("count must be >= 0")
+
+    @property
+    def _width(self) -> int:
+        return max(8, len(str(max(self.count - 1, 0))))
+
+    @property
+    def _key(self) -> bytes:
+        return str(self.seed).encode()
+
+    def username(self, index: int) -> str:
+        return f"{self.prefix}{index:0{self._width}d}"
+
+    def password(self, index: int) -> str:
+        return hashlib.blake2b(index.to_bytes(8, "big"), key=self._key, digest_size=6).hexdigest()
+
+    def credentials(self, start: int = 0, stop: int | None = None) -> Iterator[tuple[str, str]]:
+        """``(username, password)`` for users ``start`` up to ``stop`` (default: all)."""
+        prefix, width, key = self.prefix, self._width, self._key
+        for index in range(start, self.count if stop is None else min(stop, self.count)):
+            digest = hashlib.blake2b(index.to_bytes(8, "big"), key=key, digest_size=6).hexdigest()
+            yield f"{prefix}{index:0{width}d}", digest
+
+    def _entry_format(self) -> str:
+        body = ",\n    ".join(self.reply)
+        entry = '{user}  Cleartext-Password := "{password}"\n'
+        if body:
+            # Double any literal braces so str.format only sees the placeholders.
+            escaped = body.replace("{", "{{").replace("}", "}}")
+            escaped = escaped.replace("{{user}}", "{user}").replace("{{index}}", "{index}")
+            entry += f"    {escaped}\n"
+        return entry + "\n"
+
+
+def write_users_file(spec: UserSpec, out: TextIO, credentials: TextIO | None = None) -> int:
+    """Stream ``spec`` as users-file entries to ``out`` and return the user count.
+
+    ``credentials``, if given, receives the matching ``username,password``
+    CSV corpus from the same pass.
+    """
+    entry = spec._entry_format()
+    if credentials is not None:
+        credentials.write("username,password\n")
+    written = 0
+    while written < spec.count:
+        batch = list(spec.credentials(written, written + _BATCH))
+        out.write(
+            "".join(
+                entry.format(user=user, password=password, index=written + i) for i, (user, password) in enumerate(batch)
+            )
+        )
+        if credentials is not None:
+            credentials.write("".join(f"{user},{password}\n" for user, password in batch))
+        written += len(batch)
+    return written
+
+
+def write_credentials(spec: UserSpec, out: TextIO) -> int:
+    """Stream only the ``username,password`` CSV corpus for ``spec``."""
+    out.write("username,password\n")
+    written = 0
+    while written < spec.count:
+        batch = list(spec.credentials(written, written + _BATCH))
+        out.write("".join(f"{user},{password}\n" for user, password in batch))
+        written += len(batch)
+    return written
+
+
+def credential_encoder(
+    spec: UserSpec, template: PacketTemplate, *, seed: int | None = None
+) -> Callable[[int], bytes]:
+    """``encode(identifier)`` for ``radcli.loadgen``: a PAP request for a random user of ``spec``.
+
+    Users are drawn uniformly from the whole corpus, so the server's lookup
+    can't get away with one hot entry.
+    """
+    pick = random.Random(seed).randrange
+
+    def encode(ident: int) -> bytes:
+        index = pick(spec.count)
+        return template.encode(ident, spec.username(index), spec.password(index))
+
+    return encode
+
+
+def serve_stand_in(users: str, host: str, secret: bytes, ready) -> None:
+    """Process entry point: serve ``users`` with the stand-in on a free port.
+
+    Puts the bound port, or an error message, on the ``ready`` queue.
+    """
+    from radcli.client import _find_dictionary
+    from radcli.dictcache import load_dictionary
+    from radcli.responder import Responder, load_users
+
+    try:
+        responder = Responder(load_users(users, load_dictionary(_find_dictionary())), secret)
+    except (ValueError, OSError) as exc:
+        ready.put(str(exc))
+        return
+
+    async def run() -> None:
+        ready.put(await responder.listen(host, 0))
+        await asyncio.Event().wait()
+
+    asyncio.run(run())
+
+
+async def wait_for_user(
+    server: str,
+    port: int,
+    template: PacketTemplate,
+    user: str,
+    password: str,
+    *,
+    deadline: float,
+    interval: float = 0.5,
+) -> float | None:
+    """Probe until ``user`` is accepted; return the seconds that took, or ``None`` at ``deadline``.
+
+    Used after a reload: the corpus's last user only exists once the new
+    users file is live.
+    """
+    start = time.monotonic()
+    endpoint = await RadiusEndpoint.open(server, port, template.secret, window=1)
+    try:
+        while time.monotonic() - start < deadline:
+            outcome = await endpoint.send_encoded(lambda ident: template.encode(ident, user, password), interval)
+            if outcome.code == pyrad.packet.AccessAccept:
+                return time.monotonic() - start
+            if outcome.code is not None:
+                await asyncio.sleep(interval)  # answered, but with the old users file
+    finally:
+        await endpoint.close()
+    return None
@@ -1,11 +1,26 @@
-"""Shared fixtures and CLI options for FreeRADIUS integration tests."""
+"""Shared fixtures and CLI options for FreeRADIUS integration tests.
 
+``radius_client`` is safe to share between threads and between xdist
+workers. Each worker process gets its own UDP sockets: one source port per
+server port, identifiers handed out by radcli's per-socket pool, and
+replies matched by identifier and authenticator. Workers therefore never
+see each other's replies, and tests can send many requests at once with
+``send_many``. Run the suite in parallel with ``pytest -n auto``.
+"""
+
+import asyncio
 import os
+import threading
+import uuid
+from concurrent.futures import Future
 from pathlib import Path
 
+import pyrad.packet
 import pytest
-from pyrad.client import Client
-from pyrad.dictionary import Dictionary
+from pyrad.client import Client, Timeout
+from radcli.dictcache import load_dictionary
+from radcli.engine import RadiusEndpoint, RetryPolicy
+from radcli.responder import ANSIBLE_USERS, Responder, load_users
 
 
 def pytest_addoption(parser):
@@ -31,22 +46,169 @@ def pytest_addoption(parser):
         default=int(os.environ.get("RADIUS_ACCT_PORT", "1813")),
         help="RADIUS accounting port (default: $RADIUS_ACCT_PORT or 1813)",
     )
+    parser.addoption(
+        "--radius-stand-in",
+        action="store_true",
+        help="Test against radcli's in-process stand-in responder instead of a real server",
+    )
+    parser.addoption(
+        "--radius-deadline",
+        type=float,
+        default=float(os.environ.get("RADIUS_DEADLINE", "30")),
+        help="Seconds each request may take, retransmissions included (default: $RADIUS_DEADLINE or 30)",
+    )
+    # Performance suite (tests/perf, run with: pytest -m perf perf/)
+    parser.addoption(
+        "--perf-profile",
+        default=os.environ.get("RADIUS_PERF_PROFILE", "local"),
+        help="Baseline name under perf/baselines/ (default: $RADIUS_PERF_PROFILE or local)",
+    )
+    parser.addoption(
+        "--perf-duration",
+        type=float,
+        default=3.0,
+        help="Seconds to drive each perf scenario (default: 3)",
+    )
+    parser.addoption(
+        "--perf-concurrency",
+        type=int,
+        default=32,
+        help="Requests in flight per perf scenario (default: 32)",
+    )
+    parser.addoption(
+        "--perf-threshold",
+        type=float,
+        default=0.25,
+        help="Allowed regression against the baseline as a fraction (default: 0.25 = 25%%)",
+    )
+    parser.addoption(
+        "--perf-update-baseline",
+        action="store_true",
+        help="Write this run's results as the new baseline instead of comparing",
+    )
+
+
+class AsyncRadiusClient:
+    """pyrad-compatible client backed by radcli's asyncio engine.
+
+    Packets are still built with ``CreateAuthPacket`` / ``CreateAcctPacket``
+    and the replies are ordinary pyrad packets. Sending happens on an event
+    loop in a background thread, so ``SendPacket`` can be called from any
+    thread and ``send_many`` keeps every packet in flight at once.
+    """
+
+    def __init__(self, client: Client, *, deadline: float, retry: RetryPolicy) -> None:
+        self.client = client
+        self.dict = client.dict
+        self.deadline = deadline
+        self.retry = retry
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="radius-client", daemon=True)
+        self._thread.start()
+        self._endpoints: dict[int, asyncio.Task] = {}
+
+    def CreateAuthPacket(self, **kwargs) -> pyrad.packet.AuthPacket:
+        return self.client.CreateAuthPacket(**kwargs)
+
+    def CreateAcctPacket(self, **kwargs) -> pyrad.packet.AcctPacket:
+        return self.client.CreateAcctPacket(**kwargs)
+
+    def _endpoint(self, port: int) -> asyncio.Task:
+        # Runs on the loop thread only, so no lock is needed.
+        if port not in self._endpoints:
+            self._endpoints[port] = self._loop.create_task(
+                RadiusEndpoint.open(self.client.server, port, self.client.secret, retry=self.retry)
+            )
+        return self._endpoints[port]
+
+    async def send(self, pkt: pyrad.packet.Packet) -> pyrad.packet.Packet:
+        """Send ``pkt``, retransmitting until the deadline, and return the decoded reply."""
+        is_acct = isinstance(pkt, pyrad.packet.AcctPacket)
+        endpoint = await self._endpoint(self.client.acctport if is_acct else self.client.authport)
+        outcome = await endpoint.send(pkt, self.deadline)
+        if outcome.raw is None:
+            raise Timeout
+        return pkt.CreateReply(packet=outcome.raw)
+
+    def submit(self, pkt: pyrad.packet.Packet) -> Future:
+        """Start sending ``pkt`` from any thread; the future resolves to the reply."""
+        return asyncio.run_coroutine_threadsafe(self.send(pkt), self._loop)
+
+    def SendPacket(self, pkt: pyrad.packet.Packet) -> pyrad.packet.Packet:
+        return self.submit(pkt).result()
+
+    def send_many(self, packets: list[pyrad.packet.Packet]) -> list[pyrad.packet.Packet]:
+        """Send all ``packets`` concurrently; replies come back in the same order."""
+        futures = [self.submit(pkt) for pkt in packets]
+        return [future.result() for future in futures]
+
+    def close(self) -> None:
+        async def shutdown() -> None:
+            for task in self._endpoints.values():
+                if task.done() and not task.exception():
+                    await task.result().close()
+
+        asyncio.run_coroutine_threadsafe(shutdown(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+
+@pytest.fixture(scope="session")
+def xdist_worker() -> str:
+    """This process's xdist worker id (``gw0``, ``gw1``, …), or ``main`` without xdist."""
+    return os.environ.get("PYTEST_XDIST_WORKER", "main")
+
+
+@pytest.fixture()
+def session_id(xdist_worker):
+    """A RADIUS session ID unique across tests and xdist workers."""
+    return f"{xdist_worker}-{uuid.uuid4().hex[:16]}"
 
 
 @pytest.fixture(scope="session")
 def radius_dictionary():
-    """Load the bundled RADIUS dictionary."""
+    """Load the bundled RADIUS dictionary (via radcli's compiled cache)."""
     dict_path = Path(__file__).parent / "dictionary"
-    return Dictionary(str(dict_path))
+    return load_dictionary(dict_path)
+
+
+@pytest.fixture(scope="session")
+def radius_target(request, radius_dictionary):
+    """``(server, auth_port, acct_port)`` from the options, or a stand-in with ``--radius-stand-in``.
+
+    The stand-in serves the freeradius role's test users on free local ports
+    from a background thread, one per xdist worker.
+    """
+    if not request.config.getoption("--radius-stand-in"):
+        yield (
+            request.config.getoption("--radius-server"),
+            request.config.getoption("--radius-auth-port"),
+            request.config.getoption("--radius-acct-port"),
+        )
+        return
+    secret = request.config.getoption("--radius-secret").encode()
+    responder = Responder(load_users(ANSIBLE_USERS, radius_dictionary), secret)
+    loop = asyncio.new_event_loop()
+    thread = threading.Thread(target=loop.run_forever, name="radius-stand-in", daemon=True)
+    thread.start()
+
+    async def start() -> tuple[int, int]:
+        return await responder.listen("127.0.0.1", 0), await responder.listen("127.0.0.1", 0, acct_port=True)
+
+    auth_port, acct_port = asyncio.run_coroutine_threadsafe(start(), loop).result()
+    yield "127.0.0.1", auth_port, acct_port
+    loop.call_soon_threadsafe(responder.close)
+    loop.call_soon_threadsafe(loop.stop)
+    thread.join()
+    loop.close()
 
 
 @pytest.fixture(scope="session")
-def radius_client(request, radius_dictionary):
-    """Create a pyrad Client configured for the target RADIUS server."""
-    server = request.config.getoption("--radius-server")
+def radius_client(request, radius_dictionary, radius_target):
+    """Concurrency-safe client for the target RADIUS server, one per xdist worker."""
+    server, auth_port, acct_port = radius_target
     secret = request.config.getoption("--radius-secret")
-    auth_port = request.config.getoption("--radius-auth-port")
-    acct_port = request.config.getoption("--radius-acct-port")
 
     client = Client(
         server=server,
@@ -55,6 +217,6 @@ def radius_client(request, radius_dictionary):
         authport=auth_port,
         acctport=acct_port,
     )
-    client.retries = 3
-    client.timeout = 10
-    return client
+    radius = AsyncRadiusClient(client, deadline=request.config.getoption("--radius-deadline"), retry=RetryPolicy())
+    yield radius
+    radius.close()
@@ -0,0 +1,91 @@
+"""Fixtures for the performance regression suite.
+
+Each scenario records throughput and latency percentiles. Those are
+compared with a JSON baseline for the selected profile, in
+``perf/baselines/<profile>.json``. A metric that gets worse by more than
+``--perf-threshold`` fails the test. Throughput regresses when it drops;
+latency regresses when it rises. A scenario without a baseline fails, so
+a fresh profile never passes by default; record one deliberately with
+``--perf-update-baseline``, which writes this run's numbers and passes.
+"""
+
+import json
+import platform
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import pytest
+
+BASELINE_DIR = Path(__file__).parent / "baselines"
+
+# metric → True when higher is better
+METRICS = {"rate": True, "p50_ms": False, "p90_ms": False, "p99_ms": False}
+
+
+@dataclass
+class BaselineStore:
+    path: Path
+    threshold: float
+    update: bool
+    scenarios: dict = field(default_factory=dict)
+    dirty: bool = False
+
+    @classmethod
+    def load(cls, profile: str, threshold: float, update: bool) -> "BaselineStore":
+        path = BASELINE_DIR / f"{profile}.json"
+        scenarios = json.loads(path.read_text())["scenarios"] if path.exists() else {}
+        return cls(path, threshold, update, scenarios)
+
+    def check(self, scenario: str, metrics: dict) -> list[str]:
+        """Compare against the stored baseline; return one message per regression."""
+        if self.update:
+            self.scenarios[scenario] = metrics
+            self.dirty = True
+            return []
+        baseline = self.scenarios.get(scenario)
+        if baseline is None:
+            pytest.fail(
+                f"no {scenario!r} baseline in {self.path}; record one with --perf-update-baseline",
+                pytrace=False,
+            )
+        regressions = []
+        for name, higher_is_better in METRICS.items():
+            old, new = baseline.get(name), metrics[name]
+            if not old:
+                continue
+            change = (new - old) / old
+            worse = -change if higher_is_better else change
+            if worse > self.threshold:
+                regressions.append(f"{name}: {old:g} → {new:g} ({change:+.1%}, limit ±{self.threshold:.0%})")
+        return regressions
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        document = {
+            "recorded": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "host": platform.node(),
+            "scenarios": dict(sorted(self.scenarios.items())),
+        }
+        self.path.write_text(json.dumps(document, indent=2) + "\n")
+
+
+@pytest.fixture(scope="session")
+def perf_settings(request) -> dict:
+    return {
+        "duration": request.config.getoption("--perf-duration"),
+        "concurrency": request.config.getoption("--perf-concurrency"),
+    }
+
+
+@pytest.fixture(scope="session")
+def perf_baseline(request):
+    store = BaselineStore.load(
+        request.config.getoption("--perf-profile"),
+        request.config.getoption("--perf-threshold"),
+        request.config.getoption("--perf-update-baseline"),
+    )
+    yield store
+    store.save()
@@ -0,0 +1,120 @@
+"""Throughput and latency regression benchmarks (``pytest -m perf perf/``).
+
+Each scenario drives the server with radcli's closed-loop load generator
+for ``--perf-duration`` seconds, with ``--perf-concurrency`` requests in
+flight. Nearly every reply must be the expected code before the numbers
+are compared with the baseline. Run without ``-n``: workers benchmarking
+side by side would only measure each other.
+"""
+
+import asyncio
+import itertools
+
+import pyrad.packet
+import pytest
+from radcli.loadgen import BenchResult, auth_packet_factory, run_bench
+
+pytestmark = pytest.mark.perf
+
+# Share of replies that must carry the expected code.
+MIN_EXPECTED = 0.99
+
+
+def _acct_packet_factory(client, status_type: str, xdist_worker: str):
+    sequence = itertools.count()
+
+    def encode(ident: int) -> bytes:
+        pkt = client.CreateAcctPacket(code=pyrad.packet.AccountingRequest)
+        pkt["User-Name"] = "testrunner"
+        pkt["Acct-Session-Id"] = f"perf-{xdist_worker}-{next(sequence)}"
+        pkt["Acct-Status-Type"] = status_type
+        pkt["NAS-Identifier"] = "integration-test"
+        pkt["NAS-IP-Address"] = "127.0.0.1"
+        if status_type != "Start":
+            pkt["Acct-Session-Time"] = 60
+        pkt.id = ident
+        return pkt.RequestPacket()
+
+    return encode
+
+
+def _measure(client, port, encode, settings) -> tuple[dict, BenchResult]:
+    """Run one scenario; return its metrics and the full ``BenchResult``."""
+    result = asyncio.run(
+        run_bench(
+            client,
+            port,
+            encode,
+            duration=settings["duration"],
+            concurrency=settings["concurrency"],
+            timeout=2.0,
+        )
+    )
+    assert result.completed, f"no replies in {settings['duration']:g}s ({result.timeouts} timeouts)"
+    metrics = {
+        "rate": round(result.rate, 1),
+        "p50_ms": round(result.percentile(50) * 1000, 3),
+        "p90_ms": round(result.percentile(90) * 1000, 3),
+        "p99_ms": round(result.percentile(99) * 1000, 3),
+    }
+    return metrics, result
+
+
+def _check(perf_baseline, scenario: str, metrics: dict, result, expected_code: int) -> None:
+    share = result.codes[expected_code] / result.sent
+    assert share >= MIN_EXPECTED, f"only {share:.1%} of replies were code {expected_code}: {dict(result.codes)}"
+    regressions = perf_baseline.check(scenario, metrics)
+    assert not regressions, f"{scenario} regressed: " + "; ".join(regressions)
+
+
+def _reply(radius_client, user: str, password: str):
+    req = radius_client.CreateAuthPacket(
+        code=pyrad.packet.AccessRequest,
+        User_Name=user,
+        NAS_Identifier="integration-test",
+    )
+    req["User-Password"] = req.PwCrypt(password)
+    return radius_client.SendPacket(req)
+
+
+# Reply attributes eliterunner's Access-Accept carries (see test_authorization.py).
+ELITE_ATTRIBUTES = {
+    "Session-Timeout": [7200],
+    "Reply-Message": ["Welcome, elite runner!"],
+    "Framed-Protocol": ["PPP"],
+}
+
+
+@pytest.mark.parametrize(
+    ("scenario", "user", "password", "expected", "attributes"),
+    [
+        ("pap_accept", "testrunner", "run123", pyrad.packet.AccessAccept, None),
+        ("pap_reject_password", "testrunner", "wrongpassword", pyrad.packet.AccessReject, None),
+        ("pap_reject_unknown_user", "nonexistent_user", "anypassword", pyrad.packet.AccessReject, None),
+        ("authz_reply_attributes", "eliterunner", "elite456", pyrad.packet.AccessAccept, ELITE_ATTRIBUTES),
+    ],
+)
+def test_auth_performance(
+    radius_client, perf_settings, perf_baseline, scenario, user, password, expected, attributes
+):
+    if attributes:
+        # The load generator only counts codes; make sure the server is
+        # really building the reply this scenario is meant to time.
+        reply = _reply(radius_client, user, password)
+        assert reply.code == expected
+        for name, value in attributes.items():
+            assert reply[name] == value, f"{name}: {reply[name]!r}, expected {value!r}"
+    client = radius_client.client
+    metrics, result = _measure(client, client.authport, auth_packet_factory(client, user, password), perf_settings)
+    _check(perf_baseline, scenario, metrics, result, expected)
+
+
+@pytest.mark.parametrize(
+    ("scenario", "status_type"),
+    [("acct_start", "Start"), ("acct_interim", "Interim-Update"), ("acct_stop", "Stop")],
+)
+def test_acct_performance(radius_client, perf_settings, perf_baseline, xdist_worker, scenario, status_type):
+    client = radius_client.client
+    encode = _acct_packet_factory(client, status_type, xdist_worker)
+    metrics, result = _measure(client, client.acctport, encode, perf_settings)
+    _check(perf_baseline, scenario, metrics, result, pyrad.packet.AccountingResponse)
@@ -1,17 +1,8 @@
 """Accounting tests for FreeRADIUS (Accounting-Request → Accounting-Response)."""
 
-import uuid
-
-import pytest
 import pyrad.packet
 
 
-@pytest.fixture()
-def session_id():
-    """Generate a unique RADIUS session ID per test."""
-    return uuid.uuid4().hex[:16]
-
-
 def _create_acct_packet(radius_client, session_id, status_type, **extra):
     """Build an Accounting-Request with required AVPs."""
     req = radius_client.CreateAcctPacket(
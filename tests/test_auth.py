@@ -36,6 +36,19 @@ class TestValidAuthentication:
         reply = radius_client.SendPacket(req)
         assert reply["Session-Timeout"] == [3600]
 
+    def test_concurrent_requests_all_accepted(self, radius_client):
+        requests = []
+        for _ in range(32):
+            req = radius_client.CreateAuthPacket(
+                code=pyrad.packet.AccessRequest,
+                User_Name="testrunner",
+                NAS_Identifier="integration-test",
+            )
+            req["User-Password"] = req.PwCrypt("run123")
+            requests.append(req)
+        replies = radius_client.send_many(requests)
+        assert [reply.code for reply in replies] == [pyrad.packet.AccessAccept] * 32
+
 
 class TestInvalidAuthentication:
     """Tests for invalid credentials — expect Access-Reject."""
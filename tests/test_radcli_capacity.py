@@ -0,0 +1,102 @@
+"""Capacity search and load profiles (no RADIUS server needed).
+
+``find_capacity`` is driven by a fake ``run_at`` that answers like a
+server with a known knee, so the search logic is checked without
+sending a packet.
+"""
+
+from collections import Counter
+
+import pytest
+
+from radcli.capacity import find_capacity, judge
+from radcli.loadgen import BenchResult
+from radcli.loadprofile import constant, parse_profile
+
+LIMITS = {"p99_limit": 0.050, "timeout_limit": 0.01}
+
+
+def _result(sent, timeouts=0, latency=0.002, elapsed=1.0):
+    result = BenchResult(sent=sent, codes=Counter({2: sent - timeouts}), timeouts=timeouts, elapsed=elapsed)
+    result.histogram.record(latency, sent - timeouts)
+    return result
+
+
+def test_judge_passes_a_clean_step():
+    step = judge(500, _result(2000, elapsed=4.0), duration=4.0, **LIMITS)
+    assert step.passed, step.reason
+    assert step.achieved == pytest.approx(500)
+
+
+def test_judge_counts_replies_over_the_offered_window():
+    # Three timeouts stretch the run by the request timeout; that must not sink the rate.
+    step = judge(500, _result(2000, timeouts=3, elapsed=4.0 + 1.3), duration=4.0, **LIMITS)
+    assert step.passed, step.reason
+    assert step.achieved == pytest.approx(1997 / 4.0)
+
+
+def test_judge_fails_on_each_limit():
+    slow = judge(500, _result(2000, latency=0.2), duration=4.0, **LIMITS)
+    assert not slow.passed and "p99" in slow.reason
+    lossy = judge(500, _result(2000, timeouts=100), duration=4.0, **LIMITS)
+    assert not lossy.passed and "timeouts" in lossy.reason
+    behind = judge(500, _result(1000), duration=4.0, **LIMITS)
+    assert not behind.passed and "answered" in behind.reason
+
+
+def _server(knee, duration=1.0):
+    """A fake ``run_at``: answers everything below ``knee`` req/s, a third times out above it."""
+
+    def run_at(rate):
+        sent = round(rate * duration)
+        return _result(sent, timeouts=0 if rate <= knee else sent // 3, elapsed=duration)
+
+    return run_at
+
+
+def test_find_capacity_bisects_to_the_knee():
+    outcome = find_capacity(_server(3000), duration=1.0, low=100, high=100_000, precision=0.05, **LIMITS)
+    assert outcome.capacity is not None
+    assert 3000 * 0.95 <= outcome.capacity <= 3000
+    assert [step.rate for step in outcome.steps[:6]] == [100, 200, 400, 800, 1600, 3200]
+    assert all(step.passed == (step.rate <= 3000) for step in outcome.steps)
+
+
+def test_find_capacity_stops_at_the_ceiling():
+    outcome = find_capacity(_server(10_000), duration=1.0, low=100, high=1000, **LIMITS)
+    assert outcome.capacity == 1000
+    assert all(step.passed for step in outcome.steps)
+
+
+def test_find_capacity_fails_at_the_lowest_rate():
+    seen = []
+    outcome = find_capacity(_server(50), duration=1.0, low=100, on_step=seen.append, **LIMITS)
+    assert outcome.capacity is None
+    assert seen == outcome.steps and len(seen) == 1
+
+
+def test_constant_arrivals_are_evenly_spaced():
+    times = list(constant(100, 2.0).arrivals())
+    assert len(times) == 200
+    assert times[0] == 0.0
+    assert times[1] == pytest.approx(0.01)
+    assert times[-1] < 2.0
+
+
+def test_step_and_ramp_arrivals_match_the_profile_total():
+    step = parse_profile("step:100,200,400@1")
+    assert len(list(step.arrivals())) == pytest.approx(step.total, abs=1)
+    ramp = parse_profile("ramp:100-2000@10")
+    times = list(ramp.arrivals())
+    assert len(times) == pytest.approx(ramp.total, abs=1)
+    assert times == sorted(times) and times[-1] < ramp.duration
+    # A rising ramp packs its second half more densely than its first.
+    assert sum(t >= 5 for t in times) > 2 * sum(t < 5 for t in times)
+
+
+def test_poisson_arrivals_are_seeded_and_average_the_rate():
+    profile = parse_profile("poisson:1000", duration=10)
+    first = list(profile.arrivals(seed=7))
+    assert first == list(profile.arrivals(seed=7))
+    assert first != list(profile.arrivals(seed=8))
+    assert len(first) == pytest.approx(10_000, rel=0.05)
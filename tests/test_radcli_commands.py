@@ -0,0 +1,19 @@
+"""The lazy command registry in ``radcli.main`` (no RADIUS server needed).
+
+``radcli --help`` lists subcommands from ``_COMMANDS`` without importing
+them, so each registry summary must match the first paragraph of its
+command's docstring, which is what ``radcli <command> --help`` shows.
+"""
+
+import inspect
+
+import pytest
+
+from radcli.main import _COMMANDS, _load_command
+
+
+@pytest.mark.parametrize("name", list(_COMMANDS))
+def test_registry_summary_matches_command_docstring(name):
+    command = _load_command(name)
+    first_paragraph = inspect.cleandoc(command.help or "").split("\n\n")[0]
+    assert _COMMANDS[name][2] == " ".join(first_paragraph.split())
@@ -0,0 +1,139 @@
+"""Credential corpus file format and samplers (no RADIUS server needed)."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from radcli.corpus import Corpus, CorpusEncoder, CorpusWriter, make_sampler, read_csv_credentials
+from radcli.recorder import FLAG_BAD_PASSWORD, FLAG_UNKNOWN_USER
+
+
+def _write(path, count):
+    with CorpusWriter(path) as writer:
+        writer.extend((b"user%05d" % i, b"pw%d" % i) for i in range(count))
+    return path
+
+
+def test_corpus_round_trip(tmp_path):
+    corpus = Corpus(_write(tmp_path / "c.rc", 1000))
+    try:
+        assert len(corpus) == 1000
+        assert corpus[0] == (b"user00000", b"pw0")
+        assert corpus[999] == (b"user00999", b"pw999")
+        with pytest.raises(IndexError):
+            corpus[1000]
+    finally:
+        corpus.close()
+    assert [p.name for p in tmp_path.iterdir()] == ["c.rc"]
+
+
+def test_empty_password_and_empty_corpus(tmp_path):
+    with CorpusWriter(tmp_path / "c.rc") as writer:
+        writer.add(b"alice", b"")
+    corpus = Corpus(tmp_path / "c.rc")
+    assert corpus[0] == (b"alice", b"")
+    corpus.close()
+    _write(tmp_path / "empty.rc", 0)
+    assert len(Corpus(tmp_path / "empty.rc")) == 0
+
+
+def test_failed_write_leaves_no_corpus(tmp_path):
+    path = tmp_path / "c.rc"
+    with pytest.raises(ValueError):
+        with CorpusWriter(path) as writer:
+            writer.add(b"a", b"b")
+            writer.add(b"", b"no username")
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_failed_write_keeps_the_previous_corpus(tmp_path):
+    path = _write(tmp_path / "c.rc", 10)
+    with pytest.raises(ValueError):
+        with CorpusWriter(path) as writer:
+            writer.add(b"x" * 254, b"too long")
+    corpus = Corpus(path)
+    assert len(corpus) == 10
+    corpus.close()
+
+
+@pytest.mark.parametrize("content", [b"", b"RADCORP1", b"NOTACORP" + bytes(16)])
+def test_rejects_files_that_are_not_corpora(tmp_path, content):
+    path = tmp_path / "bad.rc"
+    path.write_bytes(content)
+    with pytest.raises(ValueError, match="not a radcli corpus"):
+        Corpus(path)
+
+
+def test_read_csv_credentials():
+    lines = ["username,password\n", "alice,secret\n", "\n", "bob,a,b\n"]
+    assert list(read_csv_credentials(lines)) == [(b"alice", b"secret"), (b"bob", b"a,b")]
+    with pytest.raises(ValueError, match="line 2"):
+        list(read_csv_credentials(["alice,x\n", "bob\n"]))
+
+
+def _draws(spec, count, n=50_000):
+    rng = random.Random(1)
+    draw = make_sampler(spec, count, rng.random)
+    return Counter(draw() for _ in range(n))
+
+
+def test_uniform_sampler_covers_the_corpus():
+    seen = _draws("uniform", 100)
+    assert set(seen) == set(range(100))
+    assert max(seen.values()) < 2 * min(seen.values())
+
+
+def test_zipf_sampler_is_skewed_and_scattered():
+    seen = _draws("zipf", 10_000)
+    ranked = [index for index, _ in seen.most_common()]
+    assert all(0 <= index < 10_000 for index in seen)
+    # Rank 1 takes about 1/H(10000) ≈ 10 % of the traffic at S=1 …
+    assert seen[ranked[0]] / 50_000 == pytest.approx(0.102, abs=0.02)
+    # … and the most popular records aren't just the first ones in the file.
+    assert sorted(ranked[:5]) != list(range(5))
+    steeper = _draws("zipf:2", 10_000)
+    assert steeper.most_common(1)[0][1] > seen.most_common(1)[0][1]
+
+
+def test_hot_sampler_share():
+    seen = _draws("hot:10:0.8", 10_000)
+    hot = [index for index, _ in seen.most_common(10)]
+    assert sum(seen[i] for i in hot) / 50_000 == pytest.approx(0.8, abs=0.02)
+
+
+@pytest.mark.parametrize("spec", ["gauss", "zipf:x", "zipf:0", "hot", "hot:0", "hot:10:1.5", "uniform:3"])
+def test_bad_sampler_specs(spec):
+    with pytest.raises(ValueError):
+        make_sampler(spec, 100, random.random)
+
+
+def test_sampler_needs_records():
+    with pytest.raises(ValueError, match="empty"):
+        make_sampler("uniform", 0, random.random)
+
+
+class _Template:
+    def encode(self, ident, username, password):
+        return username + b":" + password
+
+
+def test_encoder_mixes_in_rejects(tmp_path):
+    corpus = Corpus(_write(tmp_path / "c.rc", 100))
+    encode = CorpusEncoder(corpus, _Template(), bad_password=0.2, unknown_user=0.1, seed=3)
+    flags = Counter()
+    for ident in range(5000):
+        username, password = encode(ident).split(b":")
+        index, flag = encode.last
+        flags[flag] += 1
+        if flag == FLAG_UNKNOWN_USER:
+            assert index == -1 and username.startswith(b"unknown-")
+        else:
+            assert username == corpus[index][0]
+            expected = corpus[index][1]
+            assert password == (b"!" + expected if flag == FLAG_BAD_PASSWORD else expected)
+    assert flags[FLAG_BAD_PASSWORD] / 5000 == pytest.approx(0.2, abs=0.03)
+    assert flags[FLAG_UNKNOWN_USER] / 5000 == pytest.approx(0.1, abs=0.03)
+    corpus.close()
+    with pytest.raises(ValueError):
+        CorpusEncoder(corpus, _Template(), bad_password=0.7, unknown_user=0.5)
@@ -0,0 +1,82 @@
+"""Import-time budget for the radcli entry point (no RADIUS server needed).
+
+Health probes shell out to radcli every few seconds, so interpreter startup
+is on the hot path. These tests run radcli under ``python -X importtime``
+and check the summed import time of common invocations against a budget,
+and that commands which never send packets don't import the packet stack.
+
+The budgets are wall-clock numbers, so they are only checked when the
+suite runs serially; under pytest-xdist the workers compete for CPU and
+only the "module not imported" checks apply.
+"""
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Summed self-time of every import, best of a few runs (milliseconds).
+# Scale with RADCLI_IMPORT_BUDGET_SCALE on unusually slow machines.
+BUDGET_MS = {
+    ("--help",): 300,
+    ("profile", "list"): 250,
+    ("auth", "--help"): 400,
+    ("status", "--help"): 400,
+}
+
+# Only needed once a command actually talks RADIUS.
+HEAVY_MODULES = ("pyrad", "dotenv", "asyncio")
+
+# Commands scripts loop over; `radcli --output json|ndjson` must not load Rich for them.
+SCRIPTED_COMMANDS = ("auth", "authz", "acct", "status", "health")
+
+_RUNS = 3
+
+
+def _import_times(args, cwd):
+    """Run radcli with ``args``; return {module: self-time in µs}."""
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "from radcli.main import app; app()", *args],
+        capture_output=True,
+        text=True,
+        cwd=cwd,
+    )
+    times = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if not fields[0].strip().isdigit():
+            continue  # header line
+        times[fields[2].strip()] = int(fields[0])
+    assert times, proc.stderr
+    return times
+
+
+@pytest.mark.parametrize("args", list(BUDGET_MS), ids=" ".join)
+def test_import_time_within_budget(args, tmp_path):
+    if os.environ.get("PYTEST_XDIST_WORKER"):
+        pytest.skip("import-time budgets need a serial run, not pytest-xdist")
+    scale = float(os.environ.get("RADCLI_IMPORT_BUDGET_SCALE", "1"))
+    best_ms = min(sum(_import_times(args, tmp_path).values()) for _ in range(_RUNS)) / 1000
+    assert best_ms <= BUDGET_MS[args] * scale, f"radcli {' '.join(args)}: imports took {best_ms:.0f} ms"
+
+
+@pytest.mark.parametrize("args", [("--help",), ("profile", "list")], ids=" ".join)
+def test_non_sending_commands_skip_packet_stack(args, tmp_path):
+    imported = _import_times(args, tmp_path)
+    heavy = sorted(m for m in imported if m.split(".")[0] in HEAVY_MODULES)
+    assert not heavy, f"radcli {' '.join(args)} imported {heavy}"
+
+
+def test_scripted_commands_import_without_rich(tmp_path):
+    modules = ", ".join(f"radcli.commands.{name}" for name in SCRIPTED_COMMANDS)
+    proc = subprocess.run(
+        [sys.executable, "-c", f"import sys, {modules}; print(sorted(m for m in sys.modules if m.startswith('rich')))"],
+        capture_output=True,
+        text=True,
+        cwd=tmp_path,
+    )
+    assert proc.returncode == 0, proc.stderr
+    assert proc.stdout.strip() == "[]", f"importing {modules} loaded {proc.stdout.strip()}"